@@ -0,0 +1,32 @@
+"""add_user_teams_unique_membership
+
+Revision ID: 3b9d2f61c4a8
+Revises: 954a672e611c
+Create Date: 2026-10-16 10:12:41.503218
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f61c4a8'
+down_revision: Union[str, None] = '954a672e611c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Keep a single row per (team_id, user_id) before adding the constraint
+    op.execute(
+        """
+        DELETE FROM user_teams a
+        USING user_teams b
+        WHERE a.team_id = b.team_id
+          AND a.user_id = b.user_id
+          AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint('uq_user_teams_team_user', 'user_teams', ['team_id', 'user_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_teams_team_user', 'user_teams', type_='unique')
@@ -0,0 +1,24 @@
+"""add_subscription_plan_timestamps
+
+Revision ID: 8f41c0d7a2e5
+Revises: 3b9d2f61c4a8
+Create Date: 2026-10-16 11:02:17.284950
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8f41c0d7a2e5'
+down_revision: Union[str, None] = '3b9d2f61c4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.add_column('subscription_plans', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.add_column('subscription_plans', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('subscription_plans', 'updated_at')
+    op.drop_column('subscription_plans', 'created_at')
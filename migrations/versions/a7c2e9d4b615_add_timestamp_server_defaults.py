@@ -0,0 +1,95 @@
+"""add_timestamp_server_defaults
+
+Revision ID: a7c2e9d4b615
+Revises: f4d9a2b61c38
+Create Date: 2026-10-16 14:31:07.218904
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e9d4b615'
+down_revision: Union[str, None] = 'f4d9a2b61c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table whose model uses TimestampMixin (shared, lead_to_order,
+# support_ticket and inventory models); subscription_plans already has the
+# defaults. Not every deployment has created all service tables yet, so
+# missing tables are skipped with IF EXISTS.
+TABLES = (
+    'accounts',
+    'batches',
+    'chart_of_accounts',
+    'contacts',
+    'customers',
+    'deals',
+    'delivery_note_items',
+    'delivery_notes',
+    'invoices',
+    'item_groups',
+    'item_prices',
+    'item_suppliers',
+    'items',
+    'journal_entries',
+    'landed_cost_items',
+    'landed_cost_purchase_receipts',
+    'landed_cost_taxes_and_charges',
+    'landed_cost_vouchers',
+    'leads',
+    'order_items',
+    'orders',
+    'organizations',
+    'payments',
+    'pick_list_items',
+    'pick_lists',
+    'product_categories',
+    'products',
+    'purchase_orders',
+    'purchase_receipt_items',
+    'purchase_receipts',
+    'put_away_rules',
+    'quality_inspection_parameters',
+    'quality_inspection_readings',
+    'quality_inspection_templates',
+    'quality_inspections',
+    'quote_items',
+    'quotes',
+    'sales_orders',
+    'serial_no_history',
+    'serial_nos',
+    'stock_entries',
+    'stock_entry_items',
+    'stock_ledger_entries',
+    'stock_levels',
+    'stock_movements',
+    'stock_reconciliation_items',
+    'stock_reconciliations',
+    'stock_settings',
+    'suppliers',
+    'teams',
+    'ticket_comments',
+    'tickets',
+    'user_teams',
+    'users',
+    'warehouses',
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE IF EXISTS {table} '
+            f'ALTER COLUMN created_at SET DEFAULT now(), '
+            f'ALTER COLUMN updated_at SET DEFAULT now()'
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE IF EXISTS {table} '
+            f'ALTER COLUMN updated_at DROP DEFAULT, '
+            f'ALTER COLUMN created_at DROP DEFAULT'
+        )
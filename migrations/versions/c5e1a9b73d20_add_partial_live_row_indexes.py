@@ -0,0 +1,36 @@
+"""add_partial_live_row_indexes
+
+Revision ID: c5e1a9b73d20
+Revises: 8f41c0d7a2e5
+Create Date: 2026-10-16 12:05:31.118402
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a9b73d20'
+down_revision: Union[str, None] = '8f41c0d7a2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Services almost always filter on live rows; index only those
+    op.create_index(
+        'ix_teams_org_live', 'teams', ['organization_id'],
+        postgresql_where=sa.text('deleted_at IS NULL AND is_active')
+    )
+    op.create_index(
+        'ix_users_org_active', 'users', ['organization_id'],
+        postgresql_where=sa.text('is_active')
+    )
+    op.create_index(
+        'ix_user_teams_team_active', 'user_teams', ['team_id'],
+        postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_teams_team_active', table_name='user_teams')
+    op.drop_index('ix_users_org_active', table_name='users')
+    op.drop_index('ix_teams_org_live', table_name='teams')
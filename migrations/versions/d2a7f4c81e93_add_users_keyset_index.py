@@ -0,0 +1,26 @@
+"""add_users_keyset_index
+
+Revision ID: d2a7f4c81e93
+Revises: c5e1a9b73d20
+Create Date: 2026-10-16 12:41:08.527316
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7f4c81e93'
+down_revision: Union[str, None] = 'c5e1a9b73d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Serves user listing ordered by (created_at, id) within an organization,
+    # scanned backwards for the newest-first order and keyset cursors
+    op.create_index(
+        'ix_users_org_created_id', 'users', ['organization_id', 'created_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_org_created_id', table_name='users')
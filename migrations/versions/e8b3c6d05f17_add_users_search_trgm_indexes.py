@@ -0,0 +1,35 @@
+"""add_users_search_trgm_indexes
+
+Revision ID: e8b3c6d05f17
+Revises: d2a7f4c81e93
+Create Date: 2026-10-16 13:18:44.902157
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c6d05f17'
+down_revision: Union[str, None] = 'd2a7f4c81e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name')
+
+
+def upgrade() -> None:
+    # The user search ORs ILIKE '%term%' over these columns. A leading
+    # wildcard can't use a btree, but each predicate can use a trigram
+    # index and Postgres combines them with a BitmapOr.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_users_{column}_trgm', 'users', [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_users_{column}_trgm', table_name='users')
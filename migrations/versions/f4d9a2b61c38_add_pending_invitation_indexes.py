@@ -0,0 +1,31 @@
+"""add_pending_invitation_indexes
+
+Revision ID: f4d9a2b61c38
+Revises: e8b3c6d05f17
+Create Date: 2026-10-16 13:52:19.640731
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4d9a2b61c38'
+down_revision: Union[str, None] = 'e8b3c6d05f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Accepted/expired/revoked invitations accumulate; lookups never want them
+    op.create_index(
+        'ix_invitations_pending_org_email', 'invitations', ['organization_id', 'email'],
+        postgresql_where=sa.text("status = 'pending'")
+    )
+    op.create_index(
+        'ix_invitations_pending_expires', 'invitations', ['expires_at'],
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_invitations_pending_expires', table_name='invitations')
+    op.drop_index('ix_invitations_pending_org_email', table_name='invitations')
@@ -2,6 +2,7 @@
 import asyncio
 from decimal import Decimal
 from shared.database import AsyncSessionLocal
+from services.user_management.services.subscription_service import SubscriptionService
 from shared.models.subscription import SubscriptionPlan, PlanType
 
 PLANS = [
@@ -27,6 +28,7 @@ async def seed_plans():
                 plan = SubscriptionPlan(**plan_data)
                 session.add(plan)
         await session.commit()
+        await SubscriptionService.invalidate_plans_cache()
         print(f"Seeded {len(PLANS)} subscription plans")
 
 if __name__ == "__main__":
@@ -72,7 +72,7 @@ async def register(
         organization_name=register_data.organization_name
     )
     
-    await db.commit()
+    await db.flush()
     
     return RegisterResponse(
         user_id=user.id,
@@ -299,8 +299,6 @@ async def refresh_token(
         expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     
-    await db.commit()
-    
     return RefreshResponse(
         access_token=new_access_token,
         refresh_token=new_refresh_token,
@@ -333,8 +331,6 @@ async def logout(
     else:
         message = "Logged out successfully"
     
-    await db.commit()
-    
     return SuccessResponse(message=message)
 
 
@@ -367,8 +363,6 @@ async def forgot_password(
             user_agent=request.headers.get("user-agent")
         )
         
-        await db.commit()
-        
         # TODO: Send email with reset link
         # The reset link should be: {frontend_url}/reset-password?token={token}
     
@@ -414,8 +408,6 @@ async def reset_password(
     # Revoke all refresh tokens (force re-login)
     await auth_service.revoke_all_user_tokens(user.id)
     
-    await db.commit()
-    
     return SuccessResponse(message="Password reset successfully. Please login with your new password.")
 
 
@@ -454,6 +446,4 @@ async def verify_email(
     
     verification.verified_at = datetime.utcnow()
     
-    await db.commit()
-    
     return SuccessResponse(message="Email verified successfully")
@@ -90,8 +90,6 @@ async def enable_mfa(
     user.mfa_secret = secret
     user.mfa_backup_codes = backup_codes
     
-    await db.commit()
-    
     return MFAEnableResponse(
         secret=secret,
         qr_code_url=qr_code_url,
@@ -137,8 +135,6 @@ async def verify_mfa_setup(
     # Enable MFA
     user.mfa_enabled = True
     
-    await db.commit()
-    
     return SuccessResponse(message="MFA enabled successfully")
 
 
@@ -189,8 +185,6 @@ async def disable_mfa(
     user.mfa_secret = None
     user.mfa_backup_codes = None
     
-    await db.commit()
-    
     return SuccessResponse(message="MFA disabled successfully")
 
 
@@ -260,6 +254,4 @@ async def regenerate_backup_codes(
     backup_codes = [generate_random_password(8, include_special=False) for _ in range(10)]
     user.mfa_backup_codes = backup_codes
     
-    await db.commit()
-    
     return backup_codes
@@ -82,7 +82,6 @@ async def revoke_session(
     
     # Revoke the token
     token.revoke("user_revoked")
-    await db.commit()
     
     return SuccessResponse(message="Session revoked successfully")
 
@@ -107,6 +106,4 @@ async def revoke_all_sessions(
         except_token_id=current_token_jti
     )
     
-    await db.commit()
-    
     return SuccessResponse(message="All other sessions revoked successfully")
@@ -5,9 +5,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from shared.cache import close_redis
 from shared.config import settings
-from shared.database import init_db
-from shared.middleware.audit import AuditMiddleware
+from shared.database import close_db, init_db, warm_pool
+from shared.middleware.audit import AuditMiddleware, close_audit_buffers
 from services.auth.api.v1 import router as v1_router
 
 # Configure logging
@@ -21,12 +22,16 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Auth Service...")
     await init_db()
+    await warm_pool()
     logger.info("Auth Service started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Auth Service...")
+    await close_audit_buffers()
+    await close_redis()
+    await close_db()
 
 
 # Create FastAPI app
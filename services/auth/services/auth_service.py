@@ -4,16 +4,17 @@ from typing import List, Optional
 from uuid import UUID
 
 import pyotp
-from sqlalchemy import select, update, and_, or_
+from sqlalchemy import select, update, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from shared.cache import get_cached_role_permissions, set_cached_role_permissions
 from shared.models.user import User, UserOrganizationRole, UserStatus
 from shared.models.auth import RefreshToken, PasswordReset, EmailVerification
 from shared.models.role import Role, RolePermission, Permission, SystemRole
 from shared.models.organization import Organization, OrganizationStatus
 from shared.security.password import verify_password, hash_password
-from shared.utils.helpers import generate_slug
+from shared.utils.helpers import generate_slug, normalize_email
 from services.auth.config import auth_settings
 
 
@@ -54,7 +55,7 @@ class AuthService:
         # 2. Create User
         user = User(
             organization_id=organization.id,
-            email=email.lower(),
+            email=email,
             password_hash=hash_password(password),
             first_name=first_name,
             last_name=last_name,
@@ -89,7 +90,7 @@ class AuthService:
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
-        query = select(User).where(User.email == email.lower())
+        query = select(User).where(User.email == normalize_email(email))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
@@ -126,8 +127,8 @@ class AuthService:
     ) -> Optional[UserOrganizationRole]:
         """Get user's organization and role context."""
         query = select(UserOrganizationRole).options(
-            selectinload(UserOrganizationRole.user).selectinload(User.organization),
-            selectinload(UserOrganizationRole.role)
+            joinedload(UserOrganizationRole.user).joinedload(User.organization),
+            joinedload(UserOrganizationRole.role)
         ).join(User).where(
             UserOrganizationRole.user_id == user_id,
             User.is_active == True
@@ -140,7 +141,14 @@ class AuthService:
         return result.scalars().first()
     
     async def get_role_permissions(self, role_id: UUID) -> List[str]:
-        """Get permission codes for a role."""
+        """
+        Get permission codes for a role.
+        Cached in Redis; user management drops the entry when they change.
+        """
+        cached = await get_cached_role_permissions(role_id)
+        if cached is not None:
+            return cached
+        
         query = select(Permission.code).join(
             RolePermission,
             RolePermission.permission_id == Permission.id
@@ -149,7 +157,10 @@ class AuthService:
         )
         
         result = await self.db.execute(query)
-        return [row for row in result.scalars().all()]
+        permissions = list(result.scalars())
+        
+        await set_cached_role_permissions(role_id, permissions)
+        return permissions
     
     async def store_refresh_token(
         self,
@@ -215,7 +226,7 @@ class AuthService:
         count_query = select(RefreshToken).where(
             RefreshToken.user_id == user_id,
             RefreshToken.revoked_at.is_(None),
-            RefreshToken.expires_at > datetime.utcnow()
+            RefreshToken.expires_at > func.now()
         ).order_by(RefreshToken.created_at.desc())
         
         result = await self.db.execute(count_query)
@@ -282,7 +293,7 @@ class AuthService:
         query = select(RefreshToken).where(
             RefreshToken.user_id == user_id,
             RefreshToken.revoked_at.is_(None),
-            RefreshToken.expires_at > datetime.utcnow()
+            RefreshToken.expires_at > func.now()
         ).order_by(RefreshToken.last_used_at.desc().nullsfirst())
         
         result = await self.db.execute(query)
@@ -342,7 +353,7 @@ class AuthService:
         # We need to check all tokens since we stored hashes
         query = select(PasswordReset).where(
             PasswordReset.used_at.is_(None),
-            PasswordReset.expires_at > datetime.utcnow()
+            PasswordReset.expires_at > func.now()
         )
         
         result = await self.db.execute(query)
@@ -358,7 +369,7 @@ class AuthService:
         """Find a valid email verification by token."""
         query = select(EmailVerification).where(
             EmailVerification.verified_at.is_(None),
-            EmailVerification.expires_at > datetime.utcnow()
+            EmailVerification.expires_at > func.now()
         )
         
         result = await self.db.execute(query)
@@ -315,7 +315,7 @@ async def create_batch(
     )
     
     db.add(batch)
-    await db.commit()
+    await db.flush()
     await db.refresh(batch)
     
     return BatchResponse.model_validate(batch)
@@ -343,7 +343,7 @@ async def update_batch(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(batch, key, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(batch)
     
     return BatchResponse.model_validate(batch)
@@ -423,7 +423,7 @@ async def create_serial_number(
     )
     
     db.add(serial)
-    await db.commit()
+    await db.flush()
     await db.refresh(serial)
     
     return SerialNoResponse.model_validate(serial)
@@ -451,7 +451,7 @@ async def update_serial_number(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(serial, key, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(serial)
     
     return SerialNoResponse.model_validate(serial)
@@ -515,7 +515,7 @@ async def create_quality_inspection_template(
         )
         db.add(param)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(template)
     
     # Fetch parameters for response
@@ -607,7 +607,7 @@ async def create_quality_inspection(
         )
         db.add(reading)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(inspection)
     
     # Fetch readings for response
@@ -647,7 +647,7 @@ async def update_quality_inspection(
     
     inspection.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(inspection)
     
     return QualityInspectionResponse.model_validate(inspection)
@@ -337,7 +337,7 @@ async def create_delivery_note(
         )
         db.add(item)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(delivery_note)
     
     # Fetch items for response
@@ -408,7 +408,7 @@ async def update_delivery_note(
     
     delivery_note.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(delivery_note)
     
     return DeliveryNoteResponse.model_validate(delivery_note)
@@ -504,7 +504,7 @@ async def create_purchase_receipt(
         )
         db.add(item)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(receipt)
     
     # Fetch items for response
@@ -575,7 +575,7 @@ async def update_purchase_receipt(
     
     receipt.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(receipt)
     
     return PurchaseReceiptResponse.model_validate(receipt)
@@ -646,7 +646,7 @@ async def create_landed_cost_voucher(
     
     # TODO: Distribute charges to items based on distribute_charges_based_on
     
-    await db.commit()
+    await db.flush()
     await db.refresh(voucher)
     
     return LandedCostVoucherResponse.model_validate(voucher)
@@ -240,7 +240,7 @@ async def create_item_group(
     )
     
     db.add(group)
-    await db.commit()
+    await db.flush()
     await db.refresh(group)
     
     return ItemGroupResponse.model_validate(group)
@@ -293,7 +293,7 @@ async def update_item_group(
     
     group.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(group)
     
     return ItemGroupResponse.model_validate(group)
@@ -318,7 +318,6 @@ async def delete_item_group(
         raise HTTPException(status_code=404, detail="Item group not found")
     
     group.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Item group deleted successfully")
 
@@ -428,7 +427,7 @@ async def create_item(
     )
     
     db.add(item)
-    await db.commit()
+    await db.flush()
     await db.refresh(item)
     
     return ItemResponse.model_validate(item)
@@ -493,7 +492,7 @@ async def update_item(
     
     item.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(item)
     
     return ItemResponse.model_validate(item)
@@ -518,6 +517,5 @@ async def delete_item(
         raise HTTPException(status_code=404, detail="Item not found")
     
     item.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Item deleted successfully")
@@ -84,7 +84,7 @@ async def create_product(data: ProductCreate, current_user: TokenPayload = Depen
     if existing: raise HTTPException(status_code=409, detail="SKU already exists")
     product = Product(organization_id=tenant_id, created_by=UUID(current_user.sub), **data.model_dump(exclude_unset=True))
     db.add(product)
-    await db.commit()
+    await db.flush()
     await db.refresh(product)
     return ProductResponse.model_validate(product)
 
@@ -102,7 +102,7 @@ async def update_product(product_id: UUID, data: ProductUpdate, current_user: To
     if not product: raise HTTPException(status_code=404, detail="Product not found")
     for k, v in data.model_dump(exclude_unset=True).items(): setattr(product, k, v)
     product.updated_by = UUID(current_user.sub)
-    await db.commit()
+    await db.flush()
     await db.refresh(product)
     return ProductResponse.model_validate(product)
 
@@ -112,5 +112,4 @@ async def delete_product(product_id: UUID, current_user: TokenPayload = Depends(
     product = (await db.execute(select(Product).where(Product.id == product_id, Product.organization_id == tenant_id))).scalar_one_or_none()
     if not product: raise HTTPException(status_code=404, detail="Product not found")
     product.deleted_at = datetime.utcnow()
-    await db.commit()
     return SuccessResponse(message="Product deleted")
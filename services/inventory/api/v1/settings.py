@@ -105,7 +105,7 @@ async def get_stock_settings(
             created_by=UUID(current_user.sub)
         )
         db.add(settings)
-        await db.commit()
+        await db.flush()
         await db.refresh(settings)
     
     return StockSettingsResponse.model_validate(settings)
@@ -136,7 +136,7 @@ async def create_stock_settings(
     )
     
     db.add(settings)
-    await db.commit()
+    await db.flush()
     await db.refresh(settings)
     
     return StockSettingsResponse.model_validate(settings)
@@ -164,7 +164,7 @@ async def update_stock_settings(
     
     settings.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(settings)
     
     return StockSettingsResponse.model_validate(settings)
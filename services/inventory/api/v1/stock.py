@@ -58,7 +58,6 @@ async def adjust_stock(data: StockAdjustment, current_user: TokenPayload = Depen
         movement_type=data.movement_type, quantity=data.quantity, notes=data.notes, performed_by=UUID(current_user.sub))
     db.add(movement)
     
-    await db.commit()
     return SuccessResponse(message="Stock adjusted successfully")
 
 @router.get("/movements/{product_id}")
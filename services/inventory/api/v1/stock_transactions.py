@@ -293,7 +293,7 @@ async def create_stock_entry(
         db.add(item)
         items.append(item)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(entry)
     
     # Fetch items for response
@@ -370,7 +370,7 @@ async def update_stock_entry(
     
     entry.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(entry)
     
     return StockEntryResponse.model_validate(entry)
@@ -469,7 +469,7 @@ async def create_stock_reconciliation(
         db.add(item)
         items.append(item)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(reconciliation)
     
     # Fetch items for response
@@ -548,7 +548,7 @@ async def update_stock_reconciliation(
     
     reconciliation.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(reconciliation)
     
     return StockReconciliationResponse.model_validate(reconciliation)
@@ -303,7 +303,7 @@ async def create_warehouse(
     )
     
     db.add(warehouse)
-    await db.commit()
+    await db.flush()
     await db.refresh(warehouse)
     
     return WarehouseResponse.model_validate(warehouse)
@@ -356,7 +356,7 @@ async def update_warehouse(
     
     warehouse.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(warehouse)
     
     return WarehouseResponse.model_validate(warehouse)
@@ -381,7 +381,6 @@ async def delete_warehouse(
         raise HTTPException(status_code=404, detail="Warehouse not found")
     
     warehouse.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Warehouse deleted successfully")
 
@@ -441,7 +440,7 @@ async def create_put_away_rule(
     )
     
     db.add(rule)
-    await db.commit()
+    await db.flush()
     await db.refresh(rule)
     
     return PutAwayRuleResponse.model_validate(rule)
@@ -471,7 +470,7 @@ async def update_put_away_rule(
     
     rule.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(rule)
     
     return PutAwayRuleResponse.model_validate(rule)
@@ -555,7 +554,7 @@ async def create_pick_list(
         db.add(item)
         items.append(item)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(pick_list)
     
     # Fetch items for response
@@ -626,7 +625,7 @@ async def update_pick_list(
     
     pick_list.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(pick_list)
     
     return PickListResponse.model_validate(pick_list)
@@ -656,7 +655,7 @@ async def update_pick_list_item(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(item, key, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(item)
     
     return PickListItemResponse.model_validate(item)
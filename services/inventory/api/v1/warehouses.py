@@ -54,7 +54,7 @@ async def create_warehouse(data: WarehouseCreate, current_user: TokenPayload = D
     tenant_id: UUID = Depends(require_tenant), db: AsyncSession = Depends(get_async_session)):
     warehouse = Warehouse(organization_id=tenant_id, **data.model_dump(exclude_unset=True))
     db.add(warehouse)
-    await db.commit()
+    await db.flush()
     await db.refresh(warehouse)
     return WarehouseResponse.model_validate(warehouse)
 
@@ -71,5 +71,4 @@ async def delete_warehouse(warehouse_id: UUID, current_user: TokenPayload = Depe
     warehouse = (await db.execute(select(Warehouse).where(Warehouse.id == warehouse_id, Warehouse.organization_id == tenant_id))).scalar_one_or_none()
     if not warehouse: raise HTTPException(status_code=404, detail="Warehouse not found")
     warehouse.deleted_at = datetime.utcnow()
-    await db.commit()
     return SuccessResponse(message="Warehouse deleted")
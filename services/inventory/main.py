@@ -5,8 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from shared.config import settings
 from shared.database import init_db
-from shared.middleware.tenant import TenantMiddleware
-from shared.middleware.auth import AuthMiddleware
+from shared.middleware.combined import CombinedContextMiddleware
 from services.inventory.api.v1 import router as v1_router
 
 logging.basicConfig(level=settings.LOG_LEVEL)
@@ -21,8 +20,7 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="Horizon Sync ERP - Inventory Service", version="1.0.0", lifespan=lifespan)
 app.add_middleware(CORSMiddleware, allow_origins=settings.CORS_ORIGINS, allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
-app.add_middleware(TenantMiddleware)
-app.add_middleware(AuthMiddleware)
+app.add_middleware(CombinedContextMiddleware, audit=False)
 app.include_router(v1_router, prefix="/api/v1")
 
 @app.get("/health")
@@ -136,7 +136,7 @@ async def create_contact(
     )
     
     db.add(contact)
-    await db.commit()
+    await db.flush()
     await db.refresh(contact)
     
     return ContactResponse.model_validate(contact)
@@ -191,7 +191,7 @@ async def update_contact(
     
     contact.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(contact)
     
     return ContactResponse.model_validate(contact)
@@ -218,6 +218,5 @@ async def delete_contact(
         raise HTTPException(status_code=404, detail="Contact not found")
     
     contact.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Contact deleted successfully")
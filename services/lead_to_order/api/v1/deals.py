@@ -163,7 +163,7 @@ async def create_deal(
         deal.expected_revenue = deal.amount * (deal.probability / 100)
     
     db.add(deal)
-    await db.commit()
+    await db.flush()
     await db.refresh(deal)
     
     return DealResponse.model_validate(deal)
@@ -222,7 +222,7 @@ async def update_deal(
     
     deal.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(deal)
     
     return DealResponse.model_validate(deal)
@@ -270,7 +270,7 @@ async def update_deal_stage(
     
     deal.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(deal)
     
     return DealResponse.model_validate(deal)
@@ -297,6 +297,5 @@ async def delete_deal(
         raise HTTPException(status_code=404, detail="Deal not found")
     
     deal.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Deal deleted successfully")
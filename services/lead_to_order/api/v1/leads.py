@@ -169,7 +169,7 @@ async def create_lead(
     )
     
     db.add(lead)
-    await db.commit()
+    await db.flush()
     await db.refresh(lead)
     
     return LeadResponse.model_validate(lead)
@@ -225,7 +225,7 @@ async def update_lead(
     
     lead.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(lead)
     
     return LeadResponse.model_validate(lead)
@@ -252,7 +252,6 @@ async def delete_lead(
         raise HTTPException(status_code=404, detail="Lead not found")
     
     lead.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Lead deleted successfully")
 
@@ -329,8 +328,6 @@ async def convert_lead(
     lead.converted_to_contact_id = contact_id
     lead.converted_to_deal_id = deal_id
     
-    await db.commit()
-    
     return {
         "message": "Lead converted successfully",
         "contact_id": str(contact_id) if contact_id else None,
@@ -213,7 +213,7 @@ async def create_order(
     
     order.calculate_totals()
     
-    await db.commit()
+    await db.flush()
     await db.refresh(order)
     
     return OrderResponse.model_validate(order)
@@ -281,7 +281,7 @@ async def update_order_status(
     
     order.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(order)
     
     return OrderResponse.model_validate(order)
@@ -324,7 +324,7 @@ async def record_payment(
     
     order.updated_by = UUID(current_user.sub)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(order)
     
     return OrderResponse.model_validate(order)
@@ -351,6 +351,5 @@ async def delete_order(
         raise HTTPException(status_code=404, detail="Order not found")
     
     order.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Order deleted successfully")
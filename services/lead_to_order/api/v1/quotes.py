@@ -189,7 +189,7 @@ async def create_quote(
     
     quote.calculate_totals()
     
-    await db.commit()
+    await db.flush()
     await db.refresh(quote)
     
     return QuoteResponse.model_validate(quote)
@@ -241,8 +241,6 @@ async def send_quote(
     quote.status = QuoteStatus.SENT
     quote.sent_at = datetime.utcnow()
     
-    await db.commit()
-    
     # TODO: Send email to customer
     
     return SuccessResponse(message="Quote sent successfully")
@@ -271,8 +269,6 @@ async def accept_quote(
     quote.status = QuoteStatus.ACCEPTED
     quote.accepted_at = datetime.utcnow()
     
-    await db.commit()
-    
     return SuccessResponse(message="Quote accepted")
 
 
@@ -297,6 +293,5 @@ async def delete_quote(
         raise HTTPException(status_code=404, detail="Quote not found")
     
     quote.deleted_at = datetime.utcnow()
-    await db.commit()
     
     return SuccessResponse(message="Quote deleted successfully")
@@ -7,9 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from shared.config import settings
 from shared.database import init_db
-from shared.middleware.tenant import TenantMiddleware
-from shared.middleware.auth import AuthMiddleware
-from shared.middleware.audit import AuditMiddleware
+from shared.middleware.audit import close_audit_buffers
+from shared.middleware.combined import CombinedContextMiddleware
 from services.lead_to_order.api.v1 import router as v1_router
 
 # Configure logging
@@ -27,6 +26,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Lead-to-Order Service...")
+    await close_audit_buffers()
 
 
 app = FastAPI(
@@ -45,9 +45,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(AuditMiddleware)
-app.add_middleware(TenantMiddleware)
-app.add_middleware(AuthMiddleware)
+# Auth, tenant context and audit in one layer; the JWT is decoded once
+app.add_middleware(CombinedContextMiddleware)
 
 app.include_router(v1_router, prefix="/api/v1")
 
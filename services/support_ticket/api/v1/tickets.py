@@ -98,7 +98,7 @@ async def create_ticket(
     ticket = Ticket(organization_id=tenant_id, ticket_number=generate_reference_number("TKT"),
                     created_by=UUID(current_user.sub), **data.model_dump(exclude_unset=True))
     db.add(ticket)
-    await db.commit()
+    await db.flush()
     await db.refresh(ticket)
     return TicketResponse.model_validate(ticket)
 
@@ -118,7 +118,7 @@ async def update_ticket(ticket_id: UUID, data: TicketUpdate, current_user: Token
     if data.status == TicketStatus.RESOLVED and not ticket.resolved_at: ticket.resolved_at = datetime.utcnow()
     if data.status == TicketStatus.CLOSED and not ticket.closed_at: ticket.closed_at = datetime.utcnow()
     ticket.updated_by = UUID(current_user.sub)
-    await db.commit()
+    await db.flush()
     await db.refresh(ticket)
     return TicketResponse.model_validate(ticket)
 
@@ -131,7 +131,7 @@ async def add_comment(ticket_id: UUID, data: CommentCreate, current_user: TokenP
     if not ticket.first_response_at: ticket.first_response_at = datetime.utcnow()
     if data.is_resolution: ticket.status = TicketStatus.RESOLVED; ticket.resolved_at = datetime.utcnow(); ticket.resolution_notes = data.content
     db.add(comment)
-    await db.commit()
+    await db.flush()
     return {"id": str(comment.id), "message": "Comment added"}
 
 @router.delete("/{ticket_id}", response_model=SuccessResponse)
@@ -140,5 +140,4 @@ async def delete_ticket(ticket_id: UUID, current_user: TokenPayload = Depends(re
     ticket = (await db.execute(select(Ticket).where(Ticket.id == ticket_id, Ticket.organization_id == tenant_id))).scalar_one_or_none()
     if not ticket: raise HTTPException(status_code=404, detail="Ticket not found")
     ticket.deleted_at = datetime.utcnow()
-    await db.commit()
     return SuccessResponse(message="Ticket deleted")
@@ -4,20 +4,17 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
 
-from shared.database import get_async_session
-from shared.middleware.auth import get_current_user, require_permissions
-from shared.middleware.tenant import require_tenant
+from shared.middleware.context import RequestContext, request_context_with_permissions
 from shared.models.audit import AuditLog, AuditAction
 from shared.schemas.common import PaginatedResponse, PaginationParams
-from shared.security.jwt import TokenPayload
 from services.user_management.services.audit_service import AuditService
 
 router = APIRouter()
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def list_audit_logs(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
@@ -27,15 +24,13 @@ async def list_audit_logs(
     resource_id: Optional[UUID] = Query(None, description="Filter by resource ID"),
     start_date: Optional[datetime] = Query(None, description="Filter from date"),
     end_date: Optional[datetime] = Query(None, description="Filter to date"),
-    current_user: TokenPayload = Depends(require_permissions("audit_log:read")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("audit_log:read"))
 ):
     """List audit logs for the organization."""
-    audit_service = AuditService(db)
+    audit_service = AuditService(ctx.db)
     
     result = await audit_service.list_audit_logs(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         page=page,
         page_size=page_size,
         user_id=user_id,
@@ -46,50 +41,46 @@ async def list_audit_logs(
         end_date=end_date,
     )
     
-    return result
+    return ORJSONResponse(result)
 
 
-@router.get("/entity/{entity_type}/{entity_id}")
+@router.get("/entity/{entity_type}/{entity_id}", response_model=None)
 async def get_entity_audit_logs(
     entity_type: str,
     entity_id: UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: TokenPayload = Depends(require_permissions("audit_log:read")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("audit_log:read"))
 ):
     """Get audit logs for a specific entity."""
-    audit_service = AuditService(db)
+    audit_service = AuditService(ctx.db)
     
     result = await audit_service.list_audit_logs(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         page=page,
         page_size=page_size,
         resource_type=entity_type,
         resource_id=entity_id,
     )
     
-    return result
+    return ORJSONResponse(result)
 
 
-@router.get("/user/{user_id}")
+@router.get("/user/{user_id}", response_model=None)
 async def get_user_audit_logs(
     user_id: UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: TokenPayload = Depends(require_permissions("audit_log:read")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("audit_log:read"))
 ):
     """Get audit logs for a specific user."""
-    audit_service = AuditService(db)
+    audit_service = AuditService(ctx.db)
     
     result = await audit_service.list_audit_logs(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         page=page,
         page_size=page_size,
         user_id=user_id,
     )
     
-    return result
+    return ORJSONResponse(result)
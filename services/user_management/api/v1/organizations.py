@@ -133,7 +133,7 @@ async def onboard_organization(
         token_family=str(uuid4()),
     )
     
-    await db.commit()
+    await db.flush()
     
     return OrganizationOnboardResponse(
         organization=OrganizationResponse.model_validate(organization),
@@ -191,7 +191,7 @@ async def update_organization(
         organization, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    await db.flush()
     
     return OrganizationResponse.model_validate(organization)
 
@@ -224,8 +224,6 @@ async def delete_organization(
     organization.status = OrganizationStatus.INACTIVE
     organization.is_active = False
     
-    await db.commit()
-    
     return SuccessResponse(message="Organization deleted successfully")
 
 
@@ -269,6 +267,4 @@ async def update_organization_settings(
         org_id, settings_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
-    
     return SuccessResponse(message="Settings updated successfully")
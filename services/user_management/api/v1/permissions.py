@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from shared.database import get_async_session
 from shared.middleware.auth import get_current_user
 from shared.models.role import Permission, ResourceType, ActionType
+from shared.responses import PydanticResponse
 from shared.schemas.role import PermissionResponse, PermissionGroupResponse
 from shared.security.jwt import TokenPayload
 from services.user_management.services.permission_service import PermissionService
@@ -15,36 +16,34 @@ from services.user_management.services.permission_service import PermissionServi
 router = APIRouter()
 
 
-@router.get("", response_model=List[PermissionResponse])
+@router.get("", response_model=None, responses={200: {"model": List[PermissionResponse]}})
 async def list_permissions(
     resource: Optional[ResourceType] = Query(None, description="Filter by resource type"),
-    module: Optional[str] = Query(None, description="Filter by module"),
     current_user: TokenPayload = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session)
 ):
     """List all available permissions."""
     permission_service = PermissionService(db)
     
-    permissions = await permission_service.list_permissions(
-        resource=resource,
-        module=module,
-    )
+    permissions = await permission_service.list_permissions(resource=resource)
     
-    return [PermissionResponse.model_validate(p) for p in permissions]
+    # Rows come straight from the DB, so skip re-validation
+    return PydanticResponse(
+        [PermissionResponse.model_construct(**p) for p in permissions]
+    )
 
 
-@router.get("/grouped", response_model=List[PermissionGroupResponse])
+@router.get("/grouped", response_model=None, responses={200: {"model": List[PermissionGroupResponse]}})
 async def list_permissions_grouped(
-    group_by: str = Query("resource", pattern="^(resource|module)$"),
     current_user: TokenPayload = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session)
 ):
-    """List permissions grouped by resource or module."""
+    """List permissions grouped by resource."""
     permission_service = PermissionService(db)
     
-    grouped = await permission_service.list_permissions_grouped(group_by)
+    grouped = await permission_service.list_permissions_grouped()
     
-    return grouped
+    return PydanticResponse(grouped)
 
 
 @router.get("/resources", response_model=List[str])
@@ -3,11 +3,14 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.database import get_async_session
-from shared.middleware.auth import get_current_user, require_permissions
-from shared.middleware.tenant import require_tenant
+from shared.cache import invalidate_role_permissions
+from shared.database import after_commit
+from shared.middleware.context import (
+    RequestContext,
+    request_context,
+    request_context_with_permissions,
+)
 from shared.models.role import Role
 from shared.schemas.role import (
     RoleCreate,
@@ -15,11 +18,11 @@ from shared.schemas.role import (
     RoleResponse,
     RoleDetailResponse,
     RolePermissionUpdate,
+    PermissionResponse,
     RoleListFilter,
     SYSTEM_ROLES,
 )
 from shared.schemas.common import SuccessResponse, PaginatedResponse
-from shared.security.jwt import TokenPayload
 from services.user_management.services.role_service import RoleService
 
 router = APIRouter()
@@ -29,20 +32,31 @@ router = APIRouter()
 async def list_roles(
     include_system: bool = Query(True, description="Include system roles"),
     is_active: Optional[bool] = Query(None),
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    include_permissions: bool = Query(False, description="Include each role's permissions"),
+    ctx: RequestContext = Depends(request_context)
 ):
     """List all roles for the organization."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
     roles = await role_service.list_roles(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         include_system=include_system,
         is_active=is_active,
+        with_permissions=include_permissions,
     )
     
-    return [RoleResponse.model_validate(role) for role in roles]
+    responses = []
+    for role in roles:
+        response = RoleResponse.model_validate(role)
+        if include_permissions:
+            response.permissions = [
+                PermissionResponse.model_validate(rp.permission)
+                for rp in role.role_permissions
+            ]
+            response.permission_count = len(response.permissions)
+        responses.append(response)
+    
+    return responses
 
 
 @router.get("/system", response_model=List[dict])
@@ -54,15 +68,13 @@ async def list_system_roles():
 @router.post("", response_model=RoleResponse)
 async def create_role(
     role_data: RoleCreate,
-    current_user: TokenPayload = Depends(require_permissions("role:create")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("role:create"))
 ):
     """Create a new custom role."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
     # Check if code already exists
-    existing = await role_service.get_role_by_code(tenant_id, role_data.code)
+    existing = await role_service.get_role_by_code(ctx.tenant_id, role_data.code)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -71,7 +83,7 @@ async def create_role(
     
     # Create role
     role = await role_service.create_role(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         name=role_data.name,
         code=role_data.code,
         description=role_data.description,
@@ -83,7 +95,7 @@ async def create_role(
     if role_data.permission_ids:
         await role_service.set_role_permissions(role.id, role_data.permission_ids)
     
-    await db.commit()
+    await ctx.db.flush()
     
     return RoleResponse.model_validate(role)
 
@@ -91,41 +103,35 @@ async def create_role(
 @router.get("/{role_id}", response_model=RoleDetailResponse)
 async def get_role(
     role_id: UUID,
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get role details with permissions."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
-    role = await role_service.get_role_with_permissions(role_id, tenant_id)
+    role, permissions, user_count = await role_service.get_role_detail(role_id, ctx.tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Role not found"
         )
     
-    # Get user count
-    user_count = await role_service.get_role_user_count(role_id, tenant_id)
-    
-    response = RoleDetailResponse.model_validate(role)
-    response.user_count = user_count
-    
-    return response
+    return RoleDetailResponse(
+        **RoleResponse.model_validate(role).model_dump(exclude={"permissions"}),
+        permissions=permissions,
+        user_count=user_count,
+    )
 
 
 @router.patch("/{role_id}", response_model=RoleResponse)
 async def update_role(
     role_id: UUID,
     update_data: RoleUpdate,
-    current_user: TokenPayload = Depends(require_permissions("role:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("role:update"))
 ):
     """Update a role."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
-    role = await role_service.get_role(role_id, tenant_id)
+    role = await role_service.get_role(role_id, ctx.tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,7 +150,7 @@ async def update_role(
         role, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    await ctx.db.flush()
     
     return RoleResponse.model_validate(updated_role)
 
@@ -152,14 +158,12 @@ async def update_role(
 @router.delete("/{role_id}", response_model=SuccessResponse)
 async def delete_role(
     role_id: UUID,
-    current_user: TokenPayload = Depends(require_permissions("role:delete")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("role:delete"))
 ):
     """Delete a custom role."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
-    role = await role_service.get_role(role_id, tenant_id)
+    role, user_count = await role_service.get_role_and_user_count(role_id, ctx.tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -174,7 +178,6 @@ async def delete_role(
         )
     
     # Check if role has users
-    user_count = await role_service.get_role_user_count(role_id, tenant_id)
     if user_count > 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -184,7 +187,7 @@ async def delete_role(
     # Delete role
     await role_service.delete_role(role)
     
-    await db.commit()
+    after_commit(ctx.db, invalidate_role_permissions, role_id)
     
     return SuccessResponse(message="Role deleted successfully")
 
@@ -193,14 +196,12 @@ async def delete_role(
 async def update_role_permissions(
     role_id: UUID,
     permissions_data: RolePermissionUpdate,
-    current_user: TokenPayload = Depends(require_permissions("role:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("role:update"))
 ):
     """Update permissions for a role."""
-    role_service = RoleService(db)
+    role_service = RoleService(ctx.db)
     
-    role = await role_service.get_role(role_id, tenant_id)
+    role = await role_service.get_role(role_id, ctx.tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -217,6 +218,6 @@ async def update_role_permissions(
     # Update permissions
     await role_service.set_role_permissions(role_id, permissions_data.permission_ids)
     
-    await db.commit()
+    after_commit(ctx.db, invalidate_role_permissions, role_id)
     
     return SuccessResponse(message="Role permissions updated successfully")
@@ -1,20 +1,28 @@
 """Subscription management endpoints."""
 from typing import List
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.database import get_async_session
-from shared.middleware.auth import get_current_user, require_permissions
-from shared.middleware.tenant import require_tenant
+from shared.cache import get_cached_bytes, set_cached_bytes
+from shared.database import after_commit, get_async_session
+from shared.middleware.context import (
+    RequestContext,
+    request_context,
+    request_context_with_permissions,
+)
 from shared.models.subscription import SubscriptionPlan, Subscription, SubscriptionStatus
 from shared.schemas.organization import SubscriptionUpdateRequest
+from shared.responses import REVALIDATE, with_etag
 from shared.schemas.common import SuccessResponse
-from shared.security.jwt import TokenPayload
-from services.user_management.services.subscription_service import SubscriptionService
+from services.user_management.services.subscription_service import (
+    PLANS_CACHE_KEY,
+    PLANS_CACHE_TTL,
+    SubscriptionService,
+)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class SubscriptionPlanResponse:
@@ -22,126 +30,90 @@ class SubscriptionPlanResponse:
     pass
 
 
-@router.get("/plans")
+@router.get("/plans", response_model=None)
 async def list_subscription_plans(
+    request: Request,
     db: AsyncSession = Depends(get_async_session)
 ):
     """List all available subscription plans."""
+    cached = await get_cached_bytes(PLANS_CACHE_KEY)
+    if cached is not None:
+        return with_etag(request, Response(content=cached, media_type="application/json"))
+    
     subscription_service = SubscriptionService(db)
     
-    plans = await subscription_service.list_plans()
-    
-    return [
-        {
-            "id": str(plan.id),
-            "name": plan.name,
-            "code": plan.code,
-            "description": plan.description,
-            "plan_type": plan.plan_type.value,
-            "price_monthly": float(plan.price_monthly) if plan.price_monthly else None,
-            "price_yearly": float(plan.price_yearly) if plan.price_yearly else None,
-            "currency": plan.currency,
-            "max_users": plan.max_users,
-            "max_teams": plan.max_teams,
-            "max_leads": plan.max_leads,
-            "max_contacts": plan.max_contacts,
-            "max_deals": plan.max_deals,
-            "max_tickets": plan.max_tickets,
-            "max_products": plan.max_products,
-            "max_storage_gb": plan.max_storage_gb,
-            "features": plan.features,
-            "trial_days": plan.trial_days,
-        }
-        for plan in plans
-    ]
-
-
-@router.get("/current")
+    body = await subscription_service.list_plans_serialized()
+    await set_cached_bytes(PLANS_CACHE_KEY, body, PLANS_CACHE_TTL)
+    
+    return with_etag(request, Response(content=body, media_type="application/json"))
+
+
+@router.get("/current", response_model=None)
 async def get_current_subscription(
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    request: Request,
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get current organization's subscription."""
-    subscription_service = SubscriptionService(db)
+    subscription_service = SubscriptionService(ctx.db)
     
-    subscription = await subscription_service.get_active_subscription(tenant_id)
+    subscription = await subscription_service.get_active_subscription_cached(ctx.tenant_id)
     if not subscription:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active subscription found"
         )
     
-    plan = subscription.plan
-    
-    return {
-        "id": str(subscription.id),
-        "status": subscription.status.value,
+    return with_etag(request, ORJSONResponse({
+        "id": subscription.id,
+        "status": subscription.status,
         "plan": {
-            "id": str(plan.id),
-            "name": plan.name,
-            "code": plan.code,
-            "plan_type": plan.plan_type.value,
+            "id": subscription.plan_id,
+            "name": subscription.plan_name,
+            "code": subscription.plan_code,
         },
-        "billing_cycle": subscription.billing_cycle.value,
-        "trial_starts_at": subscription.trial_starts_at.isoformat() if subscription.trial_starts_at else None,
-        "trial_ends_at": subscription.trial_ends_at.isoformat() if subscription.trial_ends_at else None,
-        "starts_at": subscription.starts_at.isoformat() if subscription.starts_at else None,
-        "ends_at": subscription.ends_at.isoformat() if subscription.ends_at else None,
-        "next_billing_date": subscription.next_billing_date.isoformat() if subscription.next_billing_date else None,
+        "billing_cycle": subscription.billing_cycle,
+        "trial_starts_at": subscription.trial_starts_at,
+        "trial_ends_at": subscription.trial_ends_at,
+        "starts_at": subscription.starts_at,
+        "ends_at": subscription.ends_at,
         "current_usage": {
-            "users": subscription.current_users,
-            "teams": subscription.current_teams,
             "storage_mb": subscription.current_storage_mb,
         },
-        "limits": {
-            "max_users": plan.max_users,
-            "max_teams": plan.max_teams,
-            "max_leads": plan.max_leads,
-            "max_contacts": plan.max_contacts,
-            "max_deals": plan.max_deals,
-            "max_tickets": plan.max_tickets,
-            "max_products": plan.max_products,
-            "max_storage_gb": plan.max_storage_gb,
-        },
-        "features": plan.features,
-    }
+        "limits": subscription.limits,
+        "features": subscription.features,
+    }), REVALIDATE)
 
 
-@router.get("/usage")
+@router.get("/usage", response_model=None)
 async def get_subscription_usage(
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get current subscription usage vs limits."""
-    subscription_service = SubscriptionService(db)
+    subscription_service = SubscriptionService(ctx.db)
     
-    usage = await subscription_service.get_usage_summary(tenant_id)
+    usage = await subscription_service.get_usage_summary(ctx.tenant_id)
     
-    return usage
+    return ORJSONResponse(usage)
 
 
 @router.post("/upgrade", response_model=SuccessResponse)
 async def upgrade_subscription(
     upgrade_data: SubscriptionUpdateRequest,
-    current_user: TokenPayload = Depends(require_permissions("subscription:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("subscription:update"))
 ):
     """Upgrade subscription to a higher plan."""
-    subscription_service = SubscriptionService(db)
+    subscription_service = SubscriptionService(ctx.db)
     
-    # Get target plan
-    target_plan = await subscription_service.get_plan_by_code(upgrade_data.plan_code)
+    # Get target plan and current subscription
+    target_plan, current_sub = await subscription_service.get_plan_and_active_subscription(
+        upgrade_data.plan_code, ctx.tenant_id
+    )
     if not target_plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Plan not found"
         )
     
-    # Get current subscription
-    current_sub = await subscription_service.get_active_subscription(tenant_id)
     if not current_sub:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -162,7 +134,7 @@ async def upgrade_subscription(
         billing_cycle=upgrade_data.billing_cycle,
     )
     
-    await db.commit()
+    after_commit(ctx.db, SubscriptionService.invalidate_active_subscription, ctx.tenant_id)
     
     return SuccessResponse(message=f"Subscription upgraded to {target_plan.name}")
 
@@ -170,23 +142,21 @@ async def upgrade_subscription(
 @router.post("/downgrade", response_model=SuccessResponse)
 async def downgrade_subscription(
     downgrade_data: SubscriptionUpdateRequest,
-    current_user: TokenPayload = Depends(require_permissions("subscription:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("subscription:update"))
 ):
     """Downgrade subscription to a lower plan."""
-    subscription_service = SubscriptionService(db)
+    subscription_service = SubscriptionService(ctx.db)
     
-    # Get target plan
-    target_plan = await subscription_service.get_plan_by_code(downgrade_data.plan_code)
+    # Get target plan and current subscription
+    target_plan, current_sub = await subscription_service.get_plan_and_active_subscription(
+        downgrade_data.plan_code, ctx.tenant_id
+    )
     if not target_plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Plan not found"
         )
     
-    # Get current subscription
-    current_sub = await subscription_service.get_active_subscription(tenant_id)
     if not current_sub:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -195,7 +165,7 @@ async def downgrade_subscription(
     
     # Check if downgrade is valid (usage must be within new limits)
     validation = await subscription_service.validate_downgrade(
-        tenant_id, target_plan
+        ctx.tenant_id, target_plan
     )
     
     if not validation["valid"]:
@@ -210,7 +180,7 @@ async def downgrade_subscription(
         new_plan=target_plan,
     )
     
-    await db.commit()
+    after_commit(ctx.db, SubscriptionService.invalidate_active_subscription, ctx.tenant_id)
     
     return SuccessResponse(
         message=f"Subscription will be downgraded to {target_plan.name} at the end of the current billing period"
@@ -219,15 +189,13 @@ async def downgrade_subscription(
 
 @router.post("/cancel", response_model=SuccessResponse)
 async def cancel_subscription(
-    current_user: TokenPayload = Depends(require_permissions("subscription:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("subscription:update"))
 ):
     """Cancel subscription (will be downgraded to free plan)."""
-    subscription_service = SubscriptionService(db)
+    subscription_service = SubscriptionService(ctx.db)
     
     # Get current subscription
-    current_sub = await subscription_service.get_active_subscription(tenant_id)
+    current_sub = await subscription_service.get_active_subscription(ctx.tenant_id)
     if not current_sub:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -237,7 +205,7 @@ async def cancel_subscription(
     # Cancel subscription
     await subscription_service.cancel_subscription(current_sub)
     
-    await db.commit()
+    after_commit(ctx.db, SubscriptionService.invalidate_active_subscription, ctx.tenant_id)
     
     return SuccessResponse(
         message="Subscription cancelled. Access will continue until the end of the billing period."
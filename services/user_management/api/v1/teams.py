@@ -2,12 +2,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from shared.database import get_async_session
-from shared.middleware.auth import get_current_user, require_permissions
-from shared.middleware.tenant import require_tenant
+from shared.database import after_commit
+from shared.middleware.context import (
+    RequestContext,
+    request_context,
+    request_context_with_permissions,
+)
 from shared.models.team import Team, UserTeam, TeamRole, TeamType
 from shared.schemas.team import (
     TeamCreate,
@@ -23,61 +25,62 @@ from shared.schemas.team import (
     TeamStats,
 )
 from shared.schemas.common import SuccessResponse, PaginatedResponse
-from shared.security.jwt import TokenPayload
+from shared.responses import REVALIDATE, PydanticResponse, with_etag
 from services.user_management.services.team_service import TeamService
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[TeamResponse])
+@router.get("", response_model=None, responses={200: {"model": List[TeamResponse]}})
 async def list_teams(
+    request: Request,
     team_type: Optional[TeamType] = Query(None),
     parent_id: Optional[UUID] = Query(None),
     is_active: Optional[bool] = Query(True),
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context)
 ):
     """List all teams in the organization."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
     teams = await team_service.list_teams(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         team_type=team_type,
         parent_id=parent_id,
         is_active=is_active,
     )
     
-    return [TeamResponse.model_validate(team) for team in teams]
+    # Rows come straight from the DB, so skip re-validation
+    response = await PydanticResponse.create(
+        [TeamResponse.model_construct(**team.to_dict()) for team in teams]
+    )
+    
+    return with_etag(request, response, REVALIDATE)
 
 
-@router.get("/hierarchy", response_model=List[TeamHierarchy])
+@router.get("/hierarchy", response_model=None, responses={200: {"model": List[TeamHierarchy]}})
 async def get_team_hierarchy(
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    request: Request,
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get team hierarchy tree."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    hierarchy = await team_service.get_team_hierarchy(tenant_id)
+    body = await team_service.get_team_hierarchy_json(ctx.tenant_id)
     
-    return hierarchy
+    return with_etag(request, Response(content=body, media_type="application/json"), REVALIDATE)
 
 
 @router.post("", response_model=TeamResponse)
 async def create_team(
     team_data: TeamCreate,
-    current_user: TokenPayload = Depends(require_permissions("team:create")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:create"))
 ):
     """Create a new team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
     # Check if code already exists (if provided)
     if team_data.code:
-        existing = await team_service.get_team_by_code(tenant_id, team_data.code)
+        existing = await team_service.get_team_by_code(ctx.tenant_id, team_data.code)
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -86,7 +89,7 @@ async def create_team(
     
     # Create team
     team = await team_service.create_team(
-        organization_id=tenant_id,
+        organization_id=ctx.tenant_id,
         name=team_data.name,
         code=team_data.code,
         description=team_data.description,
@@ -98,46 +101,45 @@ async def create_team(
     
     # Add initial members if provided
     if team_data.member_ids:
-        for member_id in team_data.member_ids:
-            await team_service.add_member(team.id, member_id, TeamRole.MEMBER)
+        await team_service.bulk_add_members(
+            team.id,
+            list(dict.fromkeys(team_data.member_ids)),
+            TeamRole.MEMBER,
+        )
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
-    return TeamResponse.model_validate(team)
+    return await PydanticResponse.create(TeamResponse.model_construct(**team.to_dict()))
 
 
-@router.get("/{team_id}", response_model=TeamDetailResponse)
+@router.get("/{team_id}", response_model=None, responses={200: {"model": TeamDetailResponse}})
 async def get_team(
     team_id: UUID,
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get team details with members."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team_with_members(team_id, tenant_id)
+    team = await team_service.get_team_with_members(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found"
         )
     
-    return TeamDetailResponse.model_validate(team)
+    return await PydanticResponse.create(TeamDetailResponse.model_validate(team))
 
 
 @router.patch("/{team_id}", response_model=TeamResponse)
 async def update_team(
     team_id: UUID,
     update_data: TeamUpdate,
-    current_user: TokenPayload = Depends(require_permissions("team:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:update"))
 ):
     """Update a team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -149,22 +151,22 @@ async def update_team(
         team, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
-    return TeamResponse.model_validate(updated_team)
+    return await PydanticResponse.create(
+        TeamResponse.model_construct(**updated_team.to_dict())
+    )
 
 
 @router.delete("/{team_id}", response_model=SuccessResponse)
 async def delete_team(
     team_id: UUID,
-    current_user: TokenPayload = Depends(require_permissions("team:delete")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:delete"))
 ):
     """Delete a team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -182,7 +184,7 @@ async def delete_team(
     # Soft delete
     await team_service.delete_team(team)
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
     return SuccessResponse(message="Team deleted successfully")
 
@@ -191,37 +193,32 @@ async def delete_team(
 async def add_team_member(
     team_id: UUID,
     member_data: UserTeamAdd,
-    current_user: TokenPayload = Depends(require_permissions("team:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:update"))
 ):
     """Add a member to a team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found"
         )
     
-    # Check if user already in team
-    existing = await team_service.get_team_member(team_id, member_data.user_id)
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User is already a member of this team"
-        )
-    
-    # Add member
+    # Add member; the insert is skipped if the user is already in the team
     member = await team_service.add_member(
         team_id=team_id,
         user_id=member_data.user_id,
         role=member_data.role,
-        added_by_id=UUID(current_user.sub),
+        added_by_id=UUID(ctx.user.sub),
     )
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User is already a member of this team"
+        )
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
     return UserTeamResponse.model_validate(member)
 
@@ -230,49 +227,41 @@ async def add_team_member(
 async def add_team_members_bulk(
     team_id: UUID,
     members_data: UserTeamBulkAdd,
-    current_user: TokenPayload = Depends(require_permissions("team:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:update"))
 ):
     """Add multiple members to a team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found"
         )
     
-    added_count = 0
-    for user_id in members_data.user_ids:
-        existing = await team_service.get_team_member(team_id, user_id)
-        if not existing:
-            await team_service.add_member(
-                team_id=team_id,
-                user_id=user_id,
-                role=members_data.role,
-                added_by_id=UUID(current_user.sub),
-            )
-            added_count += 1
+    # Existing members are skipped by the insert itself
+    added = await team_service.bulk_add_members(
+        team_id=team_id,
+        user_ids=list(dict.fromkeys(members_data.user_ids)),
+        role=members_data.role,
+        added_by_id=UUID(ctx.user.sub),
+    )
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
-    return SuccessResponse(message=f"Added {added_count} members to team")
+    return SuccessResponse(message=f"Added {len(added)} members to team")
 
 
 @router.delete("/{team_id}/members/{user_id}", response_model=SuccessResponse)
 async def remove_team_member(
     team_id: UUID,
     user_id: UUID,
-    current_user: TokenPayload = Depends(require_permissions("team:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:update"))
 ):
     """Remove a member from a team."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -289,7 +278,7 @@ async def remove_team_member(
     # Remove member
     await team_service.remove_member(member)
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
     return SuccessResponse(message="Member removed from team")
 
@@ -299,14 +288,12 @@ async def update_team_member(
     team_id: UUID,
     user_id: UUID,
     update_data: UserTeamUpdate,
-    current_user: TokenPayload = Depends(require_permissions("team:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("team:update"))
 ):
     """Update a team member's role."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -325,22 +312,20 @@ async def update_team_member(
         member, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    after_commit(ctx.db, TeamService.invalidate_hierarchy_cache, ctx.tenant_id)
     
     return UserTeamResponse.model_validate(updated_member)
 
 
-@router.get("/{team_id}/stats", response_model=TeamStats)
+@router.get("/{team_id}/stats", response_model=None, responses={200: {"model": TeamStats}})
 async def get_team_stats(
     team_id: UUID,
-    current_user: TokenPayload = Depends(get_current_user),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context)
 ):
     """Get team statistics."""
-    team_service = TeamService(db)
+    team_service = TeamService(ctx.db)
     
-    team = await team_service.get_team(team_id, tenant_id)
+    team = await team_service.get_team(team_id, ctx.tenant_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -349,4 +334,4 @@ async def get_team_stats(
     
     stats = await team_service.get_team_stats(team_id)
     
-    return stats
+    return PydanticResponse(stats)
@@ -5,9 +5,11 @@ from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_400_BAD_REQUEST
 
-from shared.database import get_async_session
-from shared.middleware.auth import get_current_user, get_current_user_context, require_permissions, CurrentUser
+from shared.database import after_commit, get_async_session
+from shared.middleware.auth import get_current_user, get_current_user_context, CurrentUser
+from shared.middleware.context import RequestContext, request_context_with_permissions
 from shared.middleware.tenant import require_tenant
 from shared.models.user import User, UserOrganizationRole, UserStatus
 from shared.models.auth import Invitation, InvitationStatus
@@ -22,49 +24,47 @@ from shared.schemas.user import (
     UserRoleUpdate,
     UserListFilter,
 )
+from shared.responses import REVALIDATE, PydanticResponse, with_etag
 from shared.schemas.common import SuccessResponse, PaginatedResponse, PaginationParams
 from shared.security.jwt import TokenPayload
-from shared.security.password import hash_password, generate_token
+from shared.security.password import generate_token, hash_token
+from services.user_management.services.team_service import TeamService
 from services.user_management.services.user_service import UserService
 from services.user_management.config import user_management_settings
 
 router = APIRouter()
 
 
-@router.get("/me", response_model=UserMe)
+@router.get("/me", response_model=None, responses={200: {"model": UserMe}})
 async def get_current_user_profile(
+    request: Request,
     current_user: TokenPayload = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session)
 ):
     """Get current user's profile with organization context."""
     user_service = UserService(db)
     
-    user = await user_service.get_user_by_id(UUID(current_user.sub))
+    org_id = UUID(current_user.org_id) if current_user.org_id else None
+    
+    user, teams = await user_service.get_user_with_context(UUID(current_user.sub), org_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Get all organizations for user
-    organizations = await user_service.get_user_organizations(user.id)
+    # Organizations come from the roles loaded with the user
+    organizations = UserService.organizations_for(user)
     
     # Get current organization context
     current_org = None
-    current_role = None
-    teams = []
-    
-    if current_user.org_id:
-        org_id = UUID(current_user.org_id)
+    if org_id:
         for org_info in organizations:
             if org_info["organization_id"] == org_id:
                 current_org = org_info
                 break
-        
-        # Get teams in current org
-        teams = await user_service.get_user_teams(user.id, org_id)
     
-    return UserMe(
+    profile = UserMe(
         id=user.id,
         email=user.email,
         first_name=user.first_name,
@@ -82,7 +82,7 @@ async def get_current_user_profile(
         preferences=user.preferences or {},
         last_login_at=user.last_login_at,
         created_at=user.created_at,
-        organization_id=UUID(current_user.org_id) if current_user.org_id else None,
+        organization_id=org_id,
         organization_name=current_org["organization_name"] if current_org else None,
         role_id=UUID(current_org["role_id"]) if current_org and current_org.get("role_id") else None,
         role_name=current_org["role_name"] if current_org else None,
@@ -90,9 +90,11 @@ async def get_current_user_profile(
         teams=teams,
         organizations=organizations,
     )
+    
+    return with_etag(request, PydanticResponse(profile), REVALIDATE)
 
 
-@router.patch("/me", response_model=UserResponse)
+@router.patch("/me", response_model=None, responses={200: {"model": UserResponse}})
 async def update_current_user(
     update_data: UserUpdate,
     current_user: TokenPayload = Depends(get_current_user),
@@ -113,12 +115,13 @@ async def update_current_user(
         user, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    await db.flush()
     
-    return UserResponse.model_validate(updated_user)
+    # Validated once here; response_model=None keeps FastAPI from doing it again
+    return PydanticResponse(UserResponse.model_validate(updated_user))
 
 
-@router.get("", response_model=PaginatedResponse[UserResponse])
+@router.get("", response_model=None, responses={200: {"model": PaginatedResponse[UserResponse]}})
 async def list_users(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
@@ -126,12 +129,11 @@ async def list_users(
     status: Optional[UserStatus] = None,
     role_id: Optional[UUID] = None,
     is_active: Optional[bool] = None,
-    current_user: TokenPayload = Depends(require_permissions("user:list")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    ctx: RequestContext = Depends(request_context_with_permissions("user:list"))
 ):
     """List users in the current organization."""
-    user_service = UserService(db)
+    user_service = UserService(ctx.db)
     
     filters = UserListFilter(
         search=search,
@@ -140,35 +142,43 @@ async def list_users(
         is_active=is_active,
     )
     
-    result = await user_service.list_organization_users(
-        organization_id=tenant_id,
-        page=page,
-        page_size=page_size,
-        filters=filters,
-    )
+    try:
+        result = await user_service.list_organization_users(
+            organization_id=ctx.tenant_id,
+            page=page,
+            page_size=page_size,
+            filters=filters,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        # The status query parameter shadows fastapi.status in this function
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    result.items = [UserResponse.model_validate(user) for user in result.items]
     
-    return result
+    return PydanticResponse(result)
 
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get("/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def get_user(
     user_id: UUID,
-    current_user: TokenPayload = Depends(require_permissions("user:read")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    request: Request,
+    ctx: RequestContext = Depends(request_context_with_permissions("user:read"))
 ):
     """Get user details."""
-    user_service = UserService(db)
+    user_service = UserService(ctx.db)
     
     # Check user is in same organization
-    user = await user_service.get_organization_user(tenant_id, user_id)
+    user = await user_service.get_organization_user(ctx.tenant_id, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    return UserResponse.model_validate(user)
+    return with_etag(request, PydanticResponse(UserResponse.model_validate(user)), REVALIDATE)
 
 
 @router.post("/invite", response_model=UserInviteResponse)
@@ -184,22 +194,17 @@ async def invite_user(
     
     user_service = UserService(db)
     
-    # Check if user already in org
-    existing = await user_service.get_user_by_email(invite_data.email)
-    if existing:
-        # Check if already in this org
-        org_role = await user_service.get_user_organization_role(
-            existing.id, tenant_id
+    # Check for an existing member or pending invitation in one query
+    is_member, has_pending = await user_service.get_invite_conflicts(
+        tenant_id, invite_data.email
+    )
+    if is_member:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User is already a member of this organization"
         )
-        if org_role:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User is already a member of this organization"
-            )
-    
-    # Check for pending invitation
-    pending = await user_service.get_pending_invitation(tenant_id, invite_data.email)
-    if pending:
+    
+    if has_pending:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="An invitation is already pending for this email"
@@ -218,12 +223,12 @@ async def invite_user(
         role_id=invite_data.role_id,
         team_ids=invite_data.team_ids,
         invited_by_id=current_user.user_id,
-        token_hash=hash_password(token),
+        token_hash=hash_token(token),
         expires_at=expires_at,
         message=invite_data.message,
     )
     
-    await db.commit()
+    await db.flush()
     
     # TODO: Send invitation email
     invitation_url = f"https://app.horizonsync.com/accept-invitation?token={token}"
@@ -280,30 +285,28 @@ async def accept_invitation(
     
     # Add to teams if specified
     if invitation.team_ids:
-        for team_id in invitation.team_ids:
-            await user_service.add_user_to_team(user.id, team_id)
+        await user_service.add_user_to_teams_bulk(user.id, invitation.team_ids)
     
     # Mark invitation as accepted
     invitation.accept(user.id)
     
-    await db.commit()
+    if invitation.team_ids:
+        after_commit(db, TeamService.invalidate_hierarchy_cache, invitation.organization_id)
     
     return SuccessResponse(message="Invitation accepted successfully. You can now login.")
 
 
-@router.patch("/{user_id}", response_model=UserResponse)
+@router.patch("/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def update_user(
     user_id: UUID,
     update_data: UserUpdate,
-    current_user: TokenPayload = Depends(require_permissions("user:update")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("user:update"))
 ):
     """Update a user in the organization."""
-    user_service = UserService(db)
+    user_service = UserService(ctx.db)
     
     # Get user in organization
-    user = await user_service.get_organization_user(tenant_id, user_id)
+    user = await user_service.get_organization_user(ctx.tenant_id, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -315,30 +318,29 @@ async def update_user(
         user, update_data.model_dump(exclude_unset=True)
     )
     
-    await db.commit()
+    await ctx.db.flush()
     
-    return UserResponse.model_validate(updated_user)
+    # Validated once here; response_model=None keeps FastAPI from doing it again
+    return PydanticResponse(UserResponse.model_validate(updated_user))
 
 
 @router.delete("/{user_id}", response_model=SuccessResponse)
 async def deactivate_user(
     user_id: UUID,
-    current_user: TokenPayload = Depends(require_permissions("user:delete")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("user:delete"))
 ):
     """Deactivate/remove a user from the organization."""
-    user_service = UserService(db)
+    user_service = UserService(ctx.db)
     
     # Can't remove yourself
-    if user_id == UUID(current_user.sub):
+    if user_id == UUID(ctx.user.sub):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot remove yourself from the organization"
         )
     
     # Get user's org role
-    org_role = await user_service.get_user_organization_role(user_id, tenant_id)
+    org_role = await user_service.get_user_organization_role(user_id, ctx.tenant_id)
     if not org_role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -349,8 +351,6 @@ async def deactivate_user(
     org_role.is_active = False
     org_role.status = "removed"
     
-    await db.commit()
-    
     return SuccessResponse(message="User removed from organization")
 
 
@@ -358,15 +358,13 @@ async def deactivate_user(
 async def update_user_role(
     user_id: UUID,
     role_data: UserRoleUpdate,
-    current_user: TokenPayload = Depends(require_permissions("user:update", "role:assign")),
-    tenant_id: UUID = Depends(require_tenant),
-    db: AsyncSession = Depends(get_async_session)
+    ctx: RequestContext = Depends(request_context_with_permissions("user:update", "role:assign"))
 ):
     """Update a user's role in the organization."""
-    user_service = UserService(db)
+    user_service = UserService(ctx.db)
     
     # Get user's org role
-    org_role = await user_service.get_user_organization_role(user_id, tenant_id)
+    org_role = await user_service.get_user_organization_role(user_id, ctx.tenant_id)
     if not org_role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -376,6 +374,4 @@ async def update_user_role(
     # Update role
     org_role.role_id = role_data.role_id
     
-    await db.commit()
-    
     return SuccessResponse(message="User role updated successfully")
@@ -2,14 +2,17 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from shared.cache import close_redis
 from shared.config import settings
-from shared.database import init_db
-from shared.middleware.tenant import TenantMiddleware
-from shared.middleware.auth import AuthMiddleware
-from shared.middleware.audit import AuditMiddleware
+from shared.database import close_db, init_db, warm_pool
+from shared.middleware.audit import close_audit_buffers
+from shared.middleware.combined import CombinedContextMiddleware
 from services.user_management.api.v1 import router as v1_router
 
 # Configure logging
@@ -23,12 +26,16 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting User Management Service...")
     await init_db()
+    await warm_pool()
     logger.info("User Management Service started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down User Management Service...")
+    await close_audit_buffers()
+    await close_redis()
+    await close_db()
 
 
 # Create FastAPI app
@@ -37,6 +44,7 @@ app = FastAPI(
     description="User, Organization, Role, Team, and Subscription management",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -49,22 +57,27 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(AuditMiddleware)
-app.add_middleware(TenantMiddleware)
-app.add_middleware(AuthMiddleware)
+# Auth, tenant context and audit in one layer; the JWT is decoded once
+app.add_middleware(CombinedContextMiddleware)
+# Outermost: compress whatever the stack produced (small bodies are sent as-is)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Include API routers
 app.include_router(v1_router, prefix="/api/v1")
 
 
-@app.get("/health")
+# Health payload never changes, so it is serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "user_management",
+    "version": "1.0.0"
+})
+
+
+@app.get("/health", response_class=Response)
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "user_management",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -73,5 +86,7 @@ if __name__ == "__main__":
         "services.user_management.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=settings.DEBUG
     )
@@ -29,63 +29,55 @@ class AuditService:
         end_date: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """List audit logs with filtering and pagination."""
-        # Base query
-        query = select(AuditLog).where(
-            AuditLog.organization_id == organization_id
-        )
+        # Filters are shared by the count and page queries. The request's
+        # action/resource vocabulary maps onto the model's operation/entity columns.
+        filters = [AuditLog.organization_id == organization_id]
         
-        # Apply filters
         if user_id:
-            query = query.where(AuditLog.user_id == user_id)
+            filters.append(AuditLog.user_id == user_id)
         
         if action:
-            query = query.where(AuditLog.action == action)
+            filters.append(AuditLog.operation == AuditAction(action).value)
         
         if resource_type:
-            query = query.where(AuditLog.resource_type == resource_type)
+            filters.append(AuditLog.entity == resource_type)
         
         if resource_id:
-            query = query.where(AuditLog.resource_id == resource_id)
+            filters.append(AuditLog.entity_id == resource_id)
         
         if start_date:
-            query = query.where(AuditLog.created_at >= start_date)
+            filters.append(AuditLog.timestamp >= start_date)
         
         if end_date:
-            query = query.where(AuditLog.created_at <= end_date)
+            filters.append(AuditLog.timestamp <= end_date)
         
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar() or 0
+        # Count total directly on the table rather than over a subquery
+        count_query = select(func.count()).select_from(AuditLog).where(*filters)
         
         # Apply pagination and ordering
         offset = (page - 1) * page_size
-        query = query.order_by(AuditLog.created_at.desc())
+        # Only the listed columns are fetched; rows are never turned into ORM objects
+        query = select(
+            AuditLog.id,
+            AuditLog.user_id,
+            AuditLog.operation,
+            AuditLog.entity,
+            AuditLog.entity_id,
+            AuditLog.previous_data,
+            AuditLog.new_data,
+            AuditLog.timestamp,
+        ).where(*filters)
+        query = query.order_by(AuditLog.timestamp.desc())
         query = query.offset(offset).limit(page_size)
         
+        total = (await self.db.execute(count_query)).scalar() or 0
         result = await self.db.execute(query)
-        logs = result.scalars().all()
+        items = [dict(row) for row in result.mappings()]
         
         pages = (total + page_size - 1) // page_size if total > 0 else 1
         
         return {
-            "items": [
-                {
-                    "id": str(log.id),
-                    "user_id": str(log.user_id) if log.user_id else None,
-                    "user_email": log.user_email,
-                    "action": log.action.value,
-                    "resource_type": log.resource_type,
-                    "resource_id": str(log.resource_id) if log.resource_id else None,
-                    "resource_name": log.resource_name,
-                    "old_values": log.old_values,
-                    "new_values": log.new_values,
-                    "changed_fields": log.changed_fields,
-                    "ip_address": log.ip_address,
-                    "description": log.description,
-                    "created_at": log.created_at.isoformat(),
-                }
-                for log in logs
-            ],
+            "items": items,
             "total": total,
             "page": page,
             "page_size": page_size,
@@ -1,12 +1,13 @@
 """Organization business logic service."""
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from shared.database import gather_reads
 from shared.models.organization import Organization, OrganizationStatus, OrganizationType
 from shared.models.subscription import Subscription, SubscriptionPlan, SubscriptionStatus, PlanType
 from shared.models.role import Role, Permission, RolePermission
@@ -22,23 +23,24 @@ from shared.security.permissions import (
 class OrganizationService:
     """Service for organization operations."""
     
+    _GET_ORGANIZATION_STMT = select(Organization).where(
+        Organization.id == bindparam("org_id")
+    )
+    _GET_ORGANIZATION_BY_SLUG_STMT = select(Organization).where(
+        Organization.slug == bindparam("slug")
+    )
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
     async def get_organization(self, org_id: UUID) -> Optional[Organization]:
         """Get organization by ID."""
-        query = select(Organization).where(
-            Organization.id == org_id
-        )
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._GET_ORGANIZATION_STMT, {"org_id": org_id})
         return result.scalar_one_or_none()
     
     async def get_organization_by_slug(self, slug: str) -> Optional[Organization]:
         """Get organization by slug."""
-        query = select(Organization).where(
-            Organization.slug == slug
-        )
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._GET_ORGANIZATION_BY_SLUG_STMT, {"slug": slug})
         return result.scalar_one_or_none()
     
     async def create_organization(
@@ -108,8 +110,6 @@ class OrganizationService:
     
     async def create_default_roles(self, organization_id: UUID) -> List[Role]:
         """Create default roles for an organization."""
-        roles = []
-        
         role_definitions = [
             ("owner", "Owner", OWNER_PERMISSIONS, 100, True),
             ("admin", "Administrator", ADMIN_PERMISSIONS, 90, False),
@@ -118,35 +118,40 @@ class OrganizationService:
             ("viewer", "Viewer", VIEWER_PERMISSIONS, 10, False),
         ]
         
-        for code, name, permissions, level, is_default in role_definitions:
-            role = Role(
-                organization_id=organization_id,
-                code=code,
-                name=name,
-                is_system=True,
-                is_default=is_default,
-                hierarchy_level=level,
-            )
-            self.db.add(role)
-            await self.db.flush()
-            
-            # Add permissions
-            for perm_code in permissions:
-                # Find or create permission
-                perm_query = select(Permission).where(Permission.code == perm_code)
-                perm_result = await self.db.execute(perm_query)
-                permission = perm_result.scalar_one_or_none()
-                
-                if permission:
-                    role_perm = RolePermission(
-                        role_id=role.id,
-                        permission_id=permission.id
-                    )
-                    self.db.add(role_perm)
-            
-            roles.append(role)
+        # Resolve every permission code used by the default roles at once
+        all_codes = set().union(*(perms for _, _, perms, _, _ in role_definitions))
+        perm_result = await self.db.execute(
+            select(Permission.code, Permission.id).where(Permission.code.in_(all_codes))
+        )
+        permission_ids = dict(perm_result.all())
+        
+        # One INSERT ... RETURNING for all roles, in definition order
+        result = await self.db.scalars(
+            insert(Role).returning(Role, sort_by_parameter_order=True),
+            [
+                {
+                    "organization_id": organization_id,
+                    "code": code,
+                    "name": name,
+                    "is_system": True,
+                    "is_default": is_default,
+                    "hierarchy_level": level,
+                }
+                for code, name, _, level, is_default in role_definitions
+            ],
+        )
+        roles = list(result.all())
+        
+        # Add permissions
+        role_permissions = [
+            {"role_id": role.id, "permission_id": permission_ids[perm_code]}
+            for role, (_, _, permissions, _, _) in zip(roles, role_definitions)
+            for perm_code in permissions
+            if perm_code in permission_ids
+        ]
+        if role_permissions:
+            await self.db.execute(insert(RolePermission), role_permissions)
         
-        await self.db.flush()
         return roles
     
     async def get_role_permissions(self, role_id: UUID) -> List[str]:
@@ -159,42 +164,23 @@ class OrganizationService:
         )
         
         result = await self.db.execute(query)
-        return [row for row in result.scalars().all()]
+        return list(result.scalars())
     
     async def get_organization_stats(self, org_id: UUID) -> Optional[OrganizationStats]:
-        """Get organization statistics."""
-        # Get organization
-        org = await self.get_organization(org_id)
-        if not org:
-            return None
-        
-        # Count users
-        user_query = select(func.count()).select_from(User).where(
-            User.organization_id == org_id
+        """
+        Get organization statistics.
+        The organization check and all counts share one query, and the active
+        subscription is read alongside it when the pool allows.
+        """
+        counts, subscription = await gather_reads(
+            self.db,
+            lambda db: OrganizationService(db)._count_members(org_id),
+            lambda db: OrganizationService(db)._get_active_subscription(org_id),
         )
-        total_users = (await self.db.execute(user_query)).scalar() or 0
         
-        active_user_query = select(func.count()).select_from(User).where(
-            User.organization_id == org_id,
-            User.is_active == True
-        )
-        active_users = (await self.db.execute(active_user_query)).scalar() or 0
-        
-        # Count teams
-        team_query = select(func.count()).select_from(Team).where(
-            Team.organization_id == org_id
-        )
-        total_teams = (await self.db.execute(team_query)).scalar() or 0
-        
-        # Get subscription info
-        sub_query = select(Subscription).options(
-            selectinload(Subscription.plan)
-        ).where(
-            Subscription.organization_id == org_id,
-            Subscription.status.in_([SubscriptionStatus.ACTIVE.value, SubscriptionStatus.TRIAL.value])
-        )
-        sub_result = await self.db.execute(sub_query)
-        subscription = sub_result.scalar_one_or_none()
+        org_exists, total_users, active_users, total_teams = counts
+        if not org_exists:
+            return None
         
         plan_name = "Free"
         plan_limits = {}
@@ -226,6 +212,39 @@ class OrganizationService:
             usage_percentage=usage_percentage,
         )
     
+    async def _count_members(self, org_id: UUID) -> Tuple[bool, int, int, int]:
+        """Check the organization exists and count its users and teams in one query."""
+        org_exists = select(Organization.id).where(
+            Organization.id == org_id
+        ).exists()
+        team_count = select(func.count()).select_from(Team).where(
+            Team.organization_id == org_id
+        ).scalar_subquery()
+        
+        query = select(
+            org_exists,
+            func.count(User.id),
+            func.count(User.id).filter(User.is_active == True),
+            team_count,
+        ).select_from(User).where(
+            User.organization_id == org_id
+        )
+        
+        exists, total_users, active_users, total_teams = (await self.db.execute(query)).one()
+        return exists, total_users or 0, active_users or 0, total_teams or 0
+    
+    async def _get_active_subscription(self, org_id: UUID) -> Optional[Subscription]:
+        """Get the active or trial subscription with its plan."""
+        query = select(Subscription).options(
+            joinedload(Subscription.plan)
+        ).where(
+            Subscription.organization_id == org_id,
+            Subscription.status.in_([SubscriptionStatus.ACTIVE.value, SubscriptionStatus.TRIAL.value])
+        ).limit(1)
+        
+        result = await self.db.execute(query)
+        return result.scalars().first()
+    
     async def update_organization_settings(
         self,
         org_id: UUID,
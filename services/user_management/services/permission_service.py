@@ -1,55 +1,79 @@
 """Permission business logic service."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.models.role import Permission, ResourceType, ActionType
+from shared.models.role import Permission, ResourceType
 from shared.schemas.role import PermissionResponse, PermissionGroupResponse
 
+PERMISSIONS_CACHE_TTL = 5 * 60
+
+# Permissions are seeded reference data with no write endpoints, so a short
+# per-process cache keyed by the resource filter is enough; a
+# re-seed shows up once the TTL lapses.
+_permission_lists: TTLCache = TTLCache(maxsize=64, ttl=PERMISSIONS_CACHE_TTL)
+
 
 class PermissionService:
     """Service for permission operations."""
     
+    _GET_PERMISSION_BY_CODE_STMT = select(Permission).where(
+        Permission.code == bindparam("code")
+    )
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
     async def list_permissions(
         self,
         resource: Optional[ResourceType] = None,
-        module: Optional[str] = None,
-    ) -> List[Permission]:
-        """List all permissions with optional filtering."""
-        query = select(Permission).where(Permission.is_active == True)
+    ) -> List[Dict[str, Any]]:
+        """
+        List all permissions, optionally for one resource.
+        Read-only catalog data, so plain column rows are returned instead
+        of ORM entities, and each filter's result is cached briefly.
+        The resource is the prefix of the "resource:action" code.
+        """
+        cached = _permission_lists.get(resource)
+        if cached is not None:
+            return cached
         
-        if resource:
-            query = query.where(Permission.resource == resource)
+        query = select(
+            Permission.id,
+            Permission.code,
+            Permission.name,
+            Permission.description,
+        )
         
-        if module:
-            query = query.where(Permission.module == module)
+        if resource:
+            prefix = f"{ResourceType(resource).value}:"
+            query = query.where(Permission.code.startswith(prefix, autoescape=True))
         
-        query = query.order_by(Permission.resource, Permission.action)
+        query = query.order_by(Permission.code)
         
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        permissions = [dict(row) for row in result.mappings()]
+        
+        _permission_lists[resource] = permissions
+        return permissions
     
-    async def list_permissions_grouped(
-        self,
-        group_by: str = "resource"
-    ) -> List[PermissionGroupResponse]:
-        """List permissions grouped by resource or module."""
+    async def list_permissions_grouped(self) -> List[PermissionGroupResponse]:
+        """List permissions grouped by resource."""
         permissions = await self.list_permissions()
         
         groups = {}
         for perm in permissions:
-            key = perm.resource.value if group_by == "resource" else perm.module
+            key = perm["code"].split(":", 1)[0]
             if key not in groups:
                 groups[key] = []
-            groups[key].append(PermissionResponse.model_validate(perm))
+            # Rows come straight from the DB, so skip re-validation
+            groups[key].append(PermissionResponse.model_construct(**perm))
         
         return [
-            PermissionGroupResponse(
+            PermissionGroupResponse.model_construct(
                 resource=key,
                 permissions=perms
             )
@@ -58,6 +82,5 @@ class PermissionService:
     
     async def get_permission_by_code(self, code: str) -> Optional[Permission]:
         """Get permission by code."""
-        query = select(Permission).where(Permission.code == code)
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._GET_PERMISSION_BY_CODE_STMT, {"code": code})
         return result.scalar_one_or_none()
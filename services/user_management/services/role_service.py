@@ -1,8 +1,9 @@
 """Role business logic service."""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import bindparam, cast, insert, literal, select, func, delete, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,6 +14,27 @@ from shared.models.user import User, UserOrganizationRole
 class RoleService:
     """Service for role operations."""
     
+    # Built once on the Core tables; only the bound values change per call.
+    _ROLE_USER_COUNT_STMT = select(func.count()).select_from(
+        UserOrganizationRole.__table__.join(
+            User.__table__,
+            UserOrganizationRole.__table__.c.user_id == User.__table__.c.id
+        )
+    ).where(
+        UserOrganizationRole.__table__.c.role_id == bindparam("role_id"),
+        User.__table__.c.organization_id == bindparam("organization_id"),
+        User.__table__.c.is_active.is_(True)
+    )
+    
+    _GET_ROLE_STMT = select(Role).where(
+        Role.id == bindparam("role_id"),
+        (Role.organization_id == bindparam("organization_id")) | (Role.is_system == True)
+    )
+    _GET_ROLE_BY_CODE_STMT = select(Role).where(
+        Role.code == bindparam("code"),
+        (Role.organization_id == bindparam("organization_id")) | (Role.is_system == True)
+    )
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
@@ -21,8 +43,13 @@ class RoleService:
         organization_id: UUID,
         include_system: bool = True,
         is_active: Optional[bool] = None,
+        with_permissions: bool = False,
     ) -> List[Role]:
-        """List roles for an organization."""
+        """
+        List roles for an organization.
+        Pass with_permissions=True when the caller reads role_permissions;
+        they are then batch-loaded instead of lazily per role.
+        """
         # Custom roles for this org
         conditions = [
             Role.organization_id == organization_id
@@ -40,6 +67,11 @@ class RoleService:
         if is_active is not None:
             query = query.where(Role.is_active == is_active)
         
+        if with_permissions:
+            query = query.options(
+                selectinload(Role.role_permissions).selectinload(RolePermission.permission)
+            )
+        
         query = query.order_by(Role.hierarchy_level.desc(), Role.name)
         
         result = await self.db.execute(query)
@@ -51,12 +83,10 @@ class RoleService:
         organization_id: UUID
     ) -> Optional[Role]:
         """Get a role by ID."""
-        query = select(Role).where(
-            Role.id == role_id,
-            (Role.organization_id == organization_id) | (Role.is_system == True)
+        result = await self.db.execute(
+            self._GET_ROLE_STMT,
+            {"role_id": role_id, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def get_role_by_code(
@@ -65,29 +95,67 @@ class RoleService:
         code: str
     ) -> Optional[Role]:
         """Get a role by code."""
-        query = select(Role).where(
-            Role.code == code,
-            (Role.organization_id == organization_id) | (Role.is_system == True)
+        result = await self.db.execute(
+            self._GET_ROLE_BY_CODE_STMT,
+            {"code": code, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def get_role_with_permissions(
         self,
         role_id: UUID,
         organization_id: UUID
-    ) -> Optional[Role]:
-        """Get role with permissions loaded."""
-        query = select(Role).options(
-            selectinload(Role.role_permissions).selectinload(RolePermission.permission)
+    ) -> Tuple[Optional[Role], List[Dict[str, Any]]]:
+        """
+        Get a role and its permissions in one query.
+        Permissions are aggregated into a JSON array server-side instead of
+        being loaded through role_permissions -> permission.
+        """
+        permissions = func.jsonb_agg(
+            func.jsonb_build_object(
+                "id", Permission.id,
+                "code", Permission.code,
+                "name", Permission.name,
+                "description", Permission.description,
+            )
+        ).filter(Permission.id.is_not(None))
+        
+        query = select(
+            Role,
+            func.coalesce(permissions, cast(literal("[]"), JSONB))
+        ).outerjoin(
+            RolePermission, RolePermission.role_id == Role.id
+        ).outerjoin(
+            Permission, Permission.id == RolePermission.permission_id
         ).where(
             Role.id == role_id,
             (Role.organization_id == organization_id) | (Role.is_system == True)
-        )
+        ).group_by(Role.id)
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return None, []
+        return row[0], row[1]
+    
+    async def get_role_and_user_count(
+        self,
+        role_id: UUID,
+        organization_id: UUID
+    ) -> Tuple[Optional[Role], int]:
+        """Load a role and its assigned-user count."""
+        role = await self.get_role(role_id, organization_id)
+        user_count = await self.get_role_user_count(role_id, organization_id)
+        return role, user_count
+    
+    async def get_role_detail(
+        self,
+        role_id: UUID,
+        organization_id: UUID
+    ) -> Tuple[Optional[Role], List[Dict[str, Any]], int]:
+        """Load a role, its permissions and its assigned-user count."""
+        role, permissions = await self.get_role_with_permissions(role_id, organization_id)
+        user_count = await self.get_role_user_count(role_id, organization_id)
+        return role, permissions, user_count
     
     async def create_role(
         self,
@@ -99,7 +167,7 @@ class RoleService:
         hierarchy_level: int = 0,
     ) -> Role:
         """Create a new custom role."""
-        role = Role(
+        stmt = insert(Role).values(
             organization_id=organization_id,
             name=name,
             code=code,
@@ -107,32 +175,36 @@ class RoleService:
             is_system=False,
             is_default=is_default,
             hierarchy_level=hierarchy_level,
-        )
+        ).returning(Role)
         
-        self.db.add(role)
-        await self.db.flush()
-        
-        return role
+        result = await self.db.scalars(stmt)
+        return result.one()
     
     async def update_role(self, role: Role, data: Dict[str, Any]) -> Role:
         """Update role fields."""
-        for key, value in data.items():
-            if hasattr(role, key) and value is not None:
-                setattr(role, key, value)
+        values = {
+            key: value for key, value in data.items()
+            if hasattr(Role, key) and value is not None
+        }
+        if not values:
+            return role
         
-        await self.db.flush()
-        return role
+        # Single UPDATE ... RETURNING; populate_existing refreshes the loaded
+        # instance in place instead of going through dirty tracking.
+        result = await self.db.execute(
+            update(Role)
+            .where(Role.id == role.id)
+            .values(**values)
+            .returning(Role)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one()
     
     async def delete_role(self, role: Role) -> None:
         """Delete a role."""
-        # Delete role permissions first
-        await self.db.execute(
-            delete(RolePermission).where(RolePermission.role_id == role.id)
-        )
-        
-        # Delete role
-        await self.db.delete(role)
-        await self.db.flush()
+        # role_permissions.role_id is ON DELETE CASCADE, so Postgres removes
+        # the mappings as part of this one statement.
+        await self.db.execute(delete(Role).where(Role.id == role.id))
     
     async def set_role_permissions(
         self,
@@ -145,15 +217,15 @@ class RoleService:
             delete(RolePermission).where(RolePermission.role_id == role_id)
         )
         
-        # Add new
-        for perm_id in permission_ids:
-            role_perm = RolePermission(
-                role_id=role_id,
-                permission_id=perm_id
+        # Add new in one executemany
+        if permission_ids:
+            await self.db.execute(
+                insert(RolePermission),
+                [
+                    {"role_id": role_id, "permission_id": perm_id}
+                    for perm_id in dict.fromkeys(permission_ids)
+                ],
             )
-            self.db.add(role_perm)
-        
-        await self.db.flush()
     
     async def get_role_user_count(
         self,
@@ -161,11 +233,8 @@ class RoleService:
         organization_id: UUID
     ) -> int:
         """Get number of users with this role in the organization."""
-        query = select(func.count()).select_from(UserOrganizationRole).join(User).where(
-            UserOrganizationRole.role_id == role_id,
-            User.organization_id == organization_id,
-            User.is_active == True
+        result = await self.db.execute(
+            self._ROLE_USER_COUNT_STMT,
+            {"role_id": role_id, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar() or 0
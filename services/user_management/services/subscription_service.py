@@ -1,12 +1,20 @@
 """Subscription business logic service."""
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
+import orjson
+from sqlalchemy import Text, bindparam, cast, literal, select, func, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from shared.cache import delete_cached, get_cached_bytes, set_cached_bytes
+from shared.database import gather_reads
+from shared.responses import orjson_default
 from shared.models.subscription import (
     Subscription, SubscriptionPlan, SubscriptionStatus,
     BillingCycle, PlanType
@@ -14,10 +22,117 @@ from shared.models.subscription import (
 from shared.models.user import User
 from shared.models.team import Team
 
+# Public plan list body, cached in Redis. Bump the version when the payload shape changes.
+PLANS_CACHE_KEY = "subscription:plans:v1"
+PLANS_CACHE_TTL = 6 * 60 * 60
+PLANS_STREAM_BATCH_SIZE = 100
+
+ACTIVE_SUBSCRIPTION_CACHE_TTL = 60
+
+# Serialized plan bodies, keyed by plan id and reused while updated_at is unchanged.
+_plan_bodies: Dict[UUID, Tuple[datetime, bytes]] = {}
+
+
+def _dump_plan(plan: SubscriptionPlan) -> bytes:
+    """Serialize a plan for the public plan list."""
+    return orjson.dumps(
+        {
+            "id": plan.id,
+            "name": plan.name,
+            "code": plan.code,
+            "description": plan.description,
+            "price": plan.price,
+            "billing_cycle": plan.billing_cycle,
+            "max_users": plan.max_users,
+            "max_teams": plan.max_teams,
+            "max_leads": plan.max_leads,
+            "max_contacts": plan.max_contacts,
+            "max_deals": plan.max_deals,
+            "max_tickets": plan.max_tickets,
+            "max_products": plan.max_products,
+            "max_storage_gb": plan.max_storage_gb,
+            "features": plan.features,
+        },
+        default=orjson_default,
+    )
+
+
+@dataclass(frozen=True)
+class ActiveSubscription:
+    """Detached snapshot of an organization's active subscription and its plan."""
+    id: str
+    plan_id: str
+    plan_name: str
+    plan_code: Optional[str]
+    billing_cycle: Optional[str]
+    status: Optional[str]
+    starts_at: Optional[str]
+    ends_at: Optional[str]
+    trial_starts_at: Optional[str]
+    trial_ends_at: Optional[str]
+    current_storage_mb: float
+    limits: Dict[str, Any]
+    features: Any
+    
+    @classmethod
+    def from_orm(cls, subscription: Subscription) -> "ActiveSubscription":
+        """Build a snapshot from a subscription with its plan loaded."""
+        return cls.decode(cls.encode_orm(subscription))
+    
+    @classmethod
+    def decode(cls, data: bytes) -> "ActiveSubscription":
+        """Build a snapshot from its JSON encoding."""
+        return cls(**orjson.loads(data))
+    
+    @staticmethod
+    def encode_orm(subscription: Subscription) -> bytes:
+        """
+        JSON-encode a subscription with its plan loaded.
+        Raw column values go straight to orjson, which converts UUIDs,
+        datetimes and decimals in C instead of per field in Python.
+        """
+        plan = subscription.plan
+        return orjson.dumps(
+            {
+                "id": subscription.id,
+                "plan_id": plan.id,
+                "plan_name": plan.name,
+                "plan_code": plan.code,
+                "billing_cycle": plan.billing_cycle,
+                "status": subscription.status,
+                "starts_at": subscription.starts_at,
+                "ends_at": subscription.ends_at,
+                "trial_starts_at": subscription.trial_starts_at,
+                "trial_ends_at": subscription.trial_ends_at,
+                "current_storage_mb": subscription.current_storage_mb or Decimal(0),
+                "limits": {
+                    "max_users": plan.max_users,
+                    "max_teams": plan.max_teams,
+                    "max_leads": plan.max_leads,
+                    "max_contacts": plan.max_contacts,
+                    "max_deals": plan.max_deals,
+                    "max_tickets": plan.max_tickets,
+                    "max_products": plan.max_products,
+                    "max_storage_gb": plan.max_storage_gb,
+                },
+                "features": plan.features,
+            },
+            default=orjson_default,
+        )
+
+
+def _active_subscription_key(organization_id: UUID) -> str:
+    return f"subscription:active:v1:{organization_id}"
+
 
 class SubscriptionService:
     """Service for subscription operations."""
     
+    _GET_PLAN_BY_CODE_STMT = select(SubscriptionPlan).where(
+        SubscriptionPlan.code == bindparam("code"),
+        SubscriptionPlan.is_active == True
+    )
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
@@ -35,94 +150,204 @@ class SubscriptionService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def list_plans_serialized(self) -> bytes:
+        """
+        Get the public plan list as a JSON array.
+        Only plans whose updated_at changed since they were last rendered
+        are loaded in full and re-serialized, streamed off a server-side
+        cursor so a large catalog is never held in memory as ORM objects.
+        """
+        query = select(SubscriptionPlan.id, SubscriptionPlan.updated_at).where(
+            SubscriptionPlan.is_active == True,
+            SubscriptionPlan.is_public == True
+        ).order_by(SubscriptionPlan.sort_order)
+        
+        versions = (await self.db.execute(query)).all()
+        
+        stale = [
+            plan_id for plan_id, updated_at in versions
+            if _plan_bodies.get(plan_id, (None,))[0] != updated_at
+        ]
+        if stale:
+            plans = await self.db.stream_scalars(
+                select(SubscriptionPlan)
+                .where(SubscriptionPlan.id.in_(stale))
+                .execution_options(yield_per=PLANS_STREAM_BATCH_SIZE)
+            )
+            async for plan in plans:
+                _plan_bodies[plan.id] = (plan.updated_at, _dump_plan(plan))
+                self.db.expunge(plan)
+        
+        body = bytearray(b"[")
+        for plan_id, _ in versions:
+            cached = _plan_bodies.get(plan_id)
+            if cached is None:
+                continue
+            if len(body) > 1:
+                body += b","
+            body += cached[1]
+        body += b"]"
+        return bytes(body)
+    
+    @staticmethod
+    async def invalidate_plans_cache() -> None:
+        """Drop the cached plan list. Call after any plan is created or changed."""
+        await delete_cached(PLANS_CACHE_KEY)
+    
     async def get_plan_by_code(self, code: str) -> Optional[SubscriptionPlan]:
         """Get subscription plan by code."""
-        query = select(SubscriptionPlan).where(
-            SubscriptionPlan.code == code,
-            SubscriptionPlan.is_active == True
-        )
-        
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._GET_PLAN_BY_CODE_STMT, {"code": code})
         return result.scalar_one_or_none()
     
     async def get_active_subscription(
         self,
         organization_id: UUID
     ) -> Optional[Subscription]:
-        """Get active subscription for organization."""
+        """
+        Get active subscription for organization.
+        The plan is joined in the same query: callers read subscription.plan,
+        and a lazy load on an AsyncSession would be a second round-trip
+        (or a MissingGreenlet error outside the session's greenlet).
+        """
         query = select(Subscription).options(
-            selectinload(Subscription.plan)
+            joinedload(Subscription.plan)
         ).where(
             Subscription.organization_id == organization_id,
             Subscription.status.in_([
                 SubscriptionStatus.ACTIVE.value,
                 SubscriptionStatus.TRIAL.value
             ])
-        ).order_by(Subscription.created_at.desc())
+        ).order_by(Subscription.created_at.desc()).limit(1)
         
         result = await self.db.execute(query)
         return result.scalars().first()
     
+    async def get_plan_and_active_subscription(
+        self,
+        plan_code: str,
+        organization_id: UUID
+    ) -> Tuple[Optional[SubscriptionPlan], Optional[Subscription]]:
+        """
+        Load the target plan and the active subscription, concurrently when
+        the pool allows. The subscription stays on self.db so it can be
+        modified and committed by the caller.
+        """
+        subscription, plan = await gather_reads(
+            self.db,
+            lambda db: SubscriptionService(db).get_active_subscription(organization_id),
+            lambda db: SubscriptionService(db).get_plan_by_code(plan_code),
+        )
+        return plan, subscription
+    
+    async def get_active_subscription_cached(
+        self,
+        organization_id: UUID
+    ) -> Optional[ActiveSubscription]:
+        """
+        Get a read-only snapshot of the active subscription.
+        Served from Redis, then the database. There is no per-process layer:
+        Redis is the only copy, so invalidation reaches every worker at once.
+        """
+        key = _active_subscription_key(organization_id)
+        cached = await get_cached_bytes(key)
+        if cached is not None:
+            return ActiveSubscription.decode(cached)
+        
+        subscription = await self.get_active_subscription(organization_id)
+        if not subscription or not subscription.plan:
+            return None
+        encoded = ActiveSubscription.encode_orm(subscription)
+        await set_cached_bytes(key, encoded, ACTIVE_SUBSCRIPTION_CACHE_TTL)
+        return ActiveSubscription.decode(encoded)
+    
+    @staticmethod
+    async def invalidate_active_subscription(organization_id: UUID) -> None:
+        """Drop the cached snapshot. Call after the subscription change is committed."""
+        await delete_cached(_active_subscription_key(organization_id))
+    
     async def get_usage_summary(self, organization_id: UUID) -> Dict[str, Any]:
         """Get current usage vs limits."""
-        subscription = await self.get_active_subscription(organization_id)
+        # Only the columns the summary reads, straight from the join, with
+        # the usage counts as scalar subqueries: one round-trip in total.
+        query = select(
+            *self._usage_counts(organization_id),
+            Subscription.current_storage_mb,
+            SubscriptionPlan.name,
+            SubscriptionPlan.code,
+            SubscriptionPlan.max_users,
+            SubscriptionPlan.max_teams,
+            SubscriptionPlan.max_storage_gb,
+            SubscriptionPlan.max_leads,
+            SubscriptionPlan.max_contacts,
+            SubscriptionPlan.max_deals,
+            SubscriptionPlan.max_tickets,
+            SubscriptionPlan.max_products,
+            SubscriptionPlan.max_api_calls_per_day,
+            SubscriptionPlan.features,
+        ).join(
+            SubscriptionPlan, Subscription.plan_id == SubscriptionPlan.id
+        ).where(
+            Subscription.organization_id == organization_id,
+            Subscription.status.in_([
+                SubscriptionStatus.ACTIVE.value,
+                SubscriptionStatus.TRIAL.value
+            ])
+        ).order_by(Subscription.created_at.desc()).limit(1)
         
-        if not subscription or not subscription.plan:
+        row = (await self.db.execute(query)).first()
+        if row is None:
             return {"error": "No active subscription"}
         
-        plan = subscription.plan
-        
-        # Count current usage
-        user_count = await self._count_users(organization_id)
-        team_count = await self._count_teams(organization_id)
+        user_count, team_count = row.user_count or 0, row.team_count or 0
         
         return {
-            "plan_name": plan.name,
-            "plan_code": plan.code,
+            "plan_name": row.name,
+            "plan_code": row.code,
             "usage": {
                 "users": {
                     "current": user_count,
-                    "limit": plan.max_users,
-                    "percentage": round(user_count / plan.max_users * 100, 1) if plan.max_users > 0 else 0,
+                    "limit": row.max_users,
+                    "percentage": round(user_count / row.max_users * 100, 1) if row.max_users > 0 else 0,
                 },
                 "teams": {
                     "current": team_count,
-                    "limit": plan.max_teams,
-                    "percentage": round(team_count / plan.max_teams * 100, 1) if plan.max_teams > 0 else 0,
+                    "limit": row.max_teams,
+                    "percentage": round(team_count / row.max_teams * 100, 1) if row.max_teams > 0 else 0,
                 },
                 "storage": {
-                    "current_mb": float(subscription.current_storage_mb or 0),
-                    "limit_gb": plan.max_storage_gb,
-                    "percentage": round(float(subscription.current_storage_mb or 0) / (plan.max_storage_gb * 1024) * 100, 1) if plan.max_storage_gb > 0 else 0,
+                    "current_mb": float(row.current_storage_mb or 0),
+                    "limit_gb": row.max_storage_gb,
+                    "percentage": round(float(row.current_storage_mb or 0) / (row.max_storage_gb * 1024) * 100, 1) if row.max_storage_gb > 0 else 0,
                 },
             },
             "limits": {
-                "max_leads": plan.max_leads,
-                "max_contacts": plan.max_contacts,
-                "max_deals": plan.max_deals,
-                "max_tickets": plan.max_tickets,
-                "max_products": plan.max_products,
-                "max_api_calls_per_day": plan.max_api_calls_per_day,
+                "max_leads": row.max_leads,
+                "max_contacts": row.max_contacts,
+                "max_deals": row.max_deals,
+                "max_tickets": row.max_tickets,
+                "max_products": row.max_products,
+                "max_api_calls_per_day": row.max_api_calls_per_day,
             },
-            "features": plan.features,
+            "features": row.features,
         }
     
-    async def _count_users(self, organization_id: UUID) -> int:
-        """Count active users in organization."""
-        query = select(func.count()).select_from(User).where(
+    @staticmethod
+    def _usage_counts(organization_id: UUID) -> Tuple[Any, Any]:
+        """Scalar subqueries counting active users and teams in organization."""
+        user_count = select(func.count()).select_from(User).where(
             User.organization_id == organization_id,
             User.is_active == True
-        )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-    
-    async def _count_teams(self, organization_id: UUID) -> int:
-        """Count active teams in organization."""
-        query = select(func.count()).select_from(Team).where(
+        ).scalar_subquery().label("user_count")
+        team_count = select(func.count()).select_from(Team).where(
             Team.organization_id == organization_id
-        )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+        ).scalar_subquery().label("team_count")
+        return user_count, team_count
+    
+    async def _count_usage(self, organization_id: UUID) -> Tuple[int, int]:
+        """Count active users and teams in organization with one query."""
+        result = await self.db.execute(select(*self._usage_counts(organization_id)))
+        users, teams = result.one()
+        return users or 0, teams or 0
     
     async def upgrade_subscription(
         self,
@@ -153,16 +378,15 @@ class SubscriptionService:
     ) -> Dict[str, Any]:
         """Validate if downgrade is possible."""
         issues = []
+        user_count, team_count = await self._count_usage(organization_id)
         
         # Check user count
-        user_count = await self._count_users(organization_id)
         if user_count > target_plan.max_users:
             issues.append(
                 f"Current users ({user_count}) exceeds new plan limit ({target_plan.max_users})"
             )
         
         # Check team count
-        team_count = await self._count_teams(organization_id)
         if team_count > target_plan.max_teams:
             issues.append(
                 f"Current teams ({team_count}) exceeds new plan limit ({target_plan.max_teams})"
@@ -179,14 +403,30 @@ class SubscriptionService:
         new_plan: SubscriptionPlan,
     ) -> Subscription:
         """Schedule downgrade at end of billing period."""
-        # Store pending change in extra_data
-        subscription.extra_data = subscription.extra_data or {}
-        subscription.extra_data["pending_downgrade"] = {
+        pending = {
             "new_plan_id": str(new_plan.id),
             "scheduled_at": datetime.utcnow().isoformat(),
         }
         
-        await self.db.flush()
+        # Patch only the pending_downgrade key server-side rather than
+        # writing the whole extra_data document back.
+        await self.db.execute(
+            update(Subscription)
+            .where(Subscription.id == subscription.id)
+            .values(
+                extra_data=func.jsonb_set(
+                    func.coalesce(Subscription.extra_data, cast({}, JSONB)),
+                    literal(["pending_downgrade"], ARRAY(Text)),
+                    cast(pending, JSONB),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        # Mirror the change on the loaded instance without marking it dirty
+        extra_data = dict(subscription.extra_data or {})
+        extra_data["pending_downgrade"] = pending
+        set_committed_value(subscription, "extra_data", extra_data)
         
         return subscription
     
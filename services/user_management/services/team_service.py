@@ -1,19 +1,84 @@
 """Team business logic service."""
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, insert, select, func, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from shared.cache import delete_cached, get_cached_bytes, set_cached_bytes
 from shared.models.team import Team, UserTeam, TeamRole, TeamType
+from shared.responses import dump_models
 from shared.schemas.team import TeamHierarchy, TeamStats
 
+HIERARCHY_CACHE_TTL = 5 * 60
+
+# Bulk membership insert: the user ids travel as one uuid[] parameter and are
+# expanded server-side, so the statement is the same for any batch size.
+# Timestamps are the server's now(), like TimestampMixin's defaults.
+_BULK_ADD_MEMBERS_SQL = text("""
+    INSERT INTO user_teams (
+        id, team_id, user_id, team_role, is_active, joined_at, added_by_id,
+        created_at, updated_at
+    )
+    SELECT gen_random_uuid(), :team_id, u.user_id, :team_role, true, now(),
+           :added_by_id, now(), now()
+    FROM unnest(:user_ids) AS u(user_id)
+    ON CONFLICT (team_id, user_id) DO NOTHING
+    RETURNING user_id
+""").bindparams(
+    bindparam("team_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("added_by_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("user_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+)
+
+
+def _hierarchy_cache_key(organization_id: UUID) -> str:
+    return f"team:hierarchy:{organization_id}"
+
+
+@lru_cache(maxsize=None)
+def _list_teams_stmt(by_type: bool, by_parent: bool, is_active: Optional[bool]):
+    """
+    List statement for one filter shape (12 in all). Optional filters are
+    only added when set, and is_active is a literal, so the planner can
+    still match the ix_teams_org_live partial index under a generic plan.
+    """
+    query = select(Team).where(
+        Team.organization_id == bindparam("organization_id"),
+        Team.deleted_at.is_(None)
+    )
+    if by_type:
+        query = query.where(Team.team_type == bindparam("team_type"))
+    if by_parent:
+        query = query.where(Team.parent_id == bindparam("parent_id"))
+    if is_active is not None:
+        query = query.where(Team.is_active == is_active)
+    return query.order_by(Team.name)
+
 
 class TeamService:
     """Service for team operations."""
     
+    # Hot lookups are built once; only the bound values change per call.
+    _GET_TEAM_STMT = select(Team).where(
+        Team.id == bindparam("team_id"),
+        Team.organization_id == bindparam("organization_id"),
+        Team.deleted_at.is_(None)
+    )
+    _GET_TEAM_BY_CODE_STMT = select(Team).where(
+        Team.code == bindparam("code"),
+        Team.organization_id == bindparam("organization_id"),
+        Team.deleted_at.is_(None)
+    )
+    _GET_MEMBER_STMT = select(UserTeam).where(
+        UserTeam.team_id == bindparam("team_id"),
+        UserTeam.user_id == bindparam("user_id")
+    )
     def __init__(self, db: AsyncSession):
         self.db = db
     
@@ -25,23 +90,16 @@ class TeamService:
         is_active: Optional[bool] = True,
     ) -> List[Team]:
         """List teams for an organization."""
-        query = select(Team).where(
-            Team.organization_id == organization_id,
-            Team.deleted_at.is_(None)
-        )
-        
+        params = {"organization_id": organization_id}
         if team_type:
-            query = query.where(Team.team_type == team_type)
-        
+            params["team_type"] = team_type
         if parent_id:
-            query = query.where(Team.parent_id == parent_id)
+            params["parent_id"] = parent_id
         
-        if is_active is not None:
-            query = query.where(Team.is_active == is_active)
-        
-        query = query.order_by(Team.name)
-        
-        result = await self.db.execute(query)
+        result = await self.db.execute(
+            _list_teams_stmt(bool(team_type), bool(parent_id), is_active),
+            params
+        )
         return list(result.scalars().all())
     
     async def get_team(
@@ -50,13 +108,10 @@ class TeamService:
         organization_id: UUID
     ) -> Optional[Team]:
         """Get a team by ID."""
-        query = select(Team).where(
-            Team.id == team_id,
-            Team.organization_id == organization_id,
-            Team.deleted_at.is_(None)
+        result = await self.db.execute(
+            self._GET_TEAM_STMT,
+            {"team_id": team_id, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def get_team_by_code(
@@ -65,13 +120,10 @@ class TeamService:
         code: str
     ) -> Optional[Team]:
         """Get team by code."""
-        query = select(Team).where(
-            Team.code == code,
-            Team.organization_id == organization_id,
-            Team.deleted_at.is_(None)
+        result = await self.db.execute(
+            self._GET_TEAM_BY_CODE_STMT,
+            {"code": code, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def get_team_with_members(
@@ -79,9 +131,14 @@ class TeamService:
         team_id: UUID,
         organization_id: UUID
     ) -> Optional[Team]:
-        """Get team with members loaded."""
+        """
+        Get team with members loaded.
+        Everything TeamDetailResponse reads is loaded up front, so building the
+        response never triggers a lazy load on the async session.
+        """
         query = select(Team).options(
-            selectinload(Team.user_teams).selectinload(UserTeam.user)
+            selectinload(Team.user_teams).selectinload(UserTeam.user),
+            selectinload(Team.children)
         ).where(
             Team.id == team_id,
             Team.organization_id == organization_id,
@@ -103,7 +160,8 @@ class TeamService:
         settings: Optional[Dict] = None,
     ) -> Team:
         """Create a new team."""
-        team = Team(
+        # INSERT ... RETURNING hands back the row with its defaults in one round-trip
+        stmt = insert(Team).values(
             organization_id=organization_id,
             name=name,
             code=code,
@@ -112,21 +170,28 @@ class TeamService:
             parent_id=parent_id,
             lead_user_id=lead_user_id,
             settings=settings or {},
-        )
-        
-        self.db.add(team)
-        await self.db.flush()
+        ).returning(Team)
         
-        return team
+        result = await self.db.scalars(stmt)
+        return result.one()
     
     async def update_team(self, team: Team, data: Dict[str, Any]) -> Team:
         """Update team fields."""
-        for key, value in data.items():
-            if hasattr(team, key) and value is not None:
-                setattr(team, key, value)
+        values = {
+            key: value for key, value in data.items()
+            if hasattr(Team, key) and value is not None
+        }
+        if not values:
+            return team
         
-        await self.db.flush()
-        return team
+        result = await self.db.execute(
+            update(Team)
+            .where(Team.id == team.id)
+            .values(**values)
+            .returning(Team)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one()
     
     async def delete_team(self, team: Team) -> None:
         """Soft delete a team."""
@@ -150,21 +215,49 @@ class TeamService:
         user_id: UUID,
         role: TeamRole = TeamRole.MEMBER,
         added_by_id: Optional[UUID] = None,
-    ) -> UserTeam:
-        """Add a member to a team."""
-        member = UserTeam(
+    ) -> Optional[UserTeam]:
+        """
+        Add a member to a team.
+        Returns None if the user already has a membership row for the team.
+        """
+        stmt = pg_insert(UserTeam).values(
             team_id=team_id,
             user_id=user_id,
             team_role=role,
             is_active=True,
-            joined_at=datetime.utcnow(),
+            joined_at=func.now(),
             added_by_id=added_by_id,
-        )
+        ).on_conflict_do_nothing(
+            index_elements=["team_id", "user_id"]
+        ).returning(UserTeam)
         
-        self.db.add(member)
-        await self.db.flush()
+        result = await self.db.scalars(stmt)
+        return result.one_or_none()
+    
+    async def bulk_add_members(
+        self,
+        team_id: UUID,
+        user_ids: List[UUID],
+        role: TeamRole = TeamRole.MEMBER,
+        added_by_id: Optional[UUID] = None,
+    ) -> List[UUID]:
+        """
+        Add several members to a team in one statement.
+        Users that are already members are skipped; returns the ids actually added.
+        """
+        if not user_ids:
+            return []
         
-        return member
+        result = await self.db.execute(
+            _BULK_ADD_MEMBERS_SQL,
+            {
+                "team_id": team_id,
+                "user_ids": list(user_ids),
+                "team_role": TeamRole(role).value,
+                "added_by_id": added_by_id,
+            },
+        )
+        return list(result.scalars().all())
     
     async def get_team_member(
         self,
@@ -172,12 +265,10 @@ class TeamService:
         user_id: UUID
     ) -> Optional[UserTeam]:
         """Get team member."""
-        query = select(UserTeam).where(
-            UserTeam.team_id == team_id,
-            UserTeam.user_id == user_id
+        result = await self.db.execute(
+            self._GET_MEMBER_STMT,
+            {"team_id": team_id, "user_id": user_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def remove_member(self, member: UserTeam) -> None:
@@ -192,12 +283,21 @@ class TeamService:
         data: Dict[str, Any]
     ) -> UserTeam:
         """Update team member."""
-        for key, value in data.items():
-            if hasattr(member, key) and value is not None:
-                setattr(member, key, value)
+        values = {
+            key: value for key, value in data.items()
+            if hasattr(UserTeam, key) and value is not None
+        }
+        if not values:
+            return member
         
-        await self.db.flush()
-        return member
+        result = await self.db.execute(
+            update(UserTeam)
+            .where(UserTeam.id == member.id)
+            .values(**values)
+            .returning(UserTeam)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one()
     
     async def get_team_hierarchy(
         self,
@@ -207,57 +307,81 @@ class TeamService:
         # Get all teams
         teams = await self.list_teams(organization_id)
         
-        # Build tree
-        team_dict = {team.id: team for team in teams}
-        roots = []
+        # Active member counts for every team in one grouped query
+        count_query = select(UserTeam.team_id, func.count()).join(
+            Team, Team.id == UserTeam.team_id
+        ).where(
+            Team.organization_id == organization_id,
+            UserTeam.is_active == True
+        ).group_by(UserTeam.team_id)
+        member_counts = dict((await self.db.execute(count_query)).all())
         
+        # Index children by parent once so the tree builds in O(n)
+        children_by_parent: Dict[Optional[UUID], List[Team]] = defaultdict(list)
         for team in teams:
-            if team.parent_id is None:
-                roots.append(self._build_hierarchy_node(team, team_dict))
+            children_by_parent[team.parent_id].append(team)
+        
+        return [
+            self._build_hierarchy_node(team, children_by_parent, member_counts)
+            for team in children_by_parent[None]
+        ]
+    
+    async def get_team_hierarchy_json(self, organization_id: UUID) -> bytes:
+        """Get the serialized team hierarchy, cached in Redis per organization."""
+        key = _hierarchy_cache_key(organization_id)
+        cached = await get_cached_bytes(key)
+        if cached is not None:
+            return cached
         
-        return roots
+        body = dump_models(await self.get_team_hierarchy(organization_id))
+        await set_cached_bytes(key, body, HIERARCHY_CACHE_TTL)
+        return body
+    
+    @staticmethod
+    async def invalidate_hierarchy_cache(organization_id: UUID) -> None:
+        """Drop the cached hierarchy. Call after teams or memberships change."""
+        await delete_cached(_hierarchy_cache_key(organization_id))
     
     def _build_hierarchy_node(
         self,
         team: Team,
-        team_dict: Dict[UUID, Team]
+        children_by_parent: Dict[Optional[UUID], List[Team]],
+        member_counts: Dict[UUID, int]
     ) -> TeamHierarchy:
-        """Build a hierarchy node recursively."""
-        children = []
-        for t in team_dict.values():
-            if t.parent_id == team.id:
-                children.append(self._build_hierarchy_node(t, team_dict))
+        """
+        Build a hierarchy node recursively.
+        Fields come straight from loaded rows, so nodes skip validation.
+        """
+        children = [
+            self._build_hierarchy_node(child, children_by_parent, member_counts)
+            for child in children_by_parent.get(team.id, ())
+        ]
         
-        return TeamHierarchy(
+        return TeamHierarchy.model_construct(
             id=team.id,
             name=team.name,
             team_type=team.team_type,
-            member_count=len([m for m in (team.user_teams or []) if m.is_active]),
+            member_count=member_counts.get(team.id, 0),
             children=children,
         )
     
     async def get_team_stats(self, team_id: UUID) -> TeamStats:
         """Get team statistics."""
-        # Count members
-        member_query = select(func.count()).select_from(UserTeam).where(
+        # All member counts in one pass over the team's memberships
+        query = select(
+            func.count(),
+            func.count().filter(UserTeam.is_active == True),
+            func.count().filter(
+                UserTeam.is_active == True,
+                UserTeam.team_role == TeamRole.LEADER
+            ),
+        ).select_from(UserTeam).where(
             UserTeam.team_id == team_id
         )
-        total_members = (await self.db.execute(member_query)).scalar() or 0
         
-        active_query = select(func.count()).select_from(UserTeam).where(
-            UserTeam.team_id == team_id,
-            UserTeam.is_active == True
-        )
-        active_members = (await self.db.execute(active_query)).scalar() or 0
-        
-        leader_query = select(func.count()).select_from(UserTeam).where(
-            UserTeam.team_id == team_id,
-            UserTeam.team_role == TeamRole.LEADER,
-            UserTeam.is_active == True
-        )
-        leaders = (await self.db.execute(leader_query)).scalar() or 0
+        total_members, active_members, leaders = (await self.db.execute(query)).one()
         
-        return TeamStats(
+        return TeamStats.model_construct(
             total_members=total_members,
             active_members=active_members,
             leaders=leaders,
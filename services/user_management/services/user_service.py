@@ -1,12 +1,19 @@
 """User business logic service."""
+import asyncio
+import hashlib
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import bindparam, insert, select, func, and_, or_, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
+from shared.cache import get_cached_bytes, set_cached_bytes
+from shared.database import gather_reads
 from shared.models.user import User, UserOrganizationRole, UserStatus
 from shared.models.organization import Organization
 from shared.models.role import Role
@@ -14,25 +21,62 @@ from shared.models.auth import Invitation, InvitationStatus
 from shared.models.team import Team, UserTeam
 from shared.schemas.user import UserListFilter
 from shared.schemas.common import PaginatedResponse
-from shared.security.password import hash_password, verify_password
+from shared.security.password import hash_password_async, hash_token, verify_password_async
+from shared.utils.helpers import normalize_email
+from shared.utils.pagination import decode_cursor, encode_cursor
+
+# Filtered list totals are cached briefly: a count runs the whole filtered
+# query to completion, and a slightly stale total is fine for paging.
+USER_COUNT_CACHE_TTL = 30
+
+# Rows fetched per round-trip when scanning legacy bcrypt invitation hashes.
+LEGACY_INVITATION_BATCH_SIZE = 128
+# Legacy hashes verified at once in worker threads; bcrypt releases the GIL.
+LEGACY_INVITATION_VERIFY_CONCURRENCY = 8
+
+
+# Columns update_user may write; identity, credentials and timestamps are
+# managed elsewhere.
+_USER_UPDATABLE_FIELDS = frozenset(User.__table__.columns.keys()) - {
+    "id", "organization_id", "password_hash", "created_at", "updated_at",
+}
+
+
+def _user_count_key(organization_id: UUID, filters: Optional[UserListFilter]) -> str:
+    filters_json = filters.model_dump_json() if filters else "{}"
+    digest = hashlib.blake2b(filters_json.encode(), digest_size=16).hexdigest()
+    return f"users:count:{organization_id}:{digest}"
 
 
 class UserService:
     """Service for user operations."""
     
+    _GET_USER_STMT = select(User).where(User.id == bindparam("user_id"))
+    _GET_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+    _GET_ORGANIZATION_USER_STMT = select(User).where(
+        User.id == bindparam("user_id"),
+        User.organization_id == bindparam("organization_id")
+    )
+    _GET_PENDING_INVITATION_STMT = select(Invitation).where(
+        Invitation.organization_id == bindparam("organization_id"),
+        Invitation.email == bindparam("email"),
+        Invitation.status == InvitationStatus.PENDING.value,
+        Invitation.expires_at > func.now()
+    )
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._GET_USER_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
-        query = select(User).where(User.email == email.lower())
-        result = await self.db.execute(query)
+        result = await self.db.execute(
+            self._GET_USER_BY_EMAIL_STMT, {"email": normalize_email(email)}
+        )
         return result.scalar_one_or_none()
     
     async def create_user(
@@ -48,8 +92,8 @@ class UserService:
     ) -> User:
         """Create a new user."""
         user = User(
-            email=email.lower(),
-            password_hash=hash_password(password),
+            email=email,
+            password_hash=await hash_password_async(password),
             organization_id=organization_id,
             first_name=first_name,
             last_name=last_name,
@@ -68,7 +112,7 @@ class UserService:
     async def update_user(self, user: User, data: Dict[str, Any]) -> User:
         """Update user fields."""
         for key, value in data.items():
-            if hasattr(user, key) and value is not None:
+            if value is not None and key in _USER_UPDATABLE_FIELDS:
                 setattr(user, key, value)
         
         await self.db.flush()
@@ -81,19 +125,26 @@ class UserService:
         role_id: Optional[UUID] = None,
     ) -> UserOrganizationRole:
         """Add user to an organization with a role."""
-        # Since user belongs to one organization, update the user record
-        user = await self.get_user_by_id(user_id)
-        if user:
-            user.organization_id = organization_id
-            await self.db.flush()
-
-        user_role = UserOrganizationRole(
+        # Pending rows (a just-created user, the organization) must exist
+        # before the statement below references them.
+        await self.db.flush()
+        
+        # Since user belongs to one organization, move the user and insert
+        # the role in one statement: UPDATE as a CTE, INSERT ... RETURNING.
+        move_user = update(User).where(
+            User.id == user_id
+        ).values(organization_id=organization_id).cte("move_user")
+        
+        stmt = insert(UserOrganizationRole).values(
             user_id=user_id,
             role_id=role_id
-        )
+        ).add_cte(move_user).returning(UserOrganizationRole)
+        user_role = (await self.db.scalars(stmt)).one()
         
-        self.db.add(user_role)
-        await self.db.flush()
+        # Keep an already-loaded user in step without another UPDATE
+        user = self.db.identity_map.get(identity_key(User, user_id))
+        if user is not None:
+            set_committed_value(user, "organization_id", organization_id)
         
         return user_role
     
@@ -104,7 +155,7 @@ class UserService:
     ) -> Optional[UserOrganizationRole]:
         """Get user's role in an organization."""
         query = select(UserOrganizationRole).options(
-            selectinload(UserOrganizationRole.role)
+            joinedload(UserOrganizationRole.role)
         ).join(User).where(
             UserOrganizationRole.user_id == user_id,
             User.organization_id == organization_id
@@ -114,18 +165,39 @@ class UserService:
     
     async def get_user_organizations(self, user_id: UUID) -> List[Dict]:
         """Get all organizations a user belongs to (currently only one)."""
-        query = select(User).options(
-            selectinload(User.organization),
-            selectinload(User.user_roles).selectinload(UserOrganizationRole.role)
+        # One row per role, flattened by joins instead of loading the user graph
+        query = select(
+            User.organization_id,
+            Organization.name,
+            UserOrganizationRole.role_id,
+            Role.name,
+        ).select_from(User).join(
+            Organization, Organization.id == User.organization_id
+        ).join(
+            UserOrganizationRole, UserOrganizationRole.user_id == User.id
+        ).join(
+            Role, Role.id == UserOrganizationRole.role_id
         ).where(
             User.id == user_id,
             User.is_active == True
         )
         
         result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
-        
-        if not user or not user.organization:
+        return [
+            {
+                "organization_id": organization_id,
+                "organization_name": organization_name,
+                "role_id": str(role_id),
+                "role_name": role_name,
+                "is_primary": True,
+            }
+            for organization_id, organization_name, role_id, role_name in result.all()
+        ]
+    
+    @staticmethod
+    def organizations_for(user: User) -> List[Dict]:
+        """Build organization entries from a user with organization and roles loaded."""
+        if not user.is_active or not user.organization:
             return []
         
         # We take the first role as primary for now, or all roles
@@ -140,14 +212,45 @@ class UserService:
             for ur in user.user_roles
         ]
     
+    async def get_user_with_context(
+        self,
+        user_id: UUID,
+        organization_id: Optional[UUID] = None
+    ) -> Tuple[Optional[User], List[Dict]]:
+        """
+        Load a user with organization and roles, plus their teams in the
+        given organization, concurrently when the pool allows.
+        Roles are joined rather than selectin-loaded: a user has only a
+        handful, so one round-trip beats a follow-up query per level.
+        """
+        query = select(User).options(
+            joinedload(User.organization),
+            joinedload(User.user_roles).joinedload(UserOrganizationRole.role)
+        ).where(User.id == user_id)
+        
+        async def load_user(db: AsyncSession) -> Optional[User]:
+            result = await db.execute(query)
+            return result.unique().scalar_one_or_none()
+        
+        if organization_id is None:
+            return await load_user(self.db), []
+        
+        user, teams = await gather_reads(
+            self.db,
+            load_user,
+            lambda db: UserService(db).get_user_teams(user_id, organization_id),
+        )
+        
+        return user, teams
+    
     async def get_user_teams(
         self,
         user_id: UUID,
         organization_id: UUID
     ) -> List[Dict]:
         """Get user's teams in an organization."""
-        query = select(UserTeam).options(
-            selectinload(UserTeam.team)
+        query = select(
+            UserTeam.team_id, Team.name, UserTeam.team_role
         ).join(
             Team, Team.id == UserTeam.team_id
         ).where(
@@ -156,15 +259,14 @@ class UserService:
         )
         
         result = await self.db.execute(query)
-        memberships = result.scalars().all()
         
         return [
             {
-                "team_id": str(m.team_id),
-                "team_name": m.team.name if m.team else None,
-                "role": m.team_role,
+                "team_id": str(team_id),
+                "team_name": team_name,
+                "role": team_role,
             }
-            for m in memberships
+            for team_id, team_name, team_role in result
         ]
     
     async def list_organization_users(
@@ -173,10 +275,20 @@ class UserService:
         page: int = 1,
         page_size: int = 20,
         filters: Optional[UserListFilter] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedResponse:
-        """List users in an organization with pagination."""
-        # Base query
-        query = select(User).where(
+        """
+        List users in an organization with pagination.
+        With a cursor (the next_cursor of a previous page) rows are fetched
+        by keyset on (created_at, id) instead of OFFSET, so deep pages cost
+        the same as the first.
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Filters and paging run over ids only; full rows are joined in for
+        # the final page, so skipped rows never have their columns read.
+        query = select(User.id).where(
             User.organization_id == organization_id
         )
         
@@ -198,23 +310,63 @@ class UserService:
             if filters.is_active is not None:
                 query = query.where(User.is_active == filters.is_active)
         
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar() or 0
+        # Count total; on a cache miss an offset page carries it as a window
+        # count, evaluated before LIMIT, instead of a second query.
+        count_key = _user_count_key(organization_id, filters)
+        cached_total = await get_cached_bytes(count_key)
+        total = int(cached_total) if cached_total is not None else None
+        filtered = query
         
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size).order_by(User.created_at.desc())
+        # Apply pagination; id breaks created_at ties so the order is stable
+        order = (User.created_at.desc(), User.id.desc())
+        query = query.order_by(*order)
+        if cursor:
+            last_created_at, last_id = decode_cursor(cursor)
+            query = query.where(tuple_(User.created_at, User.id) < (last_created_at, last_id))
+        else:
+            query = query.offset((page - 1) * page_size)
         
-        result = await self.db.execute(query)
-        users = result.scalars().all()
+        windowed = total is None and not cursor
+        if windowed:
+            query = query.add_columns(func.count().over().label("total"))
+        
+        # One extra row tells whether another page follows
+        page_ids = query.limit(page_size + 1).subquery()
+        page_query = select(User).join(page_ids, User.id == page_ids.c.id).order_by(*order)
+        if windowed:
+            rows = (await self.db.execute(page_query.add_columns(page_ids.c.total))).all()
+            users = [user for user, _ in rows]
+            if rows:
+                total = rows[0].total
+        else:
+            users = list((await self.db.scalars(page_query)).all())
         
-        return PaginatedResponse.create(
+        if total is None:
+            # Keyset page, or an offset past the last row
+            count_query = select(func.count()).select_from(filtered.subquery())
+            total = (await self.db.execute(count_query)).scalar() or 0
+        if cached_total is None:
+            await set_cached_bytes(count_key, str(total).encode(), USER_COUNT_CACHE_TTL)
+        
+        has_more = len(users) > page_size
+        users = users[:page_size]
+        
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+        
+        response = PaginatedResponse.create(
             items=users,
             total=total,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor
         )
+        if cursor:
+            # Page numbers don't apply to keyset pages
+            response.has_next = has_more
+            response.has_prev = True
+        return response
     
     async def get_organization_user(
         self,
@@ -222,12 +374,10 @@ class UserService:
         user_id: UUID
     ) -> Optional[User]:
         """Get a user if they belong to the organization."""
-        query = select(User).where(
-            User.id == user_id,
-            User.organization_id == organization_id
+        result = await self.db.execute(
+            self._GET_ORGANIZATION_USER_STMT,
+            {"user_id": user_id, "organization_id": organization_id}
         )
-        
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
     async def create_invitation(
@@ -246,7 +396,7 @@ class UserService:
         """Create an invitation."""
         invitation = Invitation(
             organization_id=organization_id,
-            email=email.lower(),
+            email=email,
             first_name=first_name,
             last_name=last_name,
             role_id=role_id,
@@ -269,31 +419,97 @@ class UserService:
         email: str
     ) -> Optional[Invitation]:
         """Get pending invitation for email in organization."""
-        query = select(Invitation).where(
+        result = await self.db.execute(
+            self._GET_PENDING_INVITATION_STMT,
+            {
+                "organization_id": organization_id,
+                "email": normalize_email(email),
+            }
+        )
+        return result.scalar_one_or_none()
+    
+    async def get_invite_conflicts(
+        self,
+        organization_id: UUID,
+        email: str
+    ) -> Tuple[bool, bool]:
+        """
+        Check in one query whether the email already belongs to a member of
+        the organization and whether an invitation for it is still pending.
+        """
+        email = normalize_email(email)
+        is_member = select(UserOrganizationRole.id).join(
+            User, User.id == UserOrganizationRole.user_id
+        ).where(
+            User.email == email,
+            User.organization_id == organization_id
+        ).exists()
+        has_pending = select(Invitation.id).where(
             Invitation.organization_id == organization_id,
-            Invitation.email == email.lower(),
+            Invitation.email == email,
             Invitation.status == InvitationStatus.PENDING.value,
-            Invitation.expires_at > datetime.utcnow()
-        )
+            Invitation.expires_at > func.now()
+        ).exists()
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        result = await self.db.execute(select(is_member, has_pending))
+        member, pending = result.one()
+        return member, pending
     
     async def find_valid_invitation(self, token: str) -> Optional[Invitation]:
         """Find valid invitation by token."""
-        # Get all pending invitations
-        query = select(Invitation).where(
+        live = (
             Invitation.status == InvitationStatus.PENDING.value,
-            Invitation.expires_at > datetime.utcnow()
+            Invitation.expires_at > func.now()
         )
         
-        result = await self.db.execute(query)
-        invitations = result.scalars().all()
+        # Tokens are stored as a deterministic HMAC, so the unique index on
+        # token_hash finds the invitation directly.
+        result = await self.db.execute(
+            select(Invitation).where(Invitation.token_hash == hash_token(token), *live)
+        )
+        invitation = result.scalar_one_or_none()
+        if invitation is not None:
+            return invitation
         
-        # Check each invitation's token hash
-        for invitation in invitations:
-            if verify_password(token, invitation.token_hash):
-                return invitation
+        # Invitations issued before the switch still carry a salted bcrypt
+        # hash, which can only be checked row by row. Stream them so the scan
+        # stops at the first match without loading every candidate, and check
+        # each batch in worker threads so bcrypt doesn't block the event loop.
+        result = await self.db.stream_scalars(
+            select(Invitation).where(
+                Invitation.token_hash.startswith("$2"), *live
+            ).execution_options(yield_per=LEGACY_INVITATION_BATCH_SIZE)
+        )
+        try:
+            async for batch in result.partitions(LEGACY_INVITATION_VERIFY_CONCURRENCY):
+                invitation = await self._first_verified_invitation(token, batch)
+                if invitation is not None:
+                    return invitation
+        finally:
+            await result.close()
+        
+        return None
+    
+    @staticmethod
+    async def _first_verified_invitation(
+        token: str,
+        invitations: List[Invitation]
+    ) -> Optional[Invitation]:
+        """Verify bcrypt-hashed invitations concurrently; return the first match."""
+        pending = {
+            asyncio.create_task(verify_password_async(token, invitation.token_hash)): invitation
+            for invitation in invitations
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    invitation = pending.pop(task)
+                    if task.result():
+                        return invitation
+        finally:
+            for task in pending:
+                task.cancel()
         
         return None
     
@@ -304,8 +520,6 @@ class UserService:
         role: str = "member"
     ) -> UserTeam:
         """Add user to a team."""
-        from shared.models.team import TeamRole
-        
         team_member = UserTeam(
             team_id=team_id,
             user_id=user_id,
@@ -318,3 +532,28 @@ class UserService:
         await self.db.flush()
         
         return team_member
+    
+    async def add_user_to_teams_bulk(
+        self,
+        user_id: UUID,
+        team_ids: List[UUID],
+        role: str = "member"
+    ) -> None:
+        """Add user to several teams with one INSERT, skipping existing memberships."""
+        if not team_ids:
+            return
+        
+        # joined_at is the server's now(); the column's Python default would
+        # bind a naive utcnow into the timestamptz column
+        stmt = pg_insert(UserTeam).values([
+            {
+                "team_id": team_id,
+                "user_id": user_id,
+                "team_role": role,
+                "is_active": True,
+                "joined_at": func.now(),
+            }
+            for team_id in dict.fromkeys(team_ids)
+        ]).on_conflict_do_nothing(index_elements=["team_id", "user_id"])
+        
+        await self.db.execute(stmt)
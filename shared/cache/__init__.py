@@ -0,0 +1,24 @@
+"""Cache module exports."""
+from shared.cache.permissions import (
+    get_cached_role_permissions,
+    invalidate_role_permissions,
+    set_cached_role_permissions,
+)
+from shared.cache.redis_cache import (
+    close_redis,
+    delete_cached,
+    get_cached_bytes,
+    get_redis,
+    set_cached_bytes,
+)
+
+__all__ = [
+    "close_redis",
+    "delete_cached",
+    "get_cached_bytes",
+    "get_cached_role_permissions",
+    "get_redis",
+    "invalidate_role_permissions",
+    "set_cached_bytes",
+    "set_cached_role_permissions",
+]
@@ -0,0 +1,35 @@
+"""Cached role -> permission code lookups shared by the auth and user services."""
+from typing import List, Optional
+from uuid import UUID
+
+import orjson
+
+from shared.cache.redis_cache import delete_cached, get_cached_bytes, set_cached_bytes
+
+ROLE_PERMISSIONS_CACHE_TTL = 10 * 60
+
+
+def _role_permissions_key(role_id: UUID) -> str:
+    return f"perms:role:{role_id}"
+
+
+async def get_cached_role_permissions(role_id: UUID) -> Optional[List[str]]:
+    """Get a role's permission codes from the cache, or None on a miss."""
+    cached = await get_cached_bytes(_role_permissions_key(role_id))
+    if cached is None:
+        return None
+    return orjson.loads(cached)
+
+
+async def set_cached_role_permissions(role_id: UUID, permissions: List[str]) -> None:
+    """Cache a role's permission codes."""
+    await set_cached_bytes(
+        _role_permissions_key(role_id),
+        orjson.dumps(permissions),
+        ROLE_PERMISSIONS_CACHE_TTL,
+    )
+
+
+async def invalidate_role_permissions(role_id: UUID) -> None:
+    """Drop a role's cached permissions. Call after its permissions change."""
+    await delete_cached(_role_permissions_key(role_id))
@@ -0,0 +1,58 @@
+"""Redis-backed cache helpers shared by all services."""
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Get the process-wide Redis client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = aioredis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the Redis client (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_cached_bytes(key: str) -> Optional[bytes]:
+    """
+    Get a cached value.
+    Redis errors are logged and treated as a cache miss.
+    """
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        logger.warning("Cache read failed for %s", key, exc_info=True)
+        return None
+
+
+async def set_cached_bytes(key: str, value: bytes, ttl: int) -> None:
+    """Store a value with a TTL in seconds. Errors are logged and ignored."""
+    try:
+        await get_redis().set(key, value, ex=ttl)
+    except RedisError:
+        logger.warning("Cache write failed for %s", key, exc_info=True)
+
+
+async def delete_cached(*keys: str) -> None:
+    """Delete cached keys. Errors are logged and ignored."""
+    if not keys:
+        return
+    try:
+        await get_redis().delete(*keys)
+    except RedisError:
+        logger.warning("Cache delete failed for %s", ", ".join(keys), exc_info=True)
@@ -2,9 +2,13 @@
 from shared.database.base import Base
 from shared.database.session import (
     AsyncSessionLocal,
+    after_commit,
+    close_db,
+    gather_reads,
     get_async_session,
     get_db,
     init_db,
+    warm_pool,
 )
 from shared.database.multi_tenant import (
     TenantContext,
@@ -16,9 +20,13 @@ from shared.database.multi_tenant import (
 __all__ = [
     "Base",
     "AsyncSessionLocal",
+    "after_commit",
+    "close_db",
+    "gather_reads",
     "get_async_session",
     "get_db",
     "init_db",
+    "warm_pool",
     "TenantContext",
     "get_tenant_id",
     "set_tenant_id",
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, String, event
+from sqlalchemy import Boolean, Column, DateTime, event, false, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
@@ -31,15 +31,22 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
     
+    # Timestamps are rendered as now() in the statement rather than bound from
+    # Python; eager defaults read them back through RETURNING so they are
+    # loaded after a flush instead of expired.
+    __mapper_args__ = {"eager_defaults": True}
+    
     created_at = Column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        default=func.now(),
+        server_default=func.now(),
         nullable=False
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -59,7 +66,7 @@ class SoftDeleteMixin:
     """Mixin for soft delete functionality."""
     
     deleted_at = Column(DateTime(timezone=True), nullable=True)
-    is_deleted = Column(String, default=False, nullable=False)
+    is_deleted = Column(Boolean, default=False, server_default=false(), nullable=False)
     
     def soft_delete(self):
         """Mark record as deleted."""
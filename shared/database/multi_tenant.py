@@ -1,10 +1,13 @@
 """Multi-tenant database utilities."""
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from sqlalchemy import event
-from sqlalchemy.orm import Query, Session
+from sqlalchemy import Select, event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from shared.database.base import TenantMixin
 
 # Context variable for current tenant
 _tenant_id: ContextVar[Optional[UUID]] = ContextVar("tenant_id", default=None)
@@ -36,38 +39,47 @@ class TenantContext:
         set_tenant_id(self.previous_tenant_id)
 
 
-async def tenant_context(tenant_id: UUID):
+@asynccontextmanager
+async def tenant_context(tenant_id: UUID) -> AsyncIterator[None]:
     """Async context manager for tenant scope."""
-    previous_tenant_id = get_tenant_id()
-    set_tenant_id(tenant_id)
+    token = _tenant_id.set(tenant_id)
     try:
         yield
     finally:
-        set_tenant_id(previous_tenant_id)
+        _tenant_id.reset(token)
 
 
-def apply_tenant_filter(query: Query, model_class) -> Query:
+def apply_tenant_filter(query: Select, model_class) -> Select:
     """Apply tenant filter to query if model has organization_id."""
     tenant_id = get_tenant_id()
     if tenant_id and hasattr(model_class, 'organization_id'):
-        return query.filter(model_class.organization_id == tenant_id)
+        return query.where(model_class.organization_id == tenant_id)
     return query
 
 
-class TenantQuery(Query):
-    """Custom query class that automatically applies tenant filtering."""
-    
-    def __init__(self, entities, session=None):
-        super().__init__(entities, session)
-        self._apply_tenant_filter()
+@event.listens_for(Session, "do_orm_execute")
+def _add_tenant_criteria(execute_state: ORMExecuteState) -> None:
+    """
+    Scope ORM statements on TenantMixin models to the current tenant.
+    The tenant id is a closure variable of the criteria lambda, so it is
+    bound as a parameter and the compiled statement stays cacheable.
+    """
+    tenant_id = get_tenant_id()
+    if tenant_id is None:
+        return
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        # The parent statement already carries the criteria
+        return
+    if not (execute_state.is_select or execute_state.is_update or execute_state.is_delete):
+        return
     
-    def _apply_tenant_filter(self):
-        """Apply tenant filter if applicable."""
-        tenant_id = get_tenant_id()
-        if tenant_id:
-            for entity in self._entities:
-                if hasattr(entity, 'organization_id'):
-                    self = self.filter(entity.organization_id == tenant_id)
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            TenantMixin,
+            lambda cls: cls.organization_id == tenant_id,
+            include_aliases=True,
+        )
+    )
 
 
 def validate_tenant_access(organization_id: UUID) -> bool:
@@ -1,6 +1,7 @@
 """Database session management."""
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncGenerator, Awaitable, Callable, List
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -19,7 +20,17 @@ engine = create_async_engine(
     echo=settings.DATABASE_ECHO,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    # SQLAlchemy's compiled-SQL LRU; the default 500 is tight once every
+    # filter combination and loader option has its own entry
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    connect_args={
+        # Our queries are short indexed lookups; JIT compilation only adds latency
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+    },
 )
 
 # Create session factory
@@ -40,17 +51,77 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def close_db() -> None:
+    """Close all pooled connections on shutdown."""
+    await engine.dispose()
+
+
+async def warm_pool(size: int = settings.DATABASE_POOL_SIZE) -> None:
+    """Open pool connections up front so the first requests don't pay for connect."""
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    await asyncio.gather(*(_ping() for _ in range(size)))
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get async database session."""
+    """
+    Get async database session for a request.
+    The whole request runs in one transaction that commits once when the
+    endpoint returns and rolls back if it raises. Endpoints should flush,
+    not commit.
+    """
     async with AsyncSessionLocal() as session:
-        try:
+        async with session.begin():
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        
+        for callback, args in session.info.pop("after_commit", []):
+            await callback(*args)
+
+
+def after_commit(
+    session: AsyncSession,
+    callback: Callable[..., Awaitable[Any]],
+    *args: Any
+) -> None:
+    """
+    Run an async callback once the request transaction has committed.
+    Use for side effects such as cache invalidation that must not run
+    before the data they depend on is visible.
+    """
+    session.info.setdefault("after_commit", []).append((callback, args))
+
+
+def _idle_connections() -> int:
+    """Connections sitting idle in the pool, or 0 if the pool doesn't say."""
+    checkedin = getattr(engine.pool, "checkedin", None)
+    return checkedin() if checkedin else 0
+
+
+async def gather_reads(
+    session: AsyncSession,
+    *reads: Callable[[AsyncSession], Awaitable[Any]]
+) -> List[Any]:
+    """
+    Run independent reads and return their results in order.
+    The first read always runs on the given session, so anything it loads
+    can be modified there. The rest run concurrently on short-lived
+    sessions while the pool has idle connections for them; otherwise
+    everything runs one after another on the given session rather than
+    making a request wait for a second connection.
+    """
+    extra = len(reads) - 1
+    if extra <= 0 or _idle_connections() < extra:
+        return [await read(session) for read in reads]
+    
+    async with AsyncExitStack() as stack:
+        sessions = [session]
+        for _ in range(extra):
+            sessions.append(await stack.enter_async_context(AsyncSessionLocal()))
+        return list(await asyncio.gather(
+            *(read(read_session) for read, read_session in zip(reads, sessions))
+        ))
 
 
 @asynccontextmanager
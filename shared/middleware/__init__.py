@@ -1,13 +1,30 @@
 """Middleware module exports."""
 from shared.middleware.tenant import TenantMiddleware, get_current_tenant
-from shared.middleware.audit import AuditMiddleware, log_audit_event
+from shared.middleware.audit import (
+    AuditBuffer,
+    AuditMiddleware,
+    close_audit_buffers,
+    log_audit_event,
+)
 from shared.middleware.auth import AuthMiddleware, get_current_user
+from shared.middleware.combined import CombinedContextMiddleware
+from shared.middleware.context import (
+    RequestContext,
+    request_context,
+    request_context_with_permissions,
+)
 
 __all__ = [
     "TenantMiddleware",
     "get_current_tenant",
+    "AuditBuffer",
     "AuditMiddleware",
+    "close_audit_buffers",
     "log_audit_event",
     "AuthMiddleware",
     "get_current_user",
+    "CombinedContextMiddleware",
+    "RequestContext",
+    "request_context",
+    "request_context_with_permissions",
 ]
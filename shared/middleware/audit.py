@@ -1,19 +1,138 @@
 """Audit logging middleware."""
+import asyncio
 import json
-from datetime import datetime
-from typing import Any, Callable, Dict, Optional
-from uuid import UUID, uuid4
+import logging
+import os
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from shared.config import settings
 from shared.models.audit import AuditAction
 
+logger = logging.getLogger(__name__)
 
-class AuditMiddleware(BaseHTTPMiddleware):
+# Every buffer, so shutdown can flush them all
+_buffers: "weakref.WeakSet[AuditBuffer]" = weakref.WeakSet()
+
+_STOP = object()
+
+# Raw (lower-cased) header names read for audit entries
+_AUDIT_HEADERS = frozenset({b"x-forwarded-for", b"x-real-ip", b"user-agent"})
+
+_API_PREFIX = "/api/v1/"
+
+
+# (second, formatted second) for the last audit timestamp
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time in ISO format with millisecond precision, as
+    datetime.utcnow().isoformat() but formatting the date part once a second.
+    """
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    if _ts_cache[0] != second:
+        _ts_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_ts_cache[1]}.{int((now - second) * 1000):03d}"
+
+
+@lru_cache(maxsize=256)
+def _resource_type_for(segment: str) -> str:
+    """Resource type for a path's first segment; there are only a few distinct ones."""
+    return segment.rstrip("s")  # leads -> lead
+
+
+class AuditBuffer:
+    """
+    Queue audit entries and hand them to a sink in batches from a background
+    task, so requests never wait on the audit write. A batch is written once
+    it reaches batch_size or batch_ms after its first entry.
+    """
+    
+    def __init__(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        batch_size: int = settings.AUDIT_BATCH_SIZE,
+        batch_ms: int = settings.AUDIT_BATCH_MS,
+        maxsize: int = settings.AUDIT_QUEUE_SIZE,
+    ):
+        self._sink = sink
+        self.batch_size = batch_size
+        self.batch_timeout = batch_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        _buffers.add(self)
+    
+    def put(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry; it is dropped with a warning when the buffer is full."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flusher())
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            logger.warning("Audit buffer full, dropping entry")
+    
+    async def close(self) -> None:
+        """Write whatever is queued and stop the background task."""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+    
+    async def _flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self._queue.get()
+            if entry is _STOP:
+                return
+            batch = [entry]
+            deadline = loop.time() + self.batch_timeout
+            stop = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            await self._write(batch)
+            if stop:
+                return
+    
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            await self._sink(batch)
+        except Exception:
+            # Don't let audit failures take down the flusher
+            logger.exception("Failed to write %d audit entries", len(batch))
+
+
+async def close_audit_buffers() -> None:
+    """Flush all audit buffers; call on application shutdown."""
+    await asyncio.gather(*(buffer.close() for buffer in list(_buffers)))
+
+
+class AuditMiddleware:
     """
     Middleware for automatic audit logging of requests.
     Logs significant operations for compliance and security.
+    Plain ASGI: it only reads request metadata from the scope and the
+    status from the response start message, so the body is never wrapped.
     """
     
     # Methods that should be audited
@@ -29,46 +148,65 @@ class AuditMiddleware(BaseHTTPMiddleware):
         "/api/v1/auth/refresh",
     }
     
-    def __init__(self, app, audit_callback: Callable = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, audit_callback: Callable = None):
+        """
+        audit_callback, if given, is awaited with a list of audit entries;
+        entries are buffered and written in batches off the request path.
+        """
+        self.app = app
         self.audit_callback = audit_callback
+        self._buffer = AuditBuffer(audit_callback) if audit_callback else None
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip non-auditable requests
-        if request.method not in self.AUDITABLE_METHODS:
-            return await call_next(request)
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.AUDITABLE_METHODS
+            or scope["path"] in self.EXCLUDE_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
         
-        path = request.url.path
-        if path in self.EXCLUDE_PATHS:
-            return await call_next(request)
+        # Generate request ID for tracing (32 hex chars, no hyphens)
+        request_id = os.urandom(16).hex()
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
         
-        # Generate request ID for tracing
-        request_id = str(uuid4())
-        request.state.request_id = request_id
+        # Without a sink there is nothing to record
+        if not self.audit_callback:
+            await self.app(scope, receive, send)
+            return
         
         # Capture request info before processing
-        audit_data = await self._capture_request_info(request, request_id)
+        audit_data = self._capture_request_info(scope, request_id)
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
         # Process request
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
         
-        # Log audit event if callback provided
-        if self.audit_callback and response.status_code < 400:
-            audit_data["status_code"] = response.status_code
+        # Log audit event for successful requests
+        if status_code < 400:
+            audit_data["status_code"] = status_code
             await self._log_audit(audit_data)
-        
-        return response
     
-    async def _capture_request_info(
+    def _capture_request_info(
         self,
-        request: Request,
+        scope: Scope,
         request_id: str
     ) -> Dict[str, Any]:
         """Capture request information for audit."""
         
-        # Get user info from request state (set by auth middleware)
-        user_id = getattr(request.state, 'user_id', None)
-        org_id = getattr(request.state, 'tenant_id', None)
+        # Get user info from request state (set by auth middleware); the
+        # UUIDs are passed through as-is for the UUID columns
+        state = scope.get("state", {})
+        user_id = state.get("user_id")
+        org_id = state.get("tenant_id")
         
         # Determine action from method
         action_map = {
@@ -77,64 +215,71 @@ class AuditMiddleware(BaseHTTPMiddleware):
             "PATCH": AuditAction.UPDATE,
             "DELETE": AuditAction.DELETE,
         }
-        action = action_map.get(request.method, AuditAction.UPDATE)
+        method = scope["method"]
+        action = action_map.get(method, AuditAction.UPDATE)
         
         # Extract resource type from path
-        resource_type, resource_id = self._parse_resource_from_path(request.url.path)
+        path = scope["path"]
+        resource_type, resource_id = self._parse_resource_from_path(path)
+        
+        # Only the few headers needed, straight from the raw header list
+        headers: Dict[bytes, bytes] = {}
+        for name, value in scope["headers"]:
+            if name in _AUDIT_HEADERS and name not in headers:
+                headers[name] = value
+        user_agent = headers.get(b"user-agent")
         
         return {
             "request_id": request_id,
-            "user_id": str(user_id) if user_id else None,
-            "organization_id": str(org_id) if org_id else None,
+            "user_id": user_id,
+            "organization_id": org_id,
             "action": action.value,
             "resource_type": resource_type,
             "resource_id": resource_id,
-            "ip_address": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent"),
-            "path": request.url.path,
-            "method": request.method,
-            "timestamp": datetime.utcnow().isoformat(),
+            "ip_address": self._get_client_ip(headers, scope.get("client")),
+            "user_agent": user_agent.decode("latin-1") if user_agent else None,
+            "path": path,
+            "method": method,
+            "timestamp": _now_iso(),
         }
     
     def _parse_resource_from_path(self, path: str) -> tuple[str, Optional[str]]:
         """Parse resource type and ID from URL path."""
-        # Remove /api/v1 prefix
-        clean_path = path.replace("/api/v1/", "").strip("/")
-        parts = clean_path.split("/")
-        
-        if len(parts) >= 1:
-            resource_type = parts[0].rstrip("s")  # leads -> lead
-            resource_id = parts[1] if len(parts) > 1 else None
-            return resource_type, resource_id
+        # Remove /api/v1 prefix; only the first two segments matter
+        if path.startswith(_API_PREFIX):
+            path = path[len(_API_PREFIX):]
+        parts = path.strip("/").split("/", 2)
         
-        return "unknown", None
+        resource_type = _resource_type_for(parts[0])
+        resource_id = parts[1] if len(parts) > 1 else None
+        return resource_type, resource_id
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(
+        self,
+        headers: Dict[bytes, bytes],
+        client: Optional[Tuple[str, int]]
+    ) -> str:
         """Get client IP address, handling proxies."""
         # Check X-Forwarded-For header (from load balancer/proxy)
-        forwarded = request.headers.get("x-forwarded-for")
+        forwarded = headers.get(b"x-forwarded-for")
         if forwarded:
-            return forwarded.split(",")[0].strip()
+            return forwarded.decode("latin-1").split(",")[0].strip()
         
         # Check X-Real-IP header
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get(b"x-real-ip")
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
         
         # Fall back to direct client
-        if request.client:
-            return request.client.host
+        if client:
+            return client[0]
         
         return "unknown"
     
     async def _log_audit(self, audit_data: Dict[str, Any]):
-        """Log audit event."""
-        if self.audit_callback:
-            try:
-                await self.audit_callback(audit_data)
-            except Exception:
-                # Don't let audit failures affect the request
-                pass
+        """Queue audit event for the next batch."""
+        if self._buffer:
+            self._buffer.put(audit_data)
 
 
 async def log_audit_event(
@@ -159,55 +304,66 @@ async def log_audit_event(
     
     This function should be called directly for important operations
     that need explicit audit logging (like login, permission changes, etc.)
+    With db_session the entry is written in that session's transaction;
+    otherwise it is queued and written in a batch in the background.
     """
-    from shared.models.audit import AuditLog
+    values = _audit_log_values(
+        organization_id, user_id, action, resource_type,
+        resource_id, resource_name, old_values, new_values,
+        changed_fields, ip_address, user_agent, request_id,
+        description, metadata
+    )
     
     if db_session is None:
-        # If no session provided, create one
-        from shared.database import get_db
-        async with get_db() as session:
-            db_session = session
-            await _create_audit_log(
-                db_session, organization_id, user_id, action, resource_type,
-                resource_id, resource_name, old_values, new_values,
-                changed_fields, ip_address, user_agent, request_id,
-                description, metadata
-            )
+        _audit_log_buffer.put(values)
     else:
-        await _create_audit_log(
-            db_session, organization_id, user_id, action, resource_type,
-            resource_id, resource_name, old_values, new_values,
-            changed_fields, ip_address, user_agent, request_id,
-            description, metadata
-        )
+        await _create_audit_log(db_session, values)
 
 
-async def _create_audit_log(
-    session,
+def _audit_log_values(
     organization_id, user_id, action, resource_type,
     resource_id, resource_name, old_values, new_values,
     changed_fields, ip_address, user_agent, request_id,
     description, metadata
-):
+) -> Dict[str, Any]:
+    """
+    Build AuditLog column values. The model has no columns for the name,
+    changed fields, client, request id, description or metadata, so those
+    are not stored.
+    """
+    return {
+        "organization_id": organization_id,
+        "user_id": user_id,
+        "operation": AuditAction(action).value,
+        "entity": resource_type,
+        "entity_id": resource_id,
+        "previous_data": _json_text(old_values),
+        "new_data": _json_text(new_values),
+    }
+
+
+def _json_text(values: Optional[Dict]) -> Optional[str]:
+    """Serialize a values dict for a Text column."""
+    if values is None:
+        return None
+    return orjson.dumps(values, default=str).decode()
+
+
+async def _create_audit_log(session, values: Dict[str, Any]):
     """Create audit log entry in database."""
     from shared.models.audit import AuditLog
     
-    audit_log = AuditLog(
-        organization_id=organization_id,
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        resource_name=resource_name,
-        old_values=old_values,
-        new_values=new_values,
-        changed_fields=changed_fields,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        request_id=request_id,
-        description=description,
-        extra_data=metadata or {},
-    )
-    
-    session.add(audit_log)
+    session.add(AuditLog(**values))
     await session.flush()
+
+
+async def _write_audit_logs(batch: List[Dict[str, Any]]) -> None:
+    """Insert a batch of audit log entries in one transaction."""
+    from shared.database import get_db
+    from shared.models.audit import AuditLog
+    
+    async with get_db() as session:
+        session.add_all([AuditLog(**values) for values in batch])
+
+
+_audit_log_buffer = AuditBuffer(_write_audit_logs)
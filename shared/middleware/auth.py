@@ -1,68 +1,102 @@
 """Authentication middleware and dependencies."""
-from typing import Callable, List, Optional
+import time
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, Request, Response, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from shared.security.jwt import decode_token, TokenPayload
+from shared.utils.helpers import path_prefix_matcher
 
 
 # HTTP Bearer scheme for Swagger UI
 security = HTTPBearer(auto_error=False)
 
+TOKEN_CACHE_TTL = 60
 
-class AuthMiddleware(BaseHTTPMiddleware):
+# Decoded tokens by raw token string. A client presents the same access
+# token on every request until it expires, so its signature is verified
+# once per TTL; entries are also checked against the token's own exp.
+_decoded_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+
+# Path prefixes served without authentication
+AUTH_EXCLUDE_PATHS = (
+    "/health",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/api/v1/auth/login",
+    "/api/v1/auth/refresh",
+    "/api/v1/auth/forgot-password",
+    "/api/v1/auth/reset-password",
+    "/api/v1/auth/verify-email",
+    "/api/v1/organizations/onboard",
+    "/api/v1/users/accept-invitation",
+)
+
+
+class AuthMiddleware:
     """
     Middleware to extract and validate JWT tokens.
     Sets user info in request state for downstream use.
     """
     
-    def __init__(self, app, exclude_paths: list[str] = None):
-        super().__init__(app)
-        self.exclude_paths = exclude_paths or [
-            "/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/v1/auth/login",
-            "/api/v1/auth/refresh",
-            "/api/v1/auth/forgot-password",
-            "/api/v1/auth/reset-password",
-            "/api/v1/auth/verify-email",
-            "/api/v1/organizations/onboard",
-            "/api/v1/users/accept-invitation",
-        ]
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, exclude_paths: list[str] = None):
+        self.app = app
+        self.exclude_paths = exclude_paths or list(AUTH_EXCLUDE_PATHS)
+        self._is_excluded = path_prefix_matcher(self.exclude_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip auth for excluded paths
-        path = request.url.path
-        if any(path.startswith(excluded) for excluded in self.exclude_paths):
-            return await call_next(request)
+        if scope["type"] != "http" or self._is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
         
         # Extract and validate token
+        request = Request(scope)
         token_payload = await self._extract_token(request)
         
         if token_payload:
-            # Set user info in request state
-            request.state.user_id = UUID(token_payload.sub)
-            request.state.permissions = token_payload.permissions
-            request.state.role = token_payload.role
-            if token_payload.org_id:
-                request.state.tenant_id = UUID(token_payload.org_id)
+            set_user_state(request, token_payload)
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
     
     async def _extract_token(self, request: Request) -> Optional[TokenPayload]:
         """Extract and validate JWT from request."""
-        auth_header = request.headers.get("Authorization")
-        
-        if not auth_header or not auth_header.startswith("Bearer "):
-            return None
-        
-        token = auth_header[7:]
-        return decode_token(token)
+        return decode_bearer_token(request)
+
+
+def decode_bearer_token(request: Request) -> Optional[TokenPayload]:
+    """Decode the bearer token in the Authorization header, if any."""
+    auth_header = request.headers.get("Authorization")
+    
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return None
+    
+    token = auth_header[7:]
+    cached = _decoded_tokens.get(token)
+    if cached is not None:
+        expires_at, token_payload = cached
+        if expires_at > time.time():
+            return token_payload
+    
+    token_payload = decode_token(token)
+    if token_payload is not None:
+        expires_at = token_payload.exp.timestamp() if token_payload.exp else float("inf")
+        _decoded_tokens[token] = (expires_at, token_payload)
+    return token_payload
+
+
+def set_user_state(request: Request, token_payload: TokenPayload) -> None:
+    """Set user info from a decoded token in request state."""
+    request.state.user_id = UUID(token_payload.sub)
+    request.state.permissions = token_payload.permissions
+    request.state.role = token_payload.role
+    if token_payload.org_id:
+        request.state.tenant_id = UUID(token_payload.org_id)
 
 
 async def get_current_user(
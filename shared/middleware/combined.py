@@ -0,0 +1,63 @@
+"""Combined authentication, tenant and audit middleware."""
+from typing import Callable, List, Optional
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from shared.database.multi_tenant import set_tenant_id
+from shared.middleware.audit import AuditMiddleware
+from shared.middleware.auth import AUTH_EXCLUDE_PATHS, decode_bearer_token, set_user_state
+from shared.middleware.tenant import TENANT_EXCLUDE_PATHS, tenant_id_from_request
+from shared.utils.helpers import path_prefix_matcher
+
+
+class CombinedContextMiddleware:
+    """
+    Does the work of AuthMiddleware, TenantMiddleware and (optionally)
+    AuditMiddleware as one ASGI middleware, decoding the JWT once per
+    request instead of once in each of the auth and tenant layers.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        auth_exclude_paths: Optional[List[str]] = None,
+        tenant_exclude_paths: Optional[List[str]] = None,
+        audit: bool = True,
+        audit_callback: Callable = None,
+    ):
+        self.app = AuditMiddleware(app, audit_callback) if audit else app
+        self._skip_auth = path_prefix_matcher(auth_exclude_paths or AUTH_EXCLUDE_PATHS)
+        self._skip_tenant = path_prefix_matcher(tenant_exclude_paths or TENANT_EXCLUDE_PATHS)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        skip_auth = self._skip_auth(path)
+        skip_tenant = self._skip_tenant(path)
+        if skip_auth and skip_tenant:
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        token_payload = decode_bearer_token(request)
+        
+        if not skip_auth and token_payload:
+            set_user_state(request, token_payload)
+        
+        if skip_tenant:
+            await self.app(scope, receive, send)
+            return
+        
+        tenant_id = tenant_id_from_request(request, token_payload)
+        set_tenant_id(tenant_id)
+        request.state.tenant_id = tenant_id
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Clear tenant context after request
+            set_tenant_id(None)
@@ -0,0 +1,52 @@
+"""Combined per-request dependency for tenant-scoped endpoints."""
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.database import get_async_session
+from shared.middleware.auth import get_current_user, require_permissions
+from shared.middleware.tenant import require_tenant
+from shared.security.jwt import TokenPayload
+
+
+@dataclass
+class RequestContext:
+    """Authenticated user, tenant and database session for a request."""
+    user: TokenPayload
+    tenant_id: UUID
+    db: AsyncSession
+
+
+async def request_context(
+    user: TokenPayload = Depends(get_current_user),
+    tenant_id: UUID = Depends(require_tenant),
+    db: AsyncSession = Depends(get_async_session)
+) -> RequestContext:
+    """
+    Dependency that resolves user, tenant and session together.
+    Endpoints declare one Depends instead of three.
+    """
+    return RequestContext(user=user, tenant_id=tenant_id, db=db)
+
+
+def request_context_with_permissions(*required_permissions: str):
+    """
+    Dependency factory like request_context that also requires permissions.
+    
+    Usage:
+        @router.post("")
+        async def create_team(
+            ctx: RequestContext = Depends(request_context_with_permissions("team:create"))
+        ):
+            ...
+    """
+    async def context_checker(
+        user: TokenPayload = Depends(require_permissions(*required_permissions)),
+        tenant_id: UUID = Depends(require_tenant),
+        db: AsyncSession = Depends(get_async_session)
+    ) -> RequestContext:
+        return RequestContext(user=user, tenant_id=tenant_id, db=db)
+    
+    return context_checker
@@ -1,41 +1,47 @@
 """Tenant extraction middleware for multi-tenant isolation."""
-from typing import Callable, Optional
+from typing import Optional
 from uuid import UUID
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from shared.database.multi_tenant import set_tenant_id, get_tenant_id
-from shared.security.jwt import decode_token
+from shared.security.jwt import TokenPayload, decode_token
+from shared.utils.helpers import path_prefix_matcher
 
+# Path prefixes served without tenant context
+TENANT_EXCLUDE_PATHS = (
+    "/health",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/api/v1/auth/login",
+    "/api/v1/auth/refresh",
+    "/api/v1/auth/forgot-password",
+    "/api/v1/auth/reset-password",
+    "/api/v1/organizations/onboard",
+)
 
-class TenantMiddleware(BaseHTTPMiddleware):
+
+class TenantMiddleware:
     """
     Middleware to extract tenant (organization) context from JWT token.
     Sets the tenant ID in context for automatic query filtering.
     """
     
-    def __init__(self, app, exclude_paths: list[str] = None):
-        super().__init__(app)
-        self.exclude_paths = exclude_paths or [
-            "/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/v1/auth/login",
-            "/api/v1/auth/refresh",
-            "/api/v1/auth/forgot-password",
-            "/api/v1/auth/reset-password",
-            "/api/v1/organizations/onboard",
-        ]
+    def __init__(self, app: ASGIApp, exclude_paths: list[str] = None):
+        self.app = app
+        self.exclude_paths = exclude_paths or list(TENANT_EXCLUDE_PATHS)
+        self._is_excluded = path_prefix_matcher(self.exclude_paths)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip tenant extraction for excluded paths
-        path = request.url.path
-        if any(path.startswith(excluded) for excluded in self.exclude_paths):
-            return await call_next(request)
+        if scope["type"] != "http" or self._is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
         
         # Try to extract tenant from JWT
+        request = Request(scope)
         tenant_id = await self._extract_tenant_id(request)
         
         # Set tenant context
@@ -45,8 +51,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
         request.state.tenant_id = tenant_id
         
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
         finally:
             # Clear tenant context after request
             set_tenant_id(None)
@@ -56,29 +61,43 @@ class TenantMiddleware(BaseHTTPMiddleware):
         
         # Try Authorization header first
         auth_header = request.headers.get("Authorization")
+        payload = None
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header[7:]
             payload = decode_token(token)
-            if payload and payload.org_id:
-                return UUID(payload.org_id)
-        
-        # Try X-Organization-ID header (for service-to-service calls)
-        org_header = request.headers.get("X-Organization-ID")
-        if org_header:
-            try:
-                return UUID(org_header)
-            except ValueError:
-                pass
-        
-        # Try query parameter (for some GET requests)
-        org_param = request.query_params.get("organization_id")
-        if org_param:
-            try:
-                return UUID(org_param)
-            except ValueError:
-                pass
         
-        return None
+        return tenant_id_from_request(request, payload)
+
+
+def tenant_id_from_request(
+    request: Request,
+    token_payload: Optional[TokenPayload]
+) -> Optional[UUID]:
+    """
+    Resolve the tenant ID for a request from its already decoded token,
+    falling back to the X-Organization-ID header and organization_id
+    query parameter.
+    """
+    if token_payload and token_payload.org_id:
+        return UUID(token_payload.org_id)
+    
+    # Try X-Organization-ID header (for service-to-service calls)
+    org_header = request.headers.get("X-Organization-ID")
+    if org_header:
+        try:
+            return UUID(org_header)
+        except ValueError:
+            pass
+    
+    # Try query parameter (for some GET requests)
+    org_param = request.query_params.get("organization_id")
+    if org_param:
+        try:
+            return UUID(org_param)
+        except ValueError:
+            pass
+    
+    return None
 
 
 def get_current_tenant(request: Request) -> Optional[UUID]:
@@ -4,9 +4,9 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, relationship, validates
 
 from shared.database.base import Base, UUIDMixin
 
@@ -213,8 +213,22 @@ class Invitation(Base, UUIDMixin):
     # Indexes
     __table_args__ = (
         Index('ix_invitation_org_email', 'organization_id', 'email'),
+        # Lookups only ever want live invitations; these stay small
+        Index(
+            'ix_invitations_pending_org_email', 'organization_id', 'email',
+            postgresql_where=text("status = 'pending'")
+        ),
+        Index(
+            'ix_invitations_pending_expires', 'expires_at',
+            postgresql_where=text("status = 'pending'")
+        ),
     )
     
+    @validates("email")
+    def _normalize_email(self, key, value):
+        # Same normalization as User.email
+        return value.strip().lower() if value is not None else value
+    
     def __repr__(self):
         return f"<Invitation(email='{self.email}', org={self.organization_id}, status={self.status})>"
 
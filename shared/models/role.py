@@ -87,7 +87,8 @@ class Role(Base, UUIDMixin):
     role_permissions: Mapped[List["RolePermission"]] = relationship(
         "RolePermission",
         back_populates="role",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
@@ -44,7 +44,7 @@ class SubscriptionStatus(str, enum.Enum):
     SUSPENDED = "suspended"
 
 
-class SubscriptionPlan(Base, UUIDMixin):
+class SubscriptionPlan(Base, UUIDMixin, TimestampMixin):
     """
     Subscription plan definitions.
     """
@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text,
-    UniqueConstraint
+    Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text,
+    UniqueConstraint, text
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, relationship
@@ -40,6 +40,12 @@ class Team(Base, UUIDMixin, TimestampMixin):
     Team model - groups users within an organization.
     """
     __tablename__ = "teams"
+    __table_args__ = (
+        Index(
+            'ix_teams_org_live', 'organization_id',
+            postgresql_where=text('deleted_at IS NULL AND is_active')
+        ),
+    )
     
     organization_id = Column(
         UUID(as_uuid=True),
@@ -95,6 +101,10 @@ class UserTeam(Base, UUIDMixin, TimestampMixin):
     Team membership - links users to teams.
     """
     __tablename__ = "user_teams"
+    __table_args__ = (
+        UniqueConstraint('team_id', 'user_id', name='uq_user_teams_team_user'),
+        Index('ix_user_teams_team_active', 'team_id', postgresql_where=text('is_active')),
+    )
     
     user_id = Column(
         UUID(as_uuid=True),
@@ -5,10 +5,10 @@ from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text
+    Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, relationship, validates
 
 from shared.database.base import Base, TimestampMixin, UUIDMixin
 
@@ -69,6 +69,10 @@ class User(Base, UUIDMixin, TimestampMixin):
     Users belong to a single organization.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index('ix_users_org_active', 'organization_id', postgresql_where=text('is_active')),
+        Index('ix_users_org_created_id', 'organization_id', 'created_at', 'id'),
+    )
     
     organization_id = Column(
         UUID(as_uuid=True),
@@ -126,6 +130,12 @@ class User(Base, UUIDMixin, TimestampMixin):
         cascade="all, delete-orphan"
     )
     
+    @validates("email")
+    def _normalize_email(self, key, value):
+        # Kept in line with shared.utils.helpers.normalize_email, which
+        # callers use for lookups; importing it here would be circular.
+        return value.strip().lower() if value is not None else value
+    
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}')>"
 
@@ -0,0 +1,99 @@
+"""Response classes and serialization helpers shared by all services."""
+import asyncio
+import enum
+import hashlib
+from decimal import Decimal
+from typing import Any, Sequence
+from uuid import UUID
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError
+
+
+def dump_models(models: Sequence[BaseModel]) -> bytes:
+    """Serialize a list of Pydantic models into a single JSON array."""
+    return orjson.dumps(
+        [model.model_dump(mode="json") for model in models],
+        default=orjson_default,
+    )
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag for a rendered response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+# For per-user data that changes on writes: the browser may keep the body but
+# must revalidate it with If-None-Match before every reuse.
+REVALIDATE = "private, no-cache"
+
+
+def with_etag(
+    request: Request,
+    response: Response,
+    cache_control: str = "private, max-age=60"
+) -> Response:
+    """
+    Tag a rendered GET response with an ETag, or replace it with an
+    empty 304 when the client's If-None-Match already matches.
+    """
+    etag = body_etag(response.body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return response
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response that serializes Pydantic models with their own
+    Rust-backed encoder instead of jsonable_encoder + json.dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return self._dump(content)
+
+    @staticmethod
+    def _dump(content: Any) -> bytes:
+        """Serialize a model, a list of models, or plain data."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        if isinstance(content, (list, tuple)) and all(
+            isinstance(item, BaseModel) for item in content
+        ):
+            return dump_models(content)
+        return orjson.dumps(content, default=orjson_default)
+
+    @classmethod
+    async def create(
+        cls,
+        content: Any,
+        status_code: int = 200,
+        **kwargs
+    ) -> "PydanticResponse":
+        """Serialize the content in a worker thread and build the response."""
+        body = await asyncio.to_thread(cls._dump, content)
+        return cls(body, status_code=status_code, **kwargs)
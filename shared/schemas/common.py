@@ -53,6 +53,9 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     pages: int = Field(description="Total number of pages")
     has_next: bool = Field(description="Whether there are more pages")
     has_prev: bool = Field(description="Whether there are previous pages")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page, when keyset pagination is supported"
+    )
     
     @classmethod
     def create(
@@ -60,7 +63,8 @@ class PaginatedResponse(BaseSchema, Generic[T]):
         items: List[T],
         total: int,
         page: int,
-        page_size: int
+        page_size: int,
+        next_cursor: Optional[str] = None
     ) -> "PaginatedResponse[T]":
         """Create a paginated response from items and pagination info."""
         pages = (total + page_size - 1) // page_size if total > 0 else 1
@@ -71,7 +75,8 @@ class PaginatedResponse(BaseSchema, Generic[T]):
             page_size=page_size,
             pages=pages,
             has_next=page < pages,
-            has_prev=page > 1
+            has_prev=page > 1,
+            next_cursor=next_cursor
         )
 
 
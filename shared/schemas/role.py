@@ -5,7 +5,6 @@ from uuid import UUID
 
 from pydantic import Field
 
-from shared.models.role import ActionType, ResourceType
 from shared.schemas.common import BaseSchema
 
 
@@ -15,17 +14,12 @@ class PermissionBase(BaseSchema):
     code: str = Field(..., max_length=100)
     name: str = Field(..., max_length=200)
     description: Optional[str] = None
-    resource: ResourceType
-    action: ActionType
-    module: Optional[str] = None
-    category: Optional[str] = None
 
 
 class PermissionResponse(PermissionBase):
     """Schema for permission response."""
     
     id: UUID
-    is_active: bool
 
 
 class PermissionGroupResponse(BaseSchema):
@@ -1,4 +1,7 @@
 """Password hashing and validation utilities."""
+import asyncio
+import hashlib
+import hmac
 import secrets
 import string
 from typing import Tuple
@@ -42,6 +45,56 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in a worker thread.
+    
+    bcrypt is deliberately slow; use this from async code so the event
+    loop keeps serving other requests while the hash is computed.
+    """
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash in a worker thread."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+def hash_token(token: str) -> str:
+    """
+    Hash a high-entropy random token (e.g. from generate_token).
+    
+    Such tokens can't be guessed, so a keyed SHA-256 is enough and costs
+    microseconds; bcrypt is only needed for user-chosen passwords. The key
+    is INVITATION_TOKEN_SECRET, or JWT_SECRET_KEY when that is unset.
+    
+    Args:
+        token: Plain token
+    
+    Returns:
+        Hex HMAC-SHA256 digest
+    """
+    key = settings.INVITATION_TOKEN_SECRET or settings.JWT_SECRET_KEY
+    return hmac.new(key.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_token(token: str, token_hash: str) -> bool:
+    """
+    Verify a token against a hash from hash_token.
+    Hashes stored before tokens moved off bcrypt are still accepted.
+    
+    Args:
+        token: Plain token to verify
+        token_hash: Stored token hash
+    
+    Returns:
+        True if token matches, False otherwise
+    """
+    if token_hash.startswith("$2"):
+        return verify_password(token, token_hash)
+    return hmac.compare_digest(hash_token(token), token_hash)
+
+
 def generate_random_password(
     length: int = 16,
     include_special: bool = True
@@ -1,5 +1,5 @@
 """Utilities module exports."""
-from shared.utils.pagination import paginate, Paginator
+from shared.utils.pagination import paginate, Paginator, encode_cursor, decode_cursor
 from shared.utils.exceptions import (
     HorizonException,
     NotFoundError,
@@ -12,6 +12,8 @@ from shared.utils.exceptions import (
 from shared.utils.helpers import (
     generate_slug,
     generate_code,
+    normalize_email,
+    path_prefix_matcher,
     mask_email,
     mask_phone,
 )
@@ -20,6 +22,8 @@ __all__ = [
     # Pagination
     "paginate",
     "Paginator",
+    "encode_cursor",
+    "decode_cursor",
     # Exceptions
     "HorizonException",
     "NotFoundError",
@@ -31,6 +35,8 @@ __all__ = [
     # Helpers
     "generate_slug",
     "generate_code",
+    "normalize_email",
+    "path_prefix_matcher",
     "mask_email",
     "mask_phone",
 ]
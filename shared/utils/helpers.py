@@ -3,7 +3,7 @@ import re
 import secrets
 import string
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from uuid import UUID
 
 
@@ -64,6 +64,31 @@ def generate_reference_number(prefix: str = "REF") -> str:
     return f"{prefix}-{date_part}-{random_part}"
 
 
+def normalize_email(email: str) -> str:
+    """
+    Canonical form of an email address as stored on users and invitations.
+    Example: " John.Doe@Example.com" -> "john.doe@example.com"
+    """
+    return email.strip().lower()
+
+
+def path_prefix_matcher(prefixes: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate telling whether a path starts with any of the prefixes.
+    One compiled regex match replaces a startswith call per prefix.
+    """
+    prefixes = list(prefixes)
+    if not prefixes:
+        return lambda path: False
+    
+    pattern = re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+    
+    def matches(path: str) -> bool:
+        return pattern.match(path) is not None
+    
+    return matches
+
+
 def mask_email(email: str) -> str:
     """
     Mask email address for privacy.
@@ -1,6 +1,10 @@
 """Pagination utilities."""
-from typing import Any, Generic, List, Optional, Type, TypeVar
+import base64
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, Type, TypeVar
+from uuid import UUID
 
+import orjson
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
@@ -90,6 +94,27 @@ async def paginate(
     return await paginator.paginate()
 
 
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Encode the (created_at, id) keyset position of a row as an opaque cursor."""
+    raw = orjson.dumps([created_at.isoformat(), str(item_id)])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, item_id = orjson.loads(raw)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
 def create_pagination_params(
     page: int = 1,
     page_size: int = 20,
@@ -0,0 +1,88 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest import mock
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from shared.middleware.audit import AuditBuffer, _audit_log_values, _write_audit_logs
+from shared.models.audit import AuditAction, AuditLog
+
+
+@pytest.mark.asyncio
+async def test_audit_buffer_batches_by_size():
+    """Entries are handed to the sink in batches of at most batch_size."""
+    batches = []
+
+    async def sink(batch):
+        batches.append(batch)
+
+    buffer = AuditBuffer(sink, batch_size=3, batch_ms=1000)
+    for i in range(7):
+        buffer.put({"n": i})
+    await buffer.close()
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [e["n"] for b in batches for e in b] == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_audit_buffer_flushes_on_timeout():
+    """A partial batch is written once batch_ms has passed."""
+    written = asyncio.Event()
+
+    async def sink(batch):
+        written.set()
+
+    buffer = AuditBuffer(sink, batch_size=100, batch_ms=10)
+    buffer.put({"n": 1})
+    await asyncio.wait_for(written.wait(), timeout=1)
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_audit_buffer_drops_when_full():
+    """Entries beyond maxsize are dropped rather than blocking the caller."""
+    batches = []
+
+    async def sink(batch):
+        batches.append(batch)
+
+    buffer = AuditBuffer(sink, batch_size=10, batch_ms=1000, maxsize=2)
+    for i in range(5):
+        buffer.put({"n": i})
+    await buffer.close()
+
+    assert sum(len(b) for b in batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_audit_logs_builds_real_rows():
+    """The batch sink maps log_audit_event values onto AuditLog's columns."""
+    added = []
+
+    class _Session:
+        def add_all(self, rows):
+            added.extend(rows)
+
+    @asynccontextmanager
+    async def fake_get_db():
+        yield _Session()
+
+    org_id, user_id, entity_id = uuid4(), uuid4(), uuid4()
+    values = _audit_log_values(
+        org_id, user_id, AuditAction.UPDATE, "lead",
+        entity_id, "Lead A", {"status": "new"}, {"status": "won"},
+        ["status"], "10.0.0.1", "tests", "abc", "Closed", {"k": "v"},
+    )
+
+    with mock.patch("shared.database.get_db", fake_get_db):
+        await _write_audit_logs([values])
+
+    (row,) = added
+    assert isinstance(row, AuditLog)
+    assert (row.organization_id, row.user_id, row.entity_id) == (org_id, user_id, entity_id)
+    assert row.operation == "update" and row.entity == "lead"
+    assert orjson.loads(row.previous_data) == {"status": "new"}
+    assert orjson.loads(row.new_data) == {"status": "won"}
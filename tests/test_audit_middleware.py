@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from shared.middleware.audit import AuditMiddleware, _now_iso, close_audit_buffers
+
+
+def create_test_app(batches):
+    async def sink(batch):
+        batches.extend(batch)
+
+    app = FastAPI()
+    app.add_middleware(AuditMiddleware, audit_callback=sink)
+
+    @app.post("/api/v1/leads/{lead_id}", status_code=201)
+    async def create(lead_id: str, request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.delete("/api/v1/leads/{lead_id}", status_code=404)
+    async def delete(lead_id: str):
+        return {}
+
+    @app.get("/api/v1/leads")
+    async def list_leads():
+        return []
+
+    return app
+
+
+def test_audit_middleware_records_successful_writes():
+    """Successful write requests are audited with metadata from the scope."""
+    batches = []
+    app = create_test_app(batches)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/leads/abc",
+            headers={"User-Agent": "tests", "X-Forwarded-For": "10.0.0.1, 10.0.0.2"},
+        )
+        client.delete("/api/v1/leads/abc")
+        client.get("/api/v1/leads")
+        # Flush the buffer on the client's event loop
+        client.portal.call(close_audit_buffers)
+
+    assert response.status_code == 201
+    assert len(batches) == 1
+    entry = batches[0]
+    assert entry["request_id"] == response.json()["request_id"]
+    assert entry["status_code"] == 201
+    assert entry["resource_type"] == "lead"
+    assert entry["resource_id"] == "abc"
+    assert entry["ip_address"] == "10.0.0.1"
+    assert entry["user_agent"] == "tests"
+
+
+def test_now_iso_matches_utcnow():
+    """The cached timestamp parses and agrees with utcnow to the millisecond."""
+    before = datetime.utcnow()
+    stamp = datetime.fromisoformat(_now_iso())
+    after = datetime.utcnow()
+
+    assert before - timedelta(milliseconds=1) <= stamp <= after
+
+
+def test_audit_middleware_without_callback_only_sets_request_id(monkeypatch):
+    """With no sink, requests still get a request_id but no entry is built."""
+    app = FastAPI()
+    app.add_middleware(AuditMiddleware)
+
+    @app.post("/api/v1/leads")
+    async def create(request: Request):
+        return {"request_id": request.state.request_id}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("audit entry built without a callback")
+
+    monkeypatch.setattr(AuditMiddleware, "_capture_request_info", fail)
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/leads")
+
+    assert response.status_code == 200
+    assert len(response.json()["request_id"]) == 32
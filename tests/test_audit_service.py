@@ -0,0 +1,47 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shared.models.audit import AuditAction
+from services.user_management.services.audit_service import AuditService
+
+
+class _Result:
+    def scalar(self):
+        return 0
+
+    def mappings(self):
+        return []
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result()
+
+
+@pytest.mark.asyncio
+async def test_list_audit_logs_builds_statements_on_model_columns():
+    """Count and page queries compile against AuditLog's real columns."""
+    db = _RecordingSession()
+
+    result = await AuditService(db).list_audit_logs(
+        uuid4(),
+        user_id=uuid4(),
+        action=AuditAction.UPDATE,
+        resource_type="lead",
+        resource_id=uuid4(),
+        start_date=datetime(2026, 1, 1),
+        end_date=datetime(2026, 2, 1),
+    )
+
+    count_sql, page_sql = db.statements
+    assert "audit_logs.operation" in count_sql and "audit_logs.entity_id" in count_sql
+    assert "audit_logs.previous_data" in page_sql
+    assert "ORDER BY audit_logs.timestamp DESC" in page_sql
+    assert result["items"] == [] and result["total"] == 0
@@ -0,0 +1,86 @@
+from unittest import mock
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from shared.database.multi_tenant import get_tenant_id
+from shared.middleware import auth, combined
+from shared.middleware.combined import CombinedContextMiddleware
+from shared.security.jwt import create_access_token
+
+
+def create_test_app():
+    app = FastAPI()
+    app.add_middleware(CombinedContextMiddleware, audit=False)
+
+    @app.get("/api/v1/things")
+    async def things(request: Request):
+        return {
+            "user_id": str(getattr(request.state, "user_id", None)),
+            "state_tenant": str(request.state.tenant_id),
+            "context_tenant": str(get_tenant_id()),
+            "role": getattr(request.state, "role", None),
+        }
+
+    @app.get("/health")
+    async def health(request: Request):
+        return {"user_id": str(getattr(request.state, "user_id", None))}
+
+    return app
+
+
+def test_combined_middleware_sets_user_and_tenant_with_one_decode():
+    """User state and tenant context come from a single token decode."""
+    user_id, org_id = uuid4(), uuid4()
+    token = create_access_token(user_id, org_id, role="admin", permissions=["*"])
+    client = TestClient(create_test_app())
+
+    with mock.patch.object(combined, "decode_bearer_token", wraps=combined.decode_bearer_token) as spy:
+        body = client.get("/api/v1/things", headers={"Authorization": f"Bearer {token}"}).json()
+
+    assert spy.call_count == 1
+    assert body == {
+        "user_id": str(user_id),
+        "state_tenant": str(org_id),
+        "context_tenant": str(org_id),
+        "role": "admin",
+    }
+    assert get_tenant_id() is None
+
+
+def test_combined_middleware_tenant_header_fallback():
+    """Without a token the tenant comes from X-Organization-ID."""
+    org_id = uuid4()
+    client = TestClient(create_test_app())
+
+    body = client.get("/api/v1/things", headers={"X-Organization-ID": str(org_id)}).json()
+
+    assert body["user_id"] == "None"
+    assert body["state_tenant"] == str(org_id)
+
+
+def test_combined_middleware_skips_excluded_paths():
+    """Excluded paths are passed through without decoding the token."""
+    token = create_access_token(uuid4(), uuid4())
+    client = TestClient(create_test_app())
+
+    body = client.get("/health", headers={"Authorization": f"Bearer {token}"}).json()
+
+    assert body == {"user_id": "None"}
+
+
+def test_bearer_token_decode_is_cached():
+    """A repeated token is verified once; an expired entry is decoded again."""
+    token = create_access_token(uuid4(), uuid4())
+    request = Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+    auth._decoded_tokens.clear()
+
+    with mock.patch.object(auth, "decode_token", wraps=auth.decode_token) as spy:
+        first = auth.decode_bearer_token(request)
+        assert auth.decode_bearer_token(request) is first
+        assert spy.call_count == 1
+
+        auth._decoded_tokens[token] = (0, first)
+        assert auth.decode_bearer_token(request) is not None
+        assert spy.call_count == 2
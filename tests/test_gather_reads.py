@@ -0,0 +1,43 @@
+from unittest import mock
+
+import pytest
+
+from shared.database import session as db_session
+from shared.database import gather_reads
+
+
+def _reads(seen):
+    async def first(db):
+        seen.append(db)
+        return "first"
+
+    async def second(db):
+        seen.append(db)
+        return "second"
+
+    return first, second
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_runs_sequentially_without_idle_connections():
+    """With no idle connection every read runs on the request session."""
+    request_session, seen = object(), []
+
+    with mock.patch.object(db_session, "_idle_connections", return_value=0):
+        results = await gather_reads(request_session, *_reads(seen))
+
+    assert results == ["first", "second"]
+    assert seen == [request_session, request_session]
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_uses_extra_sessions_when_idle():
+    """With idle connections only the first read stays on the request session."""
+    request_session, seen = object(), []
+
+    with mock.patch.object(db_session, "_idle_connections", return_value=5):
+        results = await gather_reads(request_session, *_reads(seen))
+
+    assert results == ["first", "second"]
+    assert seen[0] is request_session
+    assert seen[1] is not request_session
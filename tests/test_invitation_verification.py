@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+import pytest
+from passlib.hash import bcrypt
+
+from services.user_management.services.user_service import UserService
+
+
+def _legacy_invitation(token):
+    return SimpleNamespace(token_hash=bcrypt.using(rounds=4).hash(token))
+
+
+@pytest.mark.asyncio
+async def test_first_verified_invitation_finds_match():
+    """The invitation whose legacy hash matches is returned from the batch."""
+    invitations = [_legacy_invitation(t) for t in ("first", "second", "third")]
+
+    match = await UserService._first_verified_invitation("second", invitations)
+
+    assert match is invitations[1]
+
+
+@pytest.mark.asyncio
+async def test_first_verified_invitation_no_match():
+    """A token matching none of the hashes yields None."""
+    invitations = [_legacy_invitation(t) for t in ("first", "second")]
+
+    assert await UserService._first_verified_invitation("other", invitations) is None
+    assert await UserService._first_verified_invitation("other", []) is None
@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.user_management.services.team_service import TeamService
+from services.user_management.services.user_service import UserService
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_add_user_to_teams_bulk_stamps_joined_at_on_server():
+    """joined_at comes from now() rather than a bound Python datetime."""
+    db = _RecordingSession()
+
+    await UserService(db).add_user_to_teams_bulk(uuid4(), [uuid4(), uuid4()])
+
+    (compiled,) = db.statements
+    assert "now()" in str(compiled)
+    assert not any(name.startswith("joined_at") for name in compiled.params)
+
+
+class _ScalarsSession(_RecordingSession):
+    async def scalars(self, statement):
+        await self.execute(statement)
+        return self
+
+    def one_or_none(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_add_member_stamps_joined_at_on_server():
+    """Single memberships get joined_at from now(), like the bulk path."""
+    db = _ScalarsSession()
+
+    await TeamService(db).add_member(uuid4(), uuid4())
+
+    (compiled,) = db.statements
+    assert "now()" in str(compiled)
+    assert "joined_at" not in compiled.params
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from shared.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """A cursor decodes back to the keyset position it was built from."""
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    item_id = uuid4()
+    cursor = encode_cursor(created_at, item_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, item_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzFd", encode_cursor(datetime.now(), uuid4())[:-3]])
+def test_decode_cursor_rejects_garbage(cursor):
+    """Malformed cursors raise ValueError so the API can answer 400."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
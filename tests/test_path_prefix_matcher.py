@@ -0,0 +1,19 @@
+from shared.utils.helpers import path_prefix_matcher
+
+
+def test_path_prefix_matcher_matches_like_startswith():
+    """The matcher agrees with startswith over every prefix."""
+    prefixes = ["/health", "/docs", "/api/v1/auth/login", "/api/v1/users/accept-invitation"]
+    is_excluded = path_prefix_matcher(prefixes)
+
+    for path in [
+        "/health", "/healthz", "/docs/oauth2-redirect", "/api/v1/auth/login",
+        "/api/v1/auth/logout", "/api/v1/users", "/api/v1/users/accept-invitation/abc",
+        "/x/health", "",
+    ]:
+        assert is_excluded(path) == any(path.startswith(p) for p in prefixes)
+
+
+def test_path_prefix_matcher_empty():
+    """No prefixes excludes nothing."""
+    assert not path_prefix_matcher([])("/health")
@@ -0,0 +1,61 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.user_management.services import permission_service
+from services.user_management.services.permission_service import PermissionService
+from shared.models.role import ResourceType
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self._rows
+
+
+class _RecordingSession:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(
+            str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        )
+        return _Result(self.rows)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    permission_service._permission_lists.clear()
+    yield
+    permission_service._permission_lists.clear()
+
+
+@pytest.mark.asyncio
+async def test_list_permissions_filters_on_code_prefix():
+    """The resource filter compiles to a prefix match on Permission.code."""
+    db = _RecordingSession()
+
+    await PermissionService(db).list_permissions(resource=ResourceType.TEAM)
+
+    (sql,) = db.statements
+    assert "permissions.code LIKE 'team:' || '%%'" in sql
+    assert "permissions.resource" not in sql
+    assert "ORDER BY permissions.code" in sql
+
+
+@pytest.mark.asyncio
+async def test_list_permissions_grouped_by_code_resource():
+    """Grouping keys come from the resource part of each code."""
+    rows = [
+        {"id": uuid4(), "code": code, "name": code, "description": None}
+        for code in ("role:read", "team:create", "team:read")
+    ]
+
+    groups = await PermissionService(_RecordingSession(rows)).list_permissions_grouped()
+
+    assert [(g.resource, len(g.permissions)) for g in groups] == [("role", 1), ("team", 2)]
@@ -0,0 +1,85 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+import orjson
+import pytest
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from shared.responses import REVALIDATE, PydanticResponse, body_etag, orjson_default, with_etag
+
+
+class Item(BaseModel):
+    id: UUID
+    name: str
+    created_at: datetime
+
+
+ITEM_ID = UUID("12345678-1234-5678-1234-567812345678")
+CREATED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def test_orjson_default_handles_decimal():
+    """Decimal values are encoded as floats."""
+    assert orjson.loads(orjson.dumps({"price": Decimal("9.50")}, default=orjson_default)) == {
+        "price": 9.5
+    }
+
+
+def test_render_single_model():
+    """A single model is serialized with model_dump_json."""
+    response = PydanticResponse(Item(id=ITEM_ID, name="a", created_at=CREATED_AT))
+    assert orjson.loads(response.body) == {
+        "id": str(ITEM_ID),
+        "name": "a",
+        "created_at": "2026-01-01T12:00:00",
+    }
+
+
+def test_render_model_list_from_construct():
+    """Constructed (unvalidated) models serialize as a JSON array."""
+    items = [Item.model_construct(id=ITEM_ID, name=str(i), created_at=CREATED_AT) for i in range(3)]
+    response = PydanticResponse(items)
+    assert [row["name"] for row in orjson.loads(response.body)] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_create_serializes_off_loop():
+    """create() returns a response with the serialized body."""
+    response = await PydanticResponse.create(
+        Item(id=ITEM_ID, name="a", created_at=CREATED_AT), status_code=201
+    )
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert orjson.loads(response.body)["id"] == str(ITEM_ID)
+
+
+def make_request(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_with_etag_sets_header():
+    """A fresh request gets the body back with an ETag."""
+    response = with_etag(make_request(), Response(content=b"[1]", media_type="application/json"))
+    assert response.status_code == 200
+    assert response.headers["etag"] == body_etag(b"[1]")
+    assert response.body == b"[1]"
+
+
+def test_with_etag_returns_not_modified():
+    """A matching If-None-Match gets an empty 304."""
+    etag = body_etag(b"[1]")
+    request = make_request({"If-None-Match": f'"other", W/{etag}'})
+    response = with_etag(request, Response(content=b"[1]", media_type="application/json"))
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_with_etag_revalidate_forces_conditional_requests():
+    """Per-user responses are revalidated on every reuse instead of cached for a minute."""
+    response = with_etag(make_request(), Response(content=b"{}"), REVALIDATE)
+    assert response.headers["cache-control"] == "private, no-cache"
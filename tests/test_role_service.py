@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.user_management.services.role_service import RoleService
+from shared.schemas.role import PermissionResponse
+
+
+class _Result:
+    def first(self):
+        return None
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result()
+
+
+@pytest.mark.asyncio
+async def test_role_with_permissions_aggregates_permission_columns():
+    """The permission aggregate compiles against Permission's real columns."""
+    db = _RecordingSession()
+
+    role, permissions = await RoleService(db).get_role_with_permissions(uuid4(), uuid4())
+
+    (sql,) = db.statements
+    assert "jsonb_build_object" in sql
+    assert "permissions.code" in sql and "permissions.description" in sql
+    assert role is None and permissions == []
+
+
+def test_aggregated_permission_validates_as_response():
+    """Each aggregated object has the shape PermissionResponse expects."""
+    permission = PermissionResponse.model_validate(
+        {"id": str(uuid4()), "code": "team:read", "name": "View Team", "description": None}
+    )
+    assert permission.code == "team:read"
+
+
+def test_loaded_permission_validates_for_role_listing():
+    """list_roles(include_permissions=True) validates loaded Permission rows."""
+    from shared.models.role import Permission
+
+    permission = Permission(id=uuid4(), code="role:update", name="Update Role")
+
+    response = PermissionResponse.model_validate(permission)
+
+    assert response.code == "role:update" and response.description is None
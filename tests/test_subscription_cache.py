@@ -0,0 +1,53 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import UUID
+
+import orjson
+
+from services.user_management.services.subscription_service import ActiveSubscription
+
+
+def make_subscription():
+    plan = SimpleNamespace(
+        id=UUID("22222222-2222-2222-2222-222222222222"),
+        name="Pro",
+        code="pro",
+        billing_cycle="monthly",
+        max_users=50,
+        max_teams=20,
+        max_leads=10000,
+        max_contacts=50000,
+        max_deals=5000,
+        max_tickets=10000,
+        max_products=5000,
+        max_storage_gb=50,
+        features={"api_access": True},
+    )
+    return SimpleNamespace(
+        id=UUID("11111111-1111-1111-1111-111111111111"),
+        plan=plan,
+        status="active",
+        starts_at=datetime(2026, 1, 1),
+        ends_at=None,
+        trial_starts_at=None,
+        trial_ends_at=None,
+        current_storage_mb=Decimal("12.50"),
+    )
+
+
+def test_snapshot_from_orm():
+    """The snapshot holds plain, response-ready values."""
+    snapshot = ActiveSubscription.from_orm(make_subscription())
+    assert snapshot.id == "11111111-1111-1111-1111-111111111111"
+    assert snapshot.plan_code == "pro"
+    assert snapshot.starts_at == "2026-01-01T00:00:00"
+    assert snapshot.current_storage_mb == 12.5
+    assert snapshot.limits["max_users"] == 50
+
+
+def test_snapshot_round_trips_through_json():
+    """A snapshot stored in Redis decodes back to an equal snapshot."""
+    encoded = ActiveSubscription.encode_orm(make_subscription())
+    assert ActiveSubscription.decode(encoded) == ActiveSubscription.from_orm(make_subscription())
+    assert orjson.loads(encoded)["starts_at"] == datetime(2026, 1, 1).isoformat()
@@ -0,0 +1,35 @@
+from collections import defaultdict
+from types import SimpleNamespace
+from uuid import uuid4
+
+from services.user_management.services.team_service import TeamService
+
+
+def make_team(name, parent=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        team_type="sales",
+        parent_id=parent.id if parent else None,
+    )
+
+
+def test_build_hierarchy_node_uses_child_index_and_counts():
+    """Children come from the parent index and counts from the grouped query."""
+    root = make_team("Root")
+    child = make_team("Child", root)
+    grandchild = make_team("Grandchild", child)
+    
+    children_by_parent = defaultdict(list)
+    for team in (root, child, grandchild):
+        children_by_parent[team.parent_id].append(team)
+    
+    node = TeamService(db=None)._build_hierarchy_node(
+        root, children_by_parent, {root.id: 3, grandchild.id: 1}
+    )
+    
+    assert node.member_count == 3
+    assert [c.name for c in node.children] == ["Child"]
+    assert node.children[0].member_count == 0
+    assert node.children[0].children[0].name == "Grandchild"
+    assert node.children[0].children[0].member_count == 1
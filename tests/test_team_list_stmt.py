@@ -0,0 +1,23 @@
+from sqlalchemy.dialects import postgresql
+
+from services.user_management.services.team_service import _list_teams_stmt
+
+
+def _sql(*shape):
+    return str(_list_teams_stmt(*shape).compile(dialect=postgresql.dialect()))
+
+
+def test_list_teams_default_shape_matches_live_partial_index():
+    """The default listing keeps is_active as a literal predicate and no optional clauses."""
+    sql = _sql(False, False, True)
+
+    assert "teams.deleted_at IS NULL" in sql
+    assert "teams.is_active = true" in sql
+    assert "team_type" not in sql.split("WHERE", 1)[1]
+    assert "IS NULL OR" not in sql
+
+
+def test_list_teams_shapes_are_cached():
+    """Each filter shape compiles to one shared statement object."""
+    assert _list_teams_stmt(True, True, None) is _list_teams_stmt(True, True, None)
+    assert "teams.parent_id = " in _sql(False, True, None)
@@ -0,0 +1,34 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from shared.database.multi_tenant import get_tenant_id, set_tenant_id, tenant_context
+
+
+@pytest.mark.asyncio
+async def test_tenant_context_nests_and_restores():
+    """Nested scopes see their own tenant and restore the outer one on exit."""
+    outer, inner = uuid4(), uuid4()
+    set_tenant_id(None)
+
+    async with tenant_context(outer):
+        assert get_tenant_id() == outer
+        async with tenant_context(inner):
+            assert get_tenant_id() == inner
+        assert get_tenant_id() == outer
+
+    assert get_tenant_id() is None
+
+
+@pytest.mark.asyncio
+async def test_tenant_context_is_task_local():
+    """Concurrent tasks each keep their own tenant across awaits."""
+    tenants = [uuid4() for _ in range(5)]
+
+    async def scoped(tenant_id):
+        async with tenant_context(tenant_id):
+            await asyncio.sleep(0)
+            return get_tenant_id()
+
+    assert await asyncio.gather(*(scoped(t) for t in tenants)) == tenants
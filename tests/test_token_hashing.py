@@ -0,0 +1,37 @@
+from shared.security.password import (
+    generate_token,
+    hash_password,
+    hash_token,
+    verify_token,
+)
+
+
+def test_hash_token_round_trip():
+    """A token verifies against its own hash and not against another's."""
+    token = generate_token(32)
+    token_hash = hash_token(token)
+    assert token_hash == hash_token(token)
+    assert verify_token(token, token_hash)
+    assert not verify_token(generate_token(32), token_hash)
+
+
+def test_verify_token_accepts_legacy_bcrypt_hash():
+    """Hashes created with bcrypt before the switch still verify."""
+    token = generate_token(8)
+    legacy_hash = hash_password(token)
+    assert verify_token(token, legacy_hash)
+    assert not verify_token("other", legacy_hash)
+
+
+def test_hash_token_uses_invitation_secret(monkeypatch):
+    """INVITATION_TOKEN_SECRET keys the hash; unset, JWT_SECRET_KEY does."""
+    from shared.config import settings
+    
+    token = generate_token(32)
+    monkeypatch.setattr(settings, "INVITATION_TOKEN_SECRET", None)
+    jwt_keyed = hash_token(token)
+    
+    monkeypatch.setattr(settings, "INVITATION_TOKEN_SECRET", "invite-secret")
+    assert hash_token(token) != jwt_keyed
+    assert verify_token(token, hash_token(token))
+    assert not verify_token(token, jwt_keyed)